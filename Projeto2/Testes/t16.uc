@@ -0,0 +1,15 @@
+int f (int n);
+int g = 3;
+
+int h (int k) {
+    return f(k) * 2;
+}
+
+int f (int n) {
+    return n + g;
+}
+
+int main(){
+    assert f(1) == 4 && h(1) == 8;
+    return 0;
+}
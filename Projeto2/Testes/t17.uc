@@ -0,0 +1,11 @@
+int f () {
+    char a[] = "hello";
+    return 1;
+}
+
+int main(){
+    char b[] = "hello";
+    char c[] = "help";
+    assert b[1] == c[1] && b[3] == c[3];
+    return 0;
+}
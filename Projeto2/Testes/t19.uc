@@ -0,0 +1,11 @@
+int g = 3;
+
+int f {int n) {
+    return n + g;
+}
+
+int main(){
+    ;
+    assert g == 3;
+    return 0;
+}
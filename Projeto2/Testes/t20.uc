@@ -0,0 +1,6 @@
+int f(int m[2][], int i) {
+    return m[i][1] + m[1][0];
+}
+int main() {
+    return 0;
+}
@@ -0,0 +1,19 @@
+int integer = 2;
+float floaty = 1.5;
+
+int intsum (int int_a, int intb) {
+    return int_a + intb;
+}
+
+int main () {
+    char chart = 'c';
+    char character[] = "char";
+    int forward = 0;
+    int iffy = 1;
+    int returned = intsum(iffy, iffy) + integer;
+    while (forward < 3)
+        forward++;
+    assert returned == 4 && forward == 3 && floaty == 1.5;
+    assert chart == 'c';
+    return 0;
+}
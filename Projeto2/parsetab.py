@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftCOMMArightTIMESEQDIVEQMODEQrightPLUSEQMINUSEQrightEQUALSleftORleftANDleftEQNOTEQleftGREATERTHANGREATERTHANEQLESSTHANLESSTHANEQleftPLUSMINUSleftTIMESDIVIDEMODADDRESS AND ASSERT BREAK CHAR CHAR_CONST COMMA DIVEQ DIVIDE ELSE EQ EQUALS FLOAT FLOAT_CONST FOR GREATERTHAN GREATERTHANEQ ID IF INT INT_CONST LBRACE LBRACKET LESSTHAN LESSTHANEQ LPAREN MINUS MINUSEQ MINUSMINUS MOD MODEQ NOT NOTEQ OR PLUS PLUSEQ PLUSPLUS PRINT RBRACE RBRACKET READ RETURN RPAREN SEMI STRING TIMES TIMESEQ VOID WHILE\n        program : global_declaration_list\n        \n        global_declaration_list : global_declaration\n                                | global_declaration_list global_declaration\n        \n        global_declaration : function_definition\n        \n        global_declaration : declaration\n        \n        function_definition : type_specifier declarator declaration_list_opt compound_statement\n        \n        function_definition : declarator declaration_list_opt compound_statement\n        \n        type_specifier : VOID\n                       | CHAR\n                       | INT\n                       | FLOAT\n        \n        declaration_list_opt : declaration_list\n                             | empty\n        \n        declaration_list : declaration\n                         | declaration_list declaration\n        \n        declarator : direct_declarator\n        \n        declarator : pointer direct_declarator\n        \n        pointer : TIMES\n                | TIMES pointer\n        \n        direct_declarator : identifier\n        \n        direct_declarator : LPAREN declarator RPAREN \n        \n        direct_declarator : direct_declarator LBRACKET constant_expression_opt RBRACKET\n        \n        direct_declarator : direct_declarator LPAREN parameter_list RPAREN\n                          | direct_declarator LPAREN identifier_list_opt RPAREN\n        \n        identifier : ID\n        \n        identifier_list_opt : identifier_list\n                            | empty\n        \n        identifier_list : identifier\n                        | identifier_list COMMA identifier\n        \n        constant_expression_opt : constant_expression\n                                | empty\n        \n        constant_expression : binary_expression\n        \n        binary_expression : cast_expression\n                          | binary_expression TIMES binary_expression\n                          | binary_expression DIVIDE binary_expression\n                          | binary_expression MOD binary_expression\n                          | binary_expression PLUS binary_expression\n                          | binary_expression MINUS binary_expression\n                          | binary_expression LESSTHAN binary_expression\n                          | binary_expression LESSTHANEQ binary_expression\n                          | binary_expression GREATERTHANEQ binary_expression\n                          | binary_expression GREATERTHAN binary_expression\n                          | binary_expression EQ binary_expression\n                          | binary_expression NOTEQ binary_expression\n                          | binary_expression AND binary_expression\n                          | binary_expression OR binary_expression\n        \n        cast_expression : unary_expression\n        \n        cast_expression : LPAREN type_specifier RPAREN cast_expression\n        \n        unary_expression : postfix_expression\n        \n        unary_expression : PLUSPLUS unary_expression\n                         | MINUSMINUS unary_expression\n                         | unary_operator cast_expression\n        \n        postfix_expression : primary_expression\n        \n        postfix_expression : postfix_expression LBRACKET expression RBRACKET\n        \n        postfix_expression : postfix_expression LPAREN RPAREN\n                           | postfix_expression LPAREN argument_expression RPAREN\n        \n        postfix_expression : postfix_expression PLUSPLUS\n                           | postfix_expression MINUSMINUS\n        \n        primary_expression : identifier\n                           | constant\n        \n        primary_expression : LPAREN expression RPAREN\n        \n        constant : INT_CONST\n        \n        constant : CHAR_CONST       \n        \n        constant : FLOAT_CONST\n        \n        constant : STRING\n        \n        expression : assignment_expression\n        \n        expression : expression COMMA assignment_expression\n        \n        argument_expression : assignment_expression\n                            | argument_expression COMMA assignment_expression\n        \n        assignment_expression : binary_expression\n                              | unary_expression assignment_operator assignment_expression\n        \n        assignment_operator : EQUALS\n                            | TIMESEQ\n                            | DIVEQ\n                            | MODEQ\n                            | PLUSEQ\n                            | MINUSEQ\n         \n        unary_operator : AND\n                       | TIMES\n                       | PLUS\n                       | MINUS\n                       | NOT\n                       | ADDRESS\n         parameter_list : parameter_declaration\n                           | parameter_list COMMA parameter_declaration\n         parameter_declaration : type_specifier declarator \n         declaration : decl_body SEMI\n         decl_body  : type_specifier init_declarator_list_opt\n         init_declarator_list_opt : init_declarator_list \n                                     | empty\n         init_declarator_list : init_declarator \n                                 | init_declarator_list COMMA init_declarator\n         init_declarator : declarator\n                            | declarator EQUALS initializer \n         initializer : assignment_expression  initializer : LBRACE initializer_list RBRACE \n                        | LBRACE initializer_list COMMA RBRACE \n         initializer_list : initializer \n                             | initializer_list COMMA initializer\n        \n        compound_statement : LBRACE block_item_list_opt RBRACE\n        \n        block_item_list_opt : block_item_list\n                            | empty\n         block_item_list : block_item \n                            | block_item_list block_item\n        \n        block_item : declaration\n                   | statement\n         statement : expression_statement\n                      | compound_statement\n                      | selection_statement\n                      | interation_statement\n                      | jump_statement\n                      | assert_statement\n                      | print_statement\n                      | read_statement \n         expression_statement : expression_opt SEMI  expression_opt : expression \n                           | empty\n         selection_statement : IF LPAREN expression RPAREN statement                         \n         selection_statement : IF LPAREN expression RPAREN statement ELSE statement                   \n         interation_statement : WHILE LPAREN expression RPAREN statement                           \n         interation_statement : FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN statement                         \n         interation_statement : FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN statement                          \n         jump_statement : BREAK SEMI                     \n         jump_statement : RETURN expression_opt SEMI             \n         assert_statement : ASSERT expression SEMI\n         print_statement : PRINT LPAREN expression_opt RPAREN SEMI\n         read_statement : READ LPAREN argument_expression RPAREN SEMI                         \n        empty :'
+_lr_signature = 'leftCOMMArightTIMESEQDIVEQMODEQrightPLUSEQMINUSEQrightEQUALSleftORleftANDleftEQNOTEQleftGREATERTHANGREATERTHANEQLESSTHANLESSTHANEQleftPLUSMINUSleftTIMESDIVIDEMODADDRESS AND ASSERT BREAK CHAR CHAR_CONST COMMA DIVEQ DIVIDE ELSE EQ EQUALS FLOAT FLOAT_CONST FOR GREATERTHAN GREATERTHANEQ ID IF INT INT_CONST LBRACE LBRACKET LESSTHAN LESSTHANEQ LPAREN MINUS MINUSEQ MINUSMINUS MOD MODEQ NOT NOTEQ OR PLUS PLUSEQ PLUSPLUS PRINT RBRACE RBRACKET READ RETURN RPAREN SEMI STRING TIMES TIMESEQ VOID WHILE\n        program : global_declaration_list\n        \n        global_declaration_list : global_declaration\n                                | global_declaration_list global_declaration\n        \n        global_declaration : function_definition\n        \n        global_declaration : declaration\n        \n        global_declaration : error SEMI\n                           | error brace_group\n        \n        global_declaration : resync declaration\n                           | resync type_specifier declarator declaration_list_opt compound_statement\n        \n        resync : error\n        \n        brace_group : LBRACE skipped_tokens RBRACE\n        \n        skipped_tokens : empty\n                       | skipped_tokens skipped_token\n                       | skipped_tokens brace_group\n        \n        skipped_token : ASSERT\n                      | BREAK\n                      | CHAR\n                      | ELSE\n                      | FLOAT\n                      | FOR\n                      | IF\n                      | INT\n                      | PRINT\n                      | READ\n                      | RETURN\n                      | VOID\n                      | WHILE\n                      | ID\n                      | INT_CONST\n                      | FLOAT_CONST\n                      | STRING\n                      | CHAR_CONST\n                      | LESSTHAN\n                      | LESSTHANEQ\n                      | GREATERTHAN\n                      | GREATERTHANEQ\n                      | NOTEQ\n                      | PLUSEQ\n                      | MINUSEQ\n                      | TIMESEQ\n                      | DIVEQ\n                      | MODEQ\n                      | PLUSPLUS\n                      | MINUSMINUS\n                      | PLUS\n                      | MINUS\n                      | TIMES\n                      | DIVIDE\n                      | MOD\n                      | EQUALS\n                      | EQ\n                      | SEMI\n                      | COMMA\n                      | ADDRESS\n                      | AND\n                      | OR\n                      | NOT\n                      | LPAREN\n                      | RPAREN\n                      | LBRACKET\n                      | RBRACKET\n        \n        function_definition : type_specifier declarator declaration_list_opt compound_statement\n        \n        function_definition : declarator declaration_list_opt compound_statement\n        \n        type_specifier : VOID\n                       | CHAR\n                       | INT\n                       | FLOAT\n        \n        declaration_list_opt : declaration_list\n                             | empty\n        \n        declaration_list : declaration\n                         | declaration_list declaration\n        \n        declarator : direct_declarator\n        \n        declarator : pointer direct_declarator\n        \n        pointer : TIMES\n                | TIMES pointer\n        \n        direct_declarator : identifier\n        \n        direct_declarator : LPAREN declarator RPAREN \n        \n        direct_declarator : direct_declarator LBRACKET constant_expression_opt RBRACKET\n        \n        direct_declarator : direct_declarator LPAREN parameter_list RPAREN\n                          | direct_declarator LPAREN identifier_list_opt RPAREN\n        \n        identifier : ID\n        \n        identifier_list_opt : identifier_list\n                            | empty\n        \n        identifier_list : identifier\n                        | identifier_list COMMA identifier\n        \n        constant_expression_opt : constant_expression\n                                | empty\n        \n        constant_expression : binary_expression\n        \n        binary_expression : cast_expression\n                          | binary_expression TIMES binary_expression\n                          | binary_expression DIVIDE binary_expression\n                          | binary_expression MOD binary_expression\n                          | binary_expression PLUS binary_expression\n                          | binary_expression MINUS binary_expression\n                          | binary_expression LESSTHAN binary_expression\n                          | binary_expression LESSTHANEQ binary_expression\n                          | binary_expression GREATERTHANEQ binary_expression\n                          | binary_expression GREATERTHAN binary_expression\n                          | binary_expression EQ binary_expression\n                          | binary_expression NOTEQ binary_expression\n                          | binary_expression AND binary_expression\n                          | binary_expression OR binary_expression\n        \n        cast_expression : unary_expression\n        \n        cast_expression : LPAREN type_specifier RPAREN cast_expression\n        \n        unary_expression : postfix_expression\n        \n        unary_expression : PLUSPLUS unary_expression\n                         | MINUSMINUS unary_expression\n                         | unary_operator cast_expression\n        \n        postfix_expression : primary_expression\n        \n        postfix_expression : postfix_expression LBRACKET expression RBRACKET\n        \n        postfix_expression : postfix_expression LPAREN RPAREN\n                           | postfix_expression LPAREN argument_expression RPAREN\n        \n        postfix_expression : postfix_expression PLUSPLUS\n                           | postfix_expression MINUSMINUS\n        \n        primary_expression : identifier\n                           | constant\n        \n        primary_expression : LPAREN expression RPAREN\n        \n        constant : INT_CONST\n        \n        constant : CHAR_CONST       \n        \n        constant : FLOAT_CONST\n        \n        constant : STRING\n        \n        expression : assignment_expression\n        \n        expression : expression COMMA assignment_expression\n        \n        argument_expression : assignment_expression\n                            | argument_expression COMMA assignment_expression\n        \n        assignment_expression : binary_expression\n                              | unary_expression assignment_operator assignment_expression\n        \n        assignment_operator : EQUALS\n                            | TIMESEQ\n                            | DIVEQ\n                            | MODEQ\n                            | PLUSEQ\n                            | MINUSEQ\n         \n        unary_operator : AND\n                       | TIMES\n                       | PLUS\n                       | MINUS\n                       | NOT\n                       | ADDRESS\n         parameter_list : parameter_declaration\n                           | parameter_list COMMA parameter_declaration\n         parameter_declaration : type_specifier declarator \n         declaration : decl_body SEMI\n         decl_body  : type_specifier init_declarator_list_opt\n         init_declarator_list_opt : init_declarator_list \n                                     | empty\n         init_declarator_list : init_declarator \n                                 | init_declarator_list COMMA init_declarator\n         init_declarator : declarator\n                            | declarator EQUALS initializer \n         initializer : assignment_expression  initializer : LBRACE initializer_list RBRACE \n                        | LBRACE initializer_list COMMA RBRACE \n         initializer : LBRACE error RBRACE\n                        | LBRACE initializer_list error RBRACE\n         initializer_list : initializer \n                             | initializer_list COMMA initializer\n        \n        compound_statement : LBRACE block_item_list_opt RBRACE\n        \n        compound_statement : LBRACE error RBRACE\n                           | LBRACE block_item_list error RBRACE\n        \n        block_item_list_opt : block_item_list\n                            | empty\n         block_item_list : block_item \n                            | block_item_list block_item\n        \n        block_item : declaration\n                   | statement\n        \n        block_item : error SEMI\n                   | error brace_group\n        \n        block_item : resync declaration\n         statement : expression_statement\n                      | compound_statement\n                      | selection_statement\n                      | interation_statement\n                      | jump_statement\n                      | assert_statement\n                      | print_statement\n                      | read_statement \n         expression_statement : expression_opt SEMI  expression_opt : expression \n                           | empty\n         selection_statement : IF LPAREN expression RPAREN statement                         \n         selection_statement : IF LPAREN expression RPAREN statement ELSE statement                   \n         interation_statement : WHILE LPAREN expression RPAREN statement                           \n         interation_statement : FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN statement                         \n         interation_statement : FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN statement                          \n         jump_statement : BREAK SEMI                     \n         jump_statement : RETURN expression_opt SEMI             \n         assert_statement : ASSERT expression SEMI\n         print_statement : PRINT LPAREN expression_opt RPAREN SEMI\n         read_statement : READ LPAREN argument_expression RPAREN SEMI                         \n        empty :'
     
-_lr_action_items = {'VOID':([0,2,3,4,5,7,13,15,18,19,20,26,28,30,32,33,39,40,41,53,74,75,83,85,86,87,88,89,90,91,92,93,94,95,107,131,132,133,145,146,148,152,153,187,188,204,205,208,209,213,217,218,],[9,9,-2,-4,-5,9,-16,-20,-25,-3,9,9,-14,-87,9,-17,-7,9,-15,9,-21,-6,9,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-22,-23,9,-24,-100,-104,-115,9,-123,-124,-125,-118,-120,-126,-127,-119,-122,-121,]),'CHAR':([0,2,3,4,5,7,13,15,18,19,20,26,28,30,32,33,39,40,41,53,74,75,83,85,86,87,88,89,90,91,92,93,94,95,107,131,132,133,145,146,148,152,153,187,188,204,205,208,209,213,217,218,],[10,10,-2,-4,-5,10,-16,-20,-25,-3,10,10,-14,-87,10,-17,-7,10,-15,10,-21,-6,10,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-22,-23,10,-24,-100,-104,-115,10,-123,-124,-125,-118,-120,-126,-127,-119,-122,-121,]),'INT':([0,2,3,4,5,7,13,15,18,19,20,26,28,30,32,33,39,40,41,53,74,75,83,85,86,87,88,89,90,91,92,93,94,95,107,131,132,133,145,146,148,152,153,187,188,204,205,208,209,213,217,218,],[11,11,-2,-4,-5,11,-16,-20,-25,-3,11,11,-14,-87,11,-17,-7,11,-15,11,-21,-6,11,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-22,-23,11,-24,-100,-104,-115,11,-123,-124,-125,-118,-120,-126,-127,-119,-122,-121,]),'FLOAT':([0,2,3,4,5,7,13,15,18,19,20,26,28,30,32,33,39,40,41,53,74,75,83,85,86,87,88,89,90,91,92,93,94,95,107,131,132,133,145,146,148,152,153,187,188,204,205,208,209,213,217,218,],[12,12,-2,-4,-5,12,-16,-20,-25,-3,12,12,-14,-87,12,-17,-7,12,-15,12,-21,-6,12,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-22,-23,12,-24,-100,-104,-115,12,-123,-124,-125,-118,-120,-126,-127,-119,-122,-121,]),'LPAREN':([0,2,3,4,5,6,9,10,11,12,13,14,15,16,17,18,19,29,30,31,33,35,37,38,39,40,48,49,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,72,74,75,78,83,85,86,87,88,89,90,91,92,93,94,95,97,99,100,102,103,104,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,125,126,128,131,133,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,171,172,174,180,186,187,188,192,193,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[16,16,-2,-4,-5,16,-8,-9,-10,-11,32,16,-20,16,-18,-25,-3,16,-87,53,32,-19,53,16,-7,53,-79,-80,-81,-78,53,124,128,128,53,-53,-82,-83,-59,-60,-62,-63,-64,-65,16,-21,-6,53,53,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,149,151,152,53,53,156,157,-22,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-57,-58,53,-23,-24,53,-72,-73,-74,-75,-76,-77,-100,-104,-115,53,53,53,53,-123,53,53,53,-61,-55,53,53,-124,-125,-54,-56,53,53,53,53,-118,-120,53,-126,-127,53,53,-119,53,53,-122,-121,]),'TIMES':([0,2,3,4,5,6,9,10,11,12,16,17,18,19,29,30,31,37,38,39,40,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,72,75,78,79,80,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,125,126,127,128,129,130,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,180,186,187,188,191,192,193,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[17,17,-2,-4,-5,17,-8,-9,-10,-11,17,17,-25,-3,17,-87,48,48,17,-7,48,108,-33,-79,-80,-81,-78,-47,48,-49,48,48,48,-53,-82,-83,-59,-60,-62,-63,-64,-65,17,-6,48,108,-47,48,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-57,-58,-50,48,-51,-52,48,-72,-73,-74,-75,-76,-77,-100,-104,-115,48,48,48,48,-123,48,48,-34,-35,-36,108,108,108,108,108,108,108,108,108,108,48,-61,-55,48,48,-124,-125,-48,-54,-56,48,48,48,48,-118,-120,48,-126,-127,48,48,-119,48,48,-122,-121,]),'ID':([0,2,3,4,5,6,9,10,11,12,14,16,17,19,29,30,31,32,35,37,38,39,40,48,49,50,51,53,55,56,57,59,60,72,75,78,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,134,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,171,180,186,187,188,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[18,18,-2,-4,-5,18,-8,-9,-10,-11,18,18,-18,-3,18,-87,18,18,-19,18,18,-7,18,-79,-80,-81,-78,18,18,18,18,-82,-83,18,-6,18,18,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,-72,-73,-74,-75,-76,-77,-100,-104,-115,18,18,18,18,-123,18,18,18,18,18,-124,-125,18,18,18,18,-118,-120,18,-126,-127,18,18,-119,18,18,-122,-121,]),'$end':([1,2,3,4,5,19,30,39,75,145,],[0,-1,-2,-4,-5,-3,-87,-7,-6,-100,]),'SEMI':([6,8,9,10,11,12,13,15,18,20,21,22,23,24,29,30,33,40,42,47,52,54,58,61,62,63,64,65,66,74,76,77,79,80,81,83,84,85,86,87,88,89,90,91,92,93,94,95,96,98,101,102,106,107,125,126,127,129,130,131,133,145,146,147,148,152,153,154,155,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,179,181,183,185,186,187,188,191,192,193,195,197,198,199,200,201,202,204,205,206,208,209,210,213,215,216,217,218,],[-128,30,-8,-9,-10,-11,-16,-20,-25,-93,-88,-89,-90,-91,-128,-87,-17,-128,-93,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,-21,-94,-95,-70,-47,-92,-128,-117,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,148,-116,153,-128,-66,-22,-57,-58,-50,-51,-52,-23,-24,-100,-104,-117,-115,-128,-123,187,188,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-61,-55,-96,-71,-67,199,-128,-124,-125,-48,-54,-56,-97,-128,-128,-128,207,208,209,-118,-120,211,-126,-127,-128,-119,-128,-128,-122,-121,]),'LBRACE':([7,13,15,18,20,25,26,27,28,30,33,36,37,40,41,74,78,83,85,86,87,88,89,90,91,92,93,94,95,107,131,133,145,146,148,153,180,187,188,197,198,204,205,208,209,210,213,215,216,217,218,],[-128,-16,-20,-25,-128,40,-12,-13,-14,-87,-17,40,78,40,-15,-21,78,40,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-22,-23,-24,-100,-104,-115,-123,78,-124,-125,40,40,-118,-120,-126,-127,40,-119,40,40,-122,-121,]),'RPAREN':([9,10,11,12,13,15,18,32,33,34,47,52,54,58,61,62,63,64,65,66,67,68,69,70,71,73,74,79,80,98,106,107,121,122,124,125,126,127,129,130,131,133,135,147,156,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,175,176,177,178,181,182,183,184,189,190,191,192,193,203,207,211,212,214,],[-8,-9,-10,-11,-16,-20,-25,-128,-17,74,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,131,133,-84,-26,-27,-28,-21,-70,-47,-116,-66,-22,171,172,174,-57,-58,-50,-51,-52,-23,-24,-86,-117,-128,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-61,-55,193,-68,-85,-29,-71,197,-67,198,201,202,-48,-54,-56,-69,-128,-128,215,216,]),'EQUALS':([13,15,18,20,33,42,52,54,58,61,62,63,64,65,66,74,80,107,125,126,127,129,130,131,133,172,174,191,192,193,],[-16,-20,-25,37,-17,37,-47,-49,-53,-59,-60,-62,-63,-64,-65,-21,139,-22,-57,-58,-50,-51,-52,-23,-24,-61,-55,-48,-54,-56,]),'COMMA':([13,15,18,20,22,24,33,42,47,52,54,58,61,62,63,64,65,66,67,69,70,73,74,76,77,79,80,81,98,106,107,122,125,126,127,129,130,131,133,135,136,137,155,158,159,160,161,162,163,164,165,166,167,168,169,170,172,173,174,175,176,177,178,179,181,182,183,184,190,191,192,193,195,196,203,],[-16,-20,-25,-93,38,-91,-17,-93,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,132,-84,134,-28,-21,-94,-95,-70,-47,-92,150,-66,-22,150,-57,-58,-50,-51,-52,-23,-24,-86,180,-98,150,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-61,150,-55,194,-68,-85,-29,-96,-71,150,-67,150,194,-48,-54,-56,-97,-99,-69,]),'LBRACKET':([13,15,18,33,54,58,61,62,63,64,65,66,74,107,125,126,131,133,172,174,192,193,],[31,-20,-25,31,123,-53,-59,-60,-62,-63,-64,-65,-21,-22,-57,-58,-23,-24,-61,-55,-54,-56,]),'PLUSPLUS':([18,30,31,37,40,48,49,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,78,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,125,126,128,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,171,172,174,180,186,187,188,192,193,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[-25,-87,55,55,55,-79,-80,-81,-78,55,125,55,55,55,-53,-82,-83,-59,-60,-62,-63,-64,-65,55,55,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,-57,-58,55,55,-72,-73,-74,-75,-76,-77,-100,-104,-115,55,55,55,55,-123,55,55,55,-61,-55,55,55,-124,-125,-54,-56,55,55,55,55,-118,-120,55,-126,-127,55,55,-119,55,55,-122,-121,]),'MINUSMINUS':([18,30,31,37,40,48,49,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,78,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,125,126,128,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,171,172,174,180,186,187,188,192,193,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[-25,-87,56,56,56,-79,-80,-81,-78,56,126,56,56,56,-53,-82,-83,-59,-60,-62,-63,-64,-65,56,56,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-57,-58,56,56,-72,-73,-74,-75,-76,-77,-100,-104,-115,56,56,56,56,-123,56,56,56,-61,-55,56,56,-124,-125,-54,-56,56,56,56,56,-118,-120,56,-126,-127,56,56,-119,56,56,-122,-121,]),'DIVIDE':([18,46,47,52,54,58,61,62,63,64,65,66,79,80,125,126,127,129,130,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,191,192,193,],[-25,109,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,109,-47,-57,-58,-50,-51,-52,-34,-35,-36,109,109,109,109,109,109,109,109,109,109,-61,-55,-48,-54,-56,]),'MOD':([18,46,47,52,54,58,61,62,63,64,65,66,79,80,125,126,127,129,130,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,191,192,193,],[-25,110,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,110,-47,-57,-58,-50,-51,-52,-34,-35,-36,110,110,110,110,110,110,110,110,110,110,-61,-55,-48,-54,-56,]),'PLUS':([18,30,31,37,40,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,78,79,80,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,125,126,127,128,129,130,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,180,186,187,188,191,192,193,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[-25,-87,49,49,49,111,-33,-79,-80,-81,-78,-47,49,-49,49,49,49,-53,-82,-83,-59,-60,-62,-63,-64,-65,49,111,-47,49,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-57,-58,-50,49,-51,-52,49,-72,-73,-74,-75,-76,-77,-100,-104,-115,49,49,49,49,-123,49,49,-34,-35,-36,-37,-38,111,111,111,111,111,111,111,111,49,-61,-55,49,49,-124,-125,-48,-54,-56,49,49,49,49,-118,-120,49,-126,-127,49,49,-119,49,49,-122,-121,]),'MINUS':([18,30,31,37,40,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,78,79,80,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,125,126,127,128,129,130,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,180,186,187,188,191,192,193,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[-25,-87,50,50,50,112,-33,-79,-80,-81,-78,-47,50,-49,50,50,50,-53,-82,-83,-59,-60,-62,-63,-64,-65,50,112,-47,50,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,-57,-58,-50,50,-51,-52,50,-72,-73,-74,-75,-76,-77,-100,-104,-115,50,50,50,50,-123,50,50,-34,-35,-36,-37,-38,112,112,112,112,112,112,112,112,50,-61,-55,50,50,-124,-125,-48,-54,-56,50,50,50,50,-118,-120,50,-126,-127,50,50,-119,50,50,-122,-121,]),'LESSTHAN':([18,46,47,52,54,58,61,62,63,64,65,66,79,80,125,126,127,129,130,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,191,192,193,],[-25,113,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,113,-47,-57,-58,-50,-51,-52,-34,-35,-36,-37,-38,-39,-40,-41,-42,113,113,113,113,-61,-55,-48,-54,-56,]),'LESSTHANEQ':([18,46,47,52,54,58,61,62,63,64,65,66,79,80,125,126,127,129,130,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,191,192,193,],[-25,114,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,114,-47,-57,-58,-50,-51,-52,-34,-35,-36,-37,-38,-39,-40,-41,-42,114,114,114,114,-61,-55,-48,-54,-56,]),'GREATERTHANEQ':([18,46,47,52,54,58,61,62,63,64,65,66,79,80,125,126,127,129,130,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,191,192,193,],[-25,115,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,115,-47,-57,-58,-50,-51,-52,-34,-35,-36,-37,-38,-39,-40,-41,-42,115,115,115,115,-61,-55,-48,-54,-56,]),'GREATERTHAN':([18,46,47,52,54,58,61,62,63,64,65,66,79,80,125,126,127,129,130,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,191,192,193,],[-25,116,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,116,-47,-57,-58,-50,-51,-52,-34,-35,-36,-37,-38,-39,-40,-41,-42,116,116,116,116,-61,-55,-48,-54,-56,]),'EQ':([18,46,47,52,54,58,61,62,63,64,65,66,79,80,125,126,127,129,130,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,191,192,193,],[-25,117,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,117,-47,-57,-58,-50,-51,-52,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,117,117,-61,-55,-48,-54,-56,]),'NOTEQ':([18,46,47,52,54,58,61,62,63,64,65,66,79,80,125,126,127,129,130,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,191,192,193,],[-25,118,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,118,-47,-57,-58,-50,-51,-52,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,118,118,-61,-55,-48,-54,-56,]),'AND':([18,30,31,37,40,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,78,79,80,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,125,126,127,128,129,130,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,180,186,187,188,191,192,193,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[-25,-87,51,51,51,119,-33,-79,-80,-81,-78,-47,51,-49,51,51,51,-53,-82,-83,-59,-60,-62,-63,-64,-65,51,119,-47,51,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,-57,-58,-50,51,-51,-52,51,-72,-73,-74,-75,-76,-77,-100,-104,-115,51,51,51,51,-123,51,51,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,119,51,-61,-55,51,51,-124,-125,-48,-54,-56,51,51,51,51,-118,-120,51,-126,-127,51,51,-119,51,51,-122,-121,]),'OR':([18,46,47,52,54,58,61,62,63,64,65,66,79,80,125,126,127,129,130,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,191,192,193,],[-25,120,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,120,-47,-57,-58,-50,-51,-52,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-61,-55,-48,-54,-56,]),'RBRACKET':([18,31,43,44,45,46,47,52,54,58,61,62,63,64,65,66,79,80,106,125,126,127,129,130,158,159,160,161,162,163,164,165,166,167,168,169,170,172,173,174,181,183,191,192,193,],[-25,-128,107,-30,-31,-32,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,-70,-47,-66,-57,-58,-50,-51,-52,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-61,192,-55,-71,-67,-48,-54,-56,]),'TIMESEQ':([18,52,54,58,61,62,63,64,65,66,80,125,126,127,129,130,172,174,191,192,193,],[-25,-47,-49,-53,-59,-60,-62,-63,-64,-65,140,-57,-58,-50,-51,-52,-61,-55,-48,-54,-56,]),'DIVEQ':([18,52,54,58,61,62,63,64,65,66,80,125,126,127,129,130,172,174,191,192,193,],[-25,-47,-49,-53,-59,-60,-62,-63,-64,-65,141,-57,-58,-50,-51,-52,-61,-55,-48,-54,-56,]),'MODEQ':([18,52,54,58,61,62,63,64,65,66,80,125,126,127,129,130,172,174,191,192,193,],[-25,-47,-49,-53,-59,-60,-62,-63,-64,-65,142,-57,-58,-50,-51,-52,-61,-55,-48,-54,-56,]),'PLUSEQ':([18,52,54,58,61,62,63,64,65,66,80,125,126,127,129,130,172,174,191,192,193,],[-25,-47,-49,-53,-59,-60,-62,-63,-64,-65,143,-57,-58,-50,-51,-52,-61,-55,-48,-54,-56,]),'MINUSEQ':([18,52,54,58,61,62,63,64,65,66,80,125,126,127,129,130,172,174,191,192,193,],[-25,-47,-49,-53,-59,-60,-62,-63,-64,-65,144,-57,-58,-50,-51,-52,-61,-55,-48,-54,-56,]),'RBRACE':([18,30,40,47,52,54,58,61,62,63,64,65,66,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,125,126,127,129,130,136,137,145,146,148,153,158,159,160,161,162,163,164,165,166,167,168,169,170,172,174,179,180,181,187,188,191,192,193,195,196,204,205,208,209,213,217,218,],[-25,-87,-128,-33,-47,-49,-53,-59,-60,-62,-63,-64,-65,-95,-70,-47,145,-101,-102,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-57,-58,-50,-51,-52,179,-98,-100,-104,-115,-123,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-61,-55,-96,195,-71,-124,-125,-48,-54,-56,-97,-99,-118,-120,-126,-127,-119,-122,-121,]),'IF':([30,40,83,85,86,87,88,89,90,91,92,93,94,95,145,146,148,153,187,188,197,198,204,205,208,209,210,213,215,216,217,218,],[-87,97,97,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-100,-104,-115,-123,-124,-125,97,97,-118,-120,-126,-127,97,-119,97,97,-122,-121,]),'WHILE':([30,40,83,85,86,87,88,89,90,91,92,93,94,95,145,146,148,153,187,188,197,198,204,205,208,209,210,213,215,216,217,218,],[-87,99,99,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-100,-104,-115,-123,-124,-125,99,99,-118,-120,-126,-127,99,-119,99,99,-122,-121,]),'FOR':([30,40,83,85,86,87,88,89,90,91,92,93,94,95,145,146,148,153,187,188,197,198,204,205,208,209,210,213,215,216,217,218,],[-87,100,100,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-100,-104,-115,-123,-124,-125,100,100,-118,-120,-126,-127,100,-119,100,100,-122,-121,]),'BREAK':([30,40,83,85,86,87,88,89,90,91,92,93,94,95,145,146,148,153,187,188,197,198,204,205,208,209,210,213,215,216,217,218,],[-87,101,101,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-100,-104,-115,-123,-124,-125,101,101,-118,-120,-126,-127,101,-119,101,101,-122,-121,]),'RETURN':([30,40,83,85,86,87,88,89,90,91,92,93,94,95,145,146,148,153,187,188,197,198,204,205,208,209,210,213,215,216,217,218,],[-87,102,102,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-100,-104,-115,-123,-124,-125,102,102,-118,-120,-126,-127,102,-119,102,102,-122,-121,]),'ASSERT':([30,40,83,85,86,87,88,89,90,91,92,93,94,95,145,146,148,153,187,188,197,198,204,205,208,209,210,213,215,216,217,218,],[-87,103,103,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-100,-104,-115,-123,-124,-125,103,103,-118,-120,-126,-127,103,-119,103,103,-122,-121,]),'PRINT':([30,40,83,85,86,87,88,89,90,91,92,93,94,95,145,146,148,153,187,188,197,198,204,205,208,209,210,213,215,216,217,218,],[-87,104,104,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-100,-104,-115,-123,-124,-125,104,104,-118,-120,-126,-127,104,-119,104,104,-122,-121,]),'READ':([30,40,83,85,86,87,88,89,90,91,92,93,94,95,145,146,148,153,187,188,197,198,204,205,208,209,210,213,215,216,217,218,],[-87,105,105,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-100,-104,-115,-123,-124,-125,105,105,-118,-120,-126,-127,105,-119,105,105,-122,-121,]),'NOT':([30,31,37,40,48,49,50,51,53,55,56,57,59,60,78,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,171,180,186,187,188,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[-87,59,59,59,-79,-80,-81,-78,59,59,59,59,-82,-83,59,59,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-72,-73,-74,-75,-76,-77,-100,-104,-115,59,59,59,59,-123,59,59,59,59,59,-124,-125,59,59,59,59,-118,-120,59,-126,-127,59,59,-119,59,59,-122,-121,]),'ADDRESS':([30,31,37,40,48,49,50,51,53,55,56,57,59,60,78,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,171,180,186,187,188,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[-87,60,60,60,-79,-80,-81,-78,60,60,60,60,-82,-83,60,60,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-72,-73,-74,-75,-76,-77,-100,-104,-115,60,60,60,60,-123,60,60,60,60,60,-124,-125,60,60,60,60,-118,-120,60,-126,-127,60,60,-119,60,60,-122,-121,]),'INT_CONST':([30,31,37,40,48,49,50,51,53,55,56,57,59,60,78,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,171,180,186,187,188,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[-87,63,63,63,-79,-80,-81,-78,63,63,63,63,-82,-83,63,63,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-72,-73,-74,-75,-76,-77,-100,-104,-115,63,63,63,63,-123,63,63,63,63,63,-124,-125,63,63,63,63,-118,-120,63,-126,-127,63,63,-119,63,63,-122,-121,]),'CHAR_CONST':([30,31,37,40,48,49,50,51,53,55,56,57,59,60,78,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,171,180,186,187,188,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[-87,64,64,64,-79,-80,-81,-78,64,64,64,64,-82,-83,64,64,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-72,-73,-74,-75,-76,-77,-100,-104,-115,64,64,64,64,-123,64,64,64,64,64,-124,-125,64,64,64,64,-118,-120,64,-126,-127,64,64,-119,64,64,-122,-121,]),'FLOAT_CONST':([30,31,37,40,48,49,50,51,53,55,56,57,59,60,78,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,171,180,186,187,188,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[-87,65,65,65,-79,-80,-81,-78,65,65,65,65,-82,-83,65,65,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-72,-73,-74,-75,-76,-77,-100,-104,-115,65,65,65,65,-123,65,65,65,65,65,-124,-125,65,65,65,65,-118,-120,65,-126,-127,65,65,-119,65,65,-122,-121,]),'STRING':([30,31,37,40,48,49,50,51,53,55,56,57,59,60,78,83,85,86,87,88,89,90,91,92,93,94,95,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,156,157,171,180,186,187,188,194,197,198,199,204,205,207,208,209,210,211,213,215,216,217,218,],[-87,66,66,66,-79,-80,-81,-78,66,66,66,66,-82,-83,66,66,-103,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-72,-73,-74,-75,-76,-77,-100,-104,-115,66,66,66,66,-123,66,66,66,66,66,-124,-125,66,66,66,66,-118,-120,66,-126,-127,66,66,-119,66,66,-122,-121,]),'ELSE':([88,89,90,91,92,93,94,95,145,148,153,187,188,204,205,208,209,213,217,218,],[-107,-108,-109,-110,-111,-112,-113,-114,-100,-115,-123,-124,-125,210,-120,-126,-127,-119,-122,-121,]),}
+_lr_action_items = {'error':([0,2,3,4,5,20,21,22,23,25,37,49,50,57,62,64,68,71,72,73,74,75,76,85,136,138,139,140,141,145,147,148,149,151,152,153,154,155,156,157,158,188,189,190,192,193,199,200,202,210,211,212,213,215,217,218,223,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,249,252,253,254,260,261,264,265,266,268,269,270,278,279,282,283,287,291,292,],[6,6,-2,-4,-5,-81,-3,-6,-7,-8,-143,-63,144,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-62,-151,201,-126,-103,214,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,-113,-114,-106,-107,-108,-9,251,-156,-158,-159,-167,-168,-164,-169,-178,-186,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-117,-111,-152,-154,-127,-160,-187,-188,-104,-110,-112,-153,-157,-155,-181,-183,-189,-190,-182,-185,-184,]),'VOID':([0,2,3,4,5,6,7,9,15,17,20,21,22,23,24,25,27,33,35,37,39,40,43,44,45,49,50,51,63,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,144,145,147,148,149,150,151,152,153,154,155,156,157,158,170,194,195,196,199,210,211,212,213,214,215,217,218,222,223,254,260,261,278,279,282,283,287,291,292,],[11,11,-2,-4,-5,-10,11,11,-72,-76,-81,-3,-6,-7,-191,-8,11,11,-70,-143,11,-73,99,-12,11,-63,11,-71,11,-77,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-10,11,-163,-165,-166,11,-170,-171,-172,-173,-174,-175,-176,-177,-78,-79,11,-80,-9,-158,-159,-167,-168,-10,-164,-169,-178,11,-186,-160,-187,-188,-181,-183,-189,-190,-182,-185,-184,]),'CHAR':([0,2,3,4,5,6,7,9,15,17,20,21,22,23,24,25,27,33,35,37,39,40,43,44,45,49,50,51,63,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,144,145,147,148,149,150,151,152,153,154,155,156,157,158,170,194,195,196,199,210,211,212,213,214,215,217,218,222,223,254,260,261,278,279,282,283,287,291,292,],[12,12,-2,-4,-5,-10,12,12,-72,-76,-81,-3,-6,-7,-191,-8,12,12,-70,-143,12,-73,90,-12,12,-63,12,-71,12,-77,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-10,12,-163,-165,-166,12,-170,-171,-172,-173,-174,-175,-176,-177,-78,-79,12,-80,-9,-158,-159,-167,-168,-10,-164,-169,-178,12,-186,-160,-187,-188,-181,-183,-189,-190,-182,-185,-184,]),'INT':([0,2,3,4,5,6,7,9,15,17,20,21,22,23,24,25,27,33,35,37,39,40,43,44,45,49,50,51,63,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,144,145,147,148,149,150,151,152,153,154,155,156,157,158,170,194,195,196,199,210,211,212,213,214,215,217,218,222,223,254,260,261,278,279,282,283,287,291,292,],[13,13,-2,-4,-5,-10,13,13,-72,-76,-81,-3,-6,-7,-191,-8,13,13,-70,-143,13,-73,95,-12,13,-63,13,-71,13,-77,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-10,13,-163,-165,-166,13,-170,-171,-172,-173,-174,-175,-176,-177,-78,-79,13,-80,-9,-158,-159,-167,-168,-10,-164,-169,-178,13,-186,-160,-187,-188,-181,-183,-189,-190,-182,-185,-184,]),'FLOAT':([0,2,3,4,5,6,7,9,15,17,20,21,22,23,24,25,27,33,35,37,39,40,43,44,45,49,50,51,63,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,144,145,147,148,149,150,151,152,153,154,155,156,157,158,170,194,195,196,199,210,211,212,213,214,215,217,218,222,223,254,260,261,278,279,282,283,287,291,292,],[14,14,-2,-4,-5,-10,14,14,-72,-76,-81,-3,-6,-7,-191,-8,14,14,-70,-143,14,-73,92,-12,14,-63,14,-71,14,-77,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-10,14,-163,-165,-166,14,-170,-171,-172,-173,-174,-175,-176,-177,-78,-79,14,-80,-9,-158,-159,-167,-168,-10,-164,-169,-178,14,-186,-160,-187,-188,-181,-183,-189,-190,-182,-185,-184,]),'LPAREN':([0,2,3,4,5,8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,36,37,38,40,42,43,44,47,48,49,50,58,59,60,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,82,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,139,145,147,148,149,151,152,153,154,155,156,157,158,160,162,163,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,188,189,191,194,196,199,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,241,242,244,250,254,259,260,261,265,266,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[18,18,-2,-4,-5,18,-64,-65,-66,-67,39,18,-76,18,-74,-81,-3,-6,-7,-191,-8,18,18,-143,63,39,-75,131,-12,63,18,-63,63,-135,-136,-137,-134,63,187,191,191,63,-109,-138,-139,-115,-116,-118,-119,-120,-121,18,-77,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,63,63,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,219,221,222,63,63,226,227,-78,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-113,-114,63,-79,-80,-9,63,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,63,63,63,63,-186,63,63,63,-117,-111,63,-160,63,-187,-188,-110,-112,63,63,63,63,-181,-183,63,-189,-190,63,63,-182,63,63,-185,-184,]),'TIMES':([0,2,3,4,5,8,11,12,13,14,18,19,20,21,22,23,24,25,26,36,37,38,43,44,47,48,49,50,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,82,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,139,140,141,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,188,189,190,191,192,193,199,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,244,250,254,259,260,261,264,265,266,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[19,19,-2,-4,-5,19,-64,-65,-66,-67,19,19,-81,-3,-6,-7,-191,-8,19,19,-143,58,120,-12,58,19,-63,58,171,-89,-135,-136,-137,-134,-103,58,-105,58,58,58,-109,-138,-139,-115,-116,-118,-119,-120,-121,19,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,58,171,-103,58,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-113,-114,-106,58,-107,-108,-9,58,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,58,58,58,58,-186,58,58,-90,-91,-92,171,171,171,171,171,171,171,171,171,171,58,-117,-111,58,-160,58,-187,-188,-104,-110,-112,58,58,58,58,-181,-183,58,-189,-190,58,58,-182,58,58,-185,-184,]),'ID':([0,2,3,4,5,8,11,12,13,14,16,18,19,21,22,23,24,25,26,36,37,38,39,42,43,44,47,48,49,50,58,59,60,61,63,65,66,67,69,70,82,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,139,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,197,199,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,241,250,254,259,260,261,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[20,20,-2,-4,-5,20,-64,-65,-66,-67,20,20,-74,-3,-6,-7,-191,-8,20,20,-143,20,20,-75,101,-12,20,20,-63,20,-135,-136,-137,-134,20,20,20,20,-138,-139,20,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,20,20,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-9,20,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,20,20,20,20,-186,20,20,20,20,-160,20,-187,-188,20,20,20,20,-181,-183,20,-189,-190,20,20,-182,20,20,-185,-184,]),'$end':([1,2,3,4,5,21,22,23,25,37,49,85,136,199,210,211,254,],[0,-1,-2,-4,-5,-3,-6,-7,-8,-143,-63,-11,-62,-9,-158,-159,-160,]),'SEMI':([6,8,10,11,12,13,14,15,17,20,24,26,27,28,29,30,31,36,37,40,43,44,45,50,52,57,62,64,68,71,72,73,74,75,76,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,137,138,140,141,142,144,145,146,147,148,149,151,152,153,154,155,156,157,158,159,161,164,165,169,170,188,189,190,192,193,194,196,210,211,212,213,214,215,216,217,218,222,223,224,225,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,249,252,253,254,256,258,259,260,261,264,265,266,268,270,271,272,273,274,275,276,278,279,280,282,283,284,287,289,290,291,292,],[22,-191,37,-64,-65,-66,-67,-72,-76,-81,-191,-191,-149,-144,-145,-146,-147,-191,-143,-73,125,-12,-149,-191,-149,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-77,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-150,-151,-126,-103,-148,212,-191,-180,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,218,-179,223,-191,-122,-78,-113,-114,-106,-107,-108,-79,-80,-158,-159,-167,-168,212,-164,-180,-169,-178,-191,-186,260,261,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-117,-111,-152,-154,-127,-160,-123,273,-191,-187,-188,-104,-110,-112,-153,-155,-191,-191,-191,281,282,283,-181,-183,285,-189,-190,-191,-182,-191,-191,-185,-184,]),'LBRACE':([6,9,15,17,20,24,27,32,33,34,35,37,40,43,44,45,46,47,50,51,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,139,144,145,147,148,149,151,152,153,154,155,156,157,158,170,194,196,210,211,212,213,214,215,217,218,223,250,254,260,261,271,272,278,279,282,283,284,287,289,290,291,292,],[24,-191,-72,-76,-81,-191,-191,50,-68,-69,-70,-143,-73,24,-12,-191,50,139,50,-71,-77,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,50,139,24,50,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,-78,-79,-80,-158,-159,-167,-168,24,-164,-169,-178,-186,139,-160,-187,-188,50,50,-181,-183,-189,-190,50,-182,50,50,-185,-184,]),'RPAREN':([11,12,13,14,15,17,20,24,39,40,41,43,44,57,62,64,68,71,72,73,74,75,76,77,78,79,80,81,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,161,169,170,184,185,187,188,189,190,192,193,194,196,198,216,226,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,245,246,247,248,253,255,256,257,262,263,264,265,266,277,281,285,286,288,],[-64,-65,-66,-67,-72,-76,-81,-191,-191,-73,84,132,-12,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,194,196,-140,-82,-83,-84,-77,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-126,-103,-179,-122,-78,241,242,244,-113,-114,-106,-107,-108,-79,-80,-142,-180,-191,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-117,-111,266,-124,-141,-85,-127,271,-123,272,275,276,-104,-110,-112,-125,-191,-191,289,290,]),'EQUALS':([15,17,20,24,27,40,43,44,45,52,62,64,68,71,72,73,74,75,76,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,141,170,188,189,190,192,193,194,196,242,244,264,265,266,],[-72,-76,-81,-191,47,-73,123,-12,47,47,-103,-105,-109,-115,-116,-118,-119,-120,-121,-77,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,204,-78,-113,-114,-106,-107,-108,-79,-80,-117,-111,-104,-110,-112,]),'COMMA':([15,17,20,24,27,29,31,40,43,44,45,52,57,62,64,68,71,72,73,74,75,76,77,79,80,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,137,138,140,141,142,161,169,170,185,188,189,190,192,193,194,196,198,200,202,225,228,229,230,231,232,233,234,235,236,237,238,239,240,242,243,244,245,246,247,248,249,252,253,255,256,257,263,264,265,266,268,269,270,277,],[-72,-76,-81,-191,-149,48,-147,-73,126,-12,-149,-149,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,195,-140,197,-84,-77,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-150,-151,-126,-103,-148,220,-122,-78,220,-113,-114,-106,-107,-108,-79,-80,-142,250,-156,220,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-117,220,-111,267,-124,-141,-85,-152,-154,-127,220,-123,220,267,-104,-110,-112,-153,-157,-155,-125,]),'LBRACKET':([15,17,20,24,40,43,44,64,68,71,72,73,74,75,76,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,170,188,189,194,196,242,244,265,266,],[38,-76,-81,-191,38,133,-12,186,-109,-115,-116,-118,-119,-120,-121,-77,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-78,-113,-114,-79,-80,-117,-111,-110,-112,]),'PLUSPLUS':([20,24,37,38,43,44,47,50,58,59,60,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,188,189,191,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,241,242,244,250,254,259,260,261,265,266,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[-81,-191,-143,65,116,-12,65,65,-135,-136,-137,-134,65,188,65,65,65,-109,-138,-139,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,65,65,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-113,-114,65,65,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,65,65,65,65,-186,65,65,65,-117,-111,65,-160,65,-187,-188,-110,-112,65,65,65,65,-181,-183,65,-189,-190,65,65,-182,65,65,-185,-184,]),'MINUSMINUS':([20,24,37,38,43,44,47,50,58,59,60,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,188,189,191,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,241,242,244,250,254,259,260,261,265,266,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[-81,-191,-143,66,117,-12,66,66,-135,-136,-137,-134,66,189,66,66,66,-109,-138,-139,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,66,66,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-113,-114,66,66,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,66,66,66,66,-186,66,66,66,-117,-111,66,-160,66,-187,-188,-110,-112,66,66,66,66,-181,-183,66,-189,-190,66,66,-182,66,66,-185,-184,]),'DIVIDE':([20,24,43,44,56,57,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,188,189,190,192,193,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,264,265,266,],[-81,-191,121,-12,172,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,172,-103,-113,-114,-106,-107,-108,-90,-91,-92,172,172,172,172,172,172,172,172,172,172,-117,-111,-104,-110,-112,]),'MOD':([20,24,43,44,56,57,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,188,189,190,192,193,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,264,265,266,],[-81,-191,122,-12,173,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,173,-103,-113,-114,-106,-107,-108,-90,-91,-92,173,173,173,173,173,173,173,173,173,173,-117,-111,-104,-110,-112,]),'PLUS':([20,24,37,38,43,44,47,50,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,140,141,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,188,189,190,191,192,193,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,244,250,254,259,260,261,264,265,266,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[-81,-191,-143,59,118,-12,59,59,174,-89,-135,-136,-137,-134,-103,59,-105,59,59,59,-109,-138,-139,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,59,174,-103,59,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-113,-114,-106,59,-107,-108,59,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,59,59,59,59,-186,59,59,-90,-91,-92,-93,-94,174,174,174,174,174,174,174,174,59,-117,-111,59,-160,59,-187,-188,-104,-110,-112,59,59,59,59,-181,-183,59,-189,-190,59,59,-182,59,59,-185,-184,]),'MINUS':([20,24,37,38,43,44,47,50,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,140,141,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,188,189,190,191,192,193,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,244,250,254,259,260,261,264,265,266,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[-81,-191,-143,60,119,-12,60,60,175,-89,-135,-136,-137,-134,-103,60,-105,60,60,60,-109,-138,-139,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,60,175,-103,60,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-113,-114,-106,60,-107,-108,60,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,60,60,60,60,-186,60,60,-90,-91,-92,-93,-94,175,175,175,175,175,175,175,175,60,-117,-111,60,-160,60,-187,-188,-104,-110,-112,60,60,60,60,-181,-183,60,-189,-190,60,60,-182,60,60,-185,-184,]),'LESSTHAN':([20,24,43,44,56,57,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,188,189,190,192,193,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,264,265,266,],[-81,-191,106,-12,176,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,176,-103,-113,-114,-106,-107,-108,-90,-91,-92,-93,-94,-95,-96,-97,-98,176,176,176,176,-117,-111,-104,-110,-112,]),'LESSTHANEQ':([20,24,43,44,56,57,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,188,189,190,192,193,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,264,265,266,],[-81,-191,107,-12,177,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,177,-103,-113,-114,-106,-107,-108,-90,-91,-92,-93,-94,-95,-96,-97,-98,177,177,177,177,-117,-111,-104,-110,-112,]),'GREATERTHANEQ':([20,24,43,44,56,57,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,188,189,190,192,193,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,264,265,266,],[-81,-191,109,-12,178,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,178,-103,-113,-114,-106,-107,-108,-90,-91,-92,-93,-94,-95,-96,-97,-98,178,178,178,178,-117,-111,-104,-110,-112,]),'GREATERTHAN':([20,24,43,44,56,57,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,188,189,190,192,193,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,264,265,266,],[-81,-191,108,-12,179,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,179,-103,-113,-114,-106,-107,-108,-90,-91,-92,-93,-94,-95,-96,-97,-98,179,179,179,179,-117,-111,-104,-110,-112,]),'EQ':([20,24,43,44,56,57,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,188,189,190,192,193,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,264,265,266,],[-81,-191,124,-12,180,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,180,-103,-113,-114,-106,-107,-108,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,180,180,-117,-111,-104,-110,-112,]),'NOTEQ':([20,24,43,44,56,57,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,188,189,190,192,193,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,264,265,266,],[-81,-191,110,-12,181,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,181,-103,-113,-114,-106,-107,-108,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,181,181,-117,-111,-104,-110,-112,]),'AND':([20,24,37,38,43,44,47,50,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,140,141,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,188,189,190,191,192,193,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,244,250,254,259,260,261,264,265,266,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[-81,-191,-143,61,128,-12,61,61,182,-89,-135,-136,-137,-134,-103,61,-105,61,61,61,-109,-138,-139,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,61,182,-103,61,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-113,-114,-106,61,-107,-108,61,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,61,61,61,61,-186,61,61,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,182,61,-117,-111,61,-160,61,-187,-188,-104,-110,-112,61,61,61,61,-181,-183,61,-189,-190,61,61,-182,61,61,-185,-184,]),'OR':([20,24,43,44,56,57,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,188,189,190,192,193,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,264,265,266,],[-81,-191,129,-12,183,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,183,-103,-113,-114,-106,-107,-108,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-117,-111,-104,-110,-112,]),'RBRACKET':([20,24,38,43,44,53,54,55,56,57,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,140,141,169,188,189,190,192,193,228,229,230,231,232,233,234,235,236,237,238,239,240,242,243,244,253,256,264,265,266,],[-81,-191,-191,134,-12,170,-86,-87,-88,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-126,-103,-122,-113,-114,-106,-107,-108,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-117,265,-111,-127,-123,-104,-110,-112,]),'TIMESEQ':([20,24,43,44,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,141,188,189,190,192,193,242,244,264,265,266,],[-81,-191,113,-12,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,205,-113,-114,-106,-107,-108,-117,-111,-104,-110,-112,]),'DIVEQ':([20,24,43,44,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,141,188,189,190,192,193,242,244,264,265,266,],[-81,-191,114,-12,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,206,-113,-114,-106,-107,-108,-117,-111,-104,-110,-112,]),'MODEQ':([20,24,43,44,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,141,188,189,190,192,193,242,244,264,265,266,],[-81,-191,115,-12,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,207,-113,-114,-106,-107,-108,-117,-111,-104,-110,-112,]),'PLUSEQ':([20,24,43,44,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,141,188,189,190,192,193,242,244,264,265,266,],[-81,-191,111,-12,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,208,-113,-114,-106,-107,-108,-117,-111,-104,-110,-112,]),'MINUSEQ':([20,24,43,44,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,141,188,189,190,192,193,242,244,264,265,266,],[-81,-191,112,-12,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,209,-113,-114,-106,-107,-108,-117,-111,-104,-110,-112,]),'RBRACE':([20,24,37,43,44,50,57,62,64,68,71,72,73,74,75,76,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,138,140,141,143,144,145,146,147,148,149,151,152,153,154,155,156,157,158,188,189,190,192,193,200,201,202,210,211,212,213,214,215,217,218,223,228,229,230,231,232,233,234,235,236,237,238,239,240,242,244,249,250,251,252,253,254,260,261,264,265,266,268,269,270,278,279,282,283,287,291,292,],[-81,-191,-143,85,-12,-191,-89,-103,-105,-109,-115,-116,-118,-119,-120,-121,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-151,-126,-103,210,211,-161,-162,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,-113,-114,-106,-107,-108,249,252,-156,-158,-159,-167,-168,254,-164,-169,-178,-186,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-117,-111,-152,268,270,-154,-127,-160,-187,-188,-104,-110,-112,-153,-157,-155,-181,-183,-189,-190,-182,-185,-184,]),'ASSERT':([24,37,43,44,50,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,145,147,148,149,151,152,153,154,155,156,157,158,210,211,212,213,215,217,218,223,254,260,261,271,272,278,279,282,283,284,287,289,290,291,292,],[-191,-143,88,-12,166,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,166,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,-158,-159,-167,-168,-164,-169,-178,-186,-160,-187,-188,166,166,-181,-183,-189,-190,166,-182,166,166,-185,-184,]),'BREAK':([24,37,43,44,50,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,145,147,148,149,151,152,153,154,155,156,157,158,210,211,212,213,215,217,218,223,254,260,261,271,272,278,279,282,283,284,287,289,290,291,292,],[-191,-143,89,-12,164,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,164,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,-158,-159,-167,-168,-164,-169,-178,-186,-160,-187,-188,164,164,-181,-183,-189,-190,164,-182,164,164,-185,-184,]),'ELSE':([24,43,44,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,151,152,153,154,155,156,157,158,210,211,218,223,254,260,261,278,279,282,283,287,291,292,],[-191,91,-12,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-170,-171,-172,-173,-174,-175,-176,-177,-158,-159,-178,-186,-160,-187,-188,284,-183,-189,-190,-182,-185,-184,]),'FOR':([24,37,43,44,50,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,145,147,148,149,151,152,153,154,155,156,157,158,210,211,212,213,215,217,218,223,254,260,261,271,272,278,279,282,283,284,287,289,290,291,292,],[-191,-143,93,-12,163,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,163,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,-158,-159,-167,-168,-164,-169,-178,-186,-160,-187,-188,163,163,-181,-183,-189,-190,163,-182,163,163,-185,-184,]),'IF':([24,37,43,44,50,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,145,147,148,149,151,152,153,154,155,156,157,158,210,211,212,213,215,217,218,223,254,260,261,271,272,278,279,282,283,284,287,289,290,291,292,],[-191,-143,94,-12,160,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,160,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,-158,-159,-167,-168,-164,-169,-178,-186,-160,-187,-188,160,160,-181,-183,-189,-190,160,-182,160,160,-185,-184,]),'PRINT':([24,37,43,44,50,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,145,147,148,149,151,152,153,154,155,156,157,158,210,211,212,213,215,217,218,223,254,260,261,271,272,278,279,282,283,284,287,289,290,291,292,],[-191,-143,96,-12,167,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,167,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,-158,-159,-167,-168,-164,-169,-178,-186,-160,-187,-188,167,167,-181,-183,-189,-190,167,-182,167,167,-185,-184,]),'READ':([24,37,43,44,50,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,145,147,148,149,151,152,153,154,155,156,157,158,210,211,212,213,215,217,218,223,254,260,261,271,272,278,279,282,283,284,287,289,290,291,292,],[-191,-143,97,-12,168,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,168,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,-158,-159,-167,-168,-164,-169,-178,-186,-160,-187,-188,168,168,-181,-183,-189,-190,168,-182,168,168,-185,-184,]),'RETURN':([24,37,43,44,50,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,145,147,148,149,151,152,153,154,155,156,157,158,210,211,212,213,215,217,218,223,254,260,261,271,272,278,279,282,283,284,287,289,290,291,292,],[-191,-143,98,-12,165,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,165,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,-158,-159,-167,-168,-164,-169,-178,-186,-160,-187,-188,165,165,-181,-183,-189,-190,165,-182,165,165,-185,-184,]),'WHILE':([24,37,43,44,50,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,145,147,148,149,151,152,153,154,155,156,157,158,210,211,212,213,215,217,218,223,254,260,261,271,272,278,279,282,283,284,287,289,290,291,292,],[-191,-143,100,-12,162,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,162,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,-158,-159,-167,-168,-164,-169,-178,-186,-160,-187,-188,162,162,-181,-183,-189,-190,162,-182,162,162,-185,-184,]),'INT_CONST':([24,37,38,43,44,47,50,58,59,60,61,63,65,66,67,69,70,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,241,250,254,259,260,261,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[-191,-143,73,102,-12,73,73,-135,-136,-137,-134,73,73,73,73,-138,-139,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,73,73,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,73,73,73,73,-186,73,73,73,73,-160,73,-187,-188,73,73,73,73,-181,-183,73,-189,-190,73,73,-182,73,73,-185,-184,]),'FLOAT_CONST':([24,37,38,43,44,47,50,58,59,60,61,63,65,66,67,69,70,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,241,250,254,259,260,261,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[-191,-143,75,103,-12,75,75,-135,-136,-137,-134,75,75,75,75,-138,-139,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,75,75,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,75,75,75,75,-186,75,75,75,75,-160,75,-187,-188,75,75,75,75,-181,-183,75,-189,-190,75,75,-182,75,75,-185,-184,]),'STRING':([24,37,38,43,44,47,50,58,59,60,61,63,65,66,67,69,70,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,241,250,254,259,260,261,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[-191,-143,76,104,-12,76,76,-135,-136,-137,-134,76,76,76,76,-138,-139,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,76,76,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,76,76,76,76,-186,76,76,76,76,-160,76,-187,-188,76,76,76,76,-181,-183,76,-189,-190,76,76,-182,76,76,-185,-184,]),'CHAR_CONST':([24,37,38,43,44,47,50,58,59,60,61,63,65,66,67,69,70,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,241,250,254,259,260,261,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[-191,-143,74,105,-12,74,74,-135,-136,-137,-134,74,74,74,74,-138,-139,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,74,74,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,74,74,74,74,-186,74,74,74,74,-160,74,-187,-188,74,74,74,74,-181,-183,74,-189,-190,74,74,-182,74,74,-185,-184,]),'ADDRESS':([24,37,38,43,44,47,50,58,59,60,61,63,65,66,67,69,70,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,241,250,254,259,260,261,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[-191,-143,70,127,-12,70,70,-135,-136,-137,-134,70,70,70,70,-138,-139,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,70,70,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,70,70,70,70,-186,70,70,70,70,-160,70,-187,-188,70,70,70,70,-181,-183,70,-189,-190,70,70,-182,70,70,-185,-184,]),'NOT':([24,37,38,43,44,47,50,58,59,60,61,63,65,66,67,69,70,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,139,145,147,148,149,151,152,153,154,155,156,157,158,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,204,205,206,207,208,209,210,211,212,213,215,217,218,219,220,221,222,223,226,227,241,250,254,259,260,261,267,271,272,273,278,279,281,282,283,284,285,287,289,290,291,292,],[-191,-143,69,130,-12,69,69,-135,-136,-137,-134,69,69,69,69,-138,-139,-11,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,69,69,-163,-165,-166,-170,-171,-172,-173,-174,-175,-176,-177,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-128,-129,-130,-131,-132,-133,-158,-159,-167,-168,-164,-169,-178,69,69,69,69,-186,69,69,69,69,-160,69,-187,-188,69,69,69,69,-181,-183,69,-189,-190,69,69,-182,69,69,-185,-184,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'global_declaration_list':([0,],[2,]),'global_declaration':([0,2,],[3,19,]),'function_definition':([0,2,],[4,4,]),'declaration':([0,2,7,20,26,40,83,152,],[5,5,28,28,41,86,86,186,]),'type_specifier':([0,2,7,20,26,32,40,53,83,132,152,],[6,6,29,29,29,72,29,121,29,72,29,]),'declarator':([0,2,6,16,29,38,72,],[7,7,20,34,42,42,135,]),'decl_body':([0,2,7,20,26,40,83,152,],[8,8,8,8,8,8,8,8,]),'direct_declarator':([0,2,6,14,16,29,38,72,],[13,13,13,33,13,13,13,13,]),'pointer':([0,2,6,16,17,29,38,72,],[14,14,14,14,35,14,14,14,]),'identifier':([0,2,6,14,16,29,31,32,37,38,40,53,55,56,57,72,78,83,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,134,138,149,150,151,152,156,157,171,180,186,194,197,198,199,207,210,211,215,216,],[15,15,15,15,15,15,61,73,61,15,61,61,61,61,61,15,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,178,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'init_declarator_list_opt':([6,29,],[21,21,]),'init_declarator_list':([6,29,],[22,22,]),'empty':([6,7,20,29,31,32,40,83,102,152,156,186,197,198,199,207,210,211,215,216,],[23,27,27,23,45,71,84,147,147,147,147,147,147,147,147,147,147,147,147,147,]),'init_declarator':([6,29,38,],[24,24,81,]),'declaration_list_opt':([7,20,],[25,36,]),'declaration_list':([7,20,],[26,26,]),'compound_statement':([25,36,40,83,197,198,210,215,216,],[39,75,89,89,89,89,89,89,89,]),'constant_expression_opt':([31,],[43,]),'constant_expression':([31,],[44,]),'binary_expression':([31,37,40,53,78,83,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,149,150,151,152,156,157,180,186,194,197,198,199,207,210,211,215,216,],[46,79,79,79,79,79,79,79,158,159,160,161,162,163,164,165,166,167,168,169,170,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'cast_expression':([31,37,40,53,57,78,83,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,149,150,151,152,156,157,171,180,186,194,197,198,199,207,210,211,215,216,],[47,47,47,47,130,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,191,47,47,47,47,47,47,47,47,47,47,47,]),'unary_expression':([31,37,40,53,55,56,57,78,83,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,149,150,151,152,156,157,171,180,186,194,197,198,199,207,210,211,215,216,],[52,80,80,80,127,129,52,80,80,80,80,52,52,52,52,52,52,52,52,52,52,52,52,52,80,80,80,80,80,80,80,80,80,80,52,80,80,80,80,80,80,80,80,80,80,80,]),'postfix_expression':([31,37,40,53,55,56,57,78,83,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,149,150,151,152,156,157,171,180,186,194,197,198,199,207,210,211,215,216,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'unary_operator':([31,37,40,53,55,56,57,78,83,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,149,150,151,152,156,157,171,180,186,194,197,198,199,207,210,211,215,216,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'primary_expression':([31,37,40,53,55,56,57,78,83,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,149,150,151,152,156,157,171,180,186,194,197,198,199,207,210,211,215,216,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'constant':([31,37,40,53,55,56,57,78,83,102,103,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,128,138,149,150,151,152,156,157,171,180,186,194,197,198,199,207,210,211,215,216,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'parameter_list':([32,],[67,]),'identifier_list_opt':([32,],[68,]),'parameter_declaration':([32,132,],[69,177,]),'identifier_list':([32,],[70,]),'initializer':([37,78,180,],[76,137,196,]),'assignment_expression':([37,40,53,78,83,102,103,123,124,128,138,149,150,151,152,156,157,180,186,194,197,198,199,207,210,211,215,216,],[77,106,106,77,106,106,106,106,176,106,181,106,183,106,106,106,176,77,106,203,106,106,106,106,106,106,106,106,]),'block_item_list_opt':([40,],[82,]),'block_item_list':([40,],[83,]),'block_item':([40,83,],[85,146,]),'statement':([40,83,197,198,210,215,216,],[87,87,204,205,213,217,218,]),'expression_statement':([40,83,197,198,210,215,216,],[88,88,88,88,88,88,88,]),'selection_statement':([40,83,197,198,210,215,216,],[90,90,90,90,90,90,90,]),'interation_statement':([40,83,197,198,210,215,216,],[91,91,91,91,91,91,91,]),'jump_statement':([40,83,197,198,210,215,216,],[92,92,92,92,92,92,92,]),'assert_statement':([40,83,197,198,210,215,216,],[93,93,93,93,93,93,93,]),'print_statement':([40,83,197,198,210,215,216,],[94,94,94,94,94,94,94,]),'read_statement':([40,83,197,198,210,215,216,],[95,95,95,95,95,95,95,]),'expression_opt':([40,83,102,152,156,186,197,198,199,207,210,211,215,216,],[96,96,154,185,189,200,96,96,206,212,96,214,96,96,]),'expression':([40,53,83,102,103,123,128,149,151,152,156,186,197,198,199,207,210,211,215,216,],[98,122,98,98,155,173,122,182,184,98,98,98,98,98,98,98,98,98,98,98,]),'initializer_list':([78,],[136,]),'assignment_operator':([80,],[138,]),'argument_expression':([124,157,],[175,190,]),}
+_lr_goto_items = {'program':([0,],[1,]),'global_declaration_list':([0,],[2,]),'global_declaration':([0,2,],[3,21,]),'function_definition':([0,2,],[4,4,]),'declaration':([0,2,7,9,27,33,45,50,145,150,222,],[5,5,25,35,35,51,35,148,148,217,259,]),'resync':([0,2,50,145,],[7,7,150,150,]),'type_specifier':([0,2,7,9,27,33,39,45,50,63,145,150,195,222,],[8,8,26,36,36,36,82,36,36,184,36,36,82,36,]),'declarator':([0,2,8,18,26,36,48,82,],[9,9,27,41,45,52,52,198,]),'decl_body':([0,2,7,9,27,33,45,50,145,150,222,],[10,10,10,10,10,10,10,10,10,10,10,]),'direct_declarator':([0,2,8,16,18,26,36,48,82,],[15,15,15,40,15,15,15,15,15,]),'pointer':([0,2,8,18,19,26,36,48,82,],[16,16,16,16,42,16,16,16,16,]),'identifier':([0,2,8,16,18,26,36,38,39,47,48,50,63,65,66,67,82,139,145,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,197,203,219,220,221,222,226,227,241,250,259,267,271,272,273,281,284,285,289,290,],[17,17,17,17,17,17,17,71,83,71,17,71,71,71,71,71,17,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,248,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,]),'brace_group':([6,43,144,214,],[23,87,213,213,]),'init_declarator_list_opt':([8,26,36,],[28,28,28,]),'init_declarator_list':([8,26,36,],[29,29,29,]),'empty':([8,9,24,26,27,36,38,39,45,50,145,165,222,226,259,271,272,273,281,284,285,289,290,],[30,34,44,30,34,30,55,81,34,146,216,216,216,216,216,216,216,216,216,216,216,216,216,]),'init_declarator':([8,26,36,48,],[31,31,31,142,]),'declaration_list_opt':([9,27,45,],[32,46,135,]),'declaration_list':([9,27,45,],[33,33,33,]),'skipped_tokens':([24,],[43,]),'compound_statement':([32,46,50,135,145,271,272,284,289,290,],[49,136,152,199,152,152,152,152,152,152,]),'constant_expression_opt':([38,],[53,]),'constant_expression':([38,],[54,]),'binary_expression':([38,47,50,63,139,145,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,219,220,221,222,226,227,250,259,267,271,272,273,281,284,285,289,290,],[56,140,140,140,140,140,140,140,228,229,230,231,232,233,234,235,236,237,238,239,240,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,]),'cast_expression':([38,47,50,63,67,139,145,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,219,220,221,222,226,227,241,250,259,267,271,272,273,281,284,285,289,290,],[57,57,57,57,193,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,264,57,57,57,57,57,57,57,57,57,57,57,]),'unary_expression':([38,47,50,63,65,66,67,139,145,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,219,220,221,222,226,227,241,250,259,267,271,272,273,281,284,285,289,290,],[62,141,141,141,190,192,62,141,141,141,141,62,62,62,62,62,62,62,62,62,62,62,62,62,141,141,141,141,141,141,141,141,141,141,62,141,141,141,141,141,141,141,141,141,141,141,]),'postfix_expression':([38,47,50,63,65,66,67,139,145,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,219,220,221,222,226,227,241,250,259,267,271,272,273,281,284,285,289,290,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'unary_operator':([38,47,50,63,65,66,67,139,145,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,219,220,221,222,226,227,241,250,259,267,271,272,273,281,284,285,289,290,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'primary_expression':([38,47,50,63,65,66,67,139,145,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,219,220,221,222,226,227,241,250,259,267,271,272,273,281,284,285,289,290,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'constant':([38,47,50,63,65,66,67,139,145,165,166,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,191,203,219,220,221,222,226,227,241,250,259,267,271,272,273,281,284,285,289,290,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'parameter_list':([39,],[77,]),'identifier_list_opt':([39,],[78,]),'parameter_declaration':([39,195,],[79,247,]),'identifier_list':([39,],[80,]),'skipped_token':([43,],[86,]),'initializer':([47,139,250,],[137,202,269,]),'assignment_expression':([47,50,63,139,145,165,166,186,187,191,203,219,220,221,222,226,227,250,259,267,271,272,273,281,284,285,289,290,],[138,169,169,138,169,169,169,169,246,169,253,169,256,169,169,169,246,138,169,277,169,169,169,169,169,169,169,169,]),'block_item_list_opt':([50,],[143,]),'block_item_list':([50,],[145,]),'block_item':([50,145,],[147,215,]),'statement':([50,145,271,272,284,289,290,],[149,149,278,279,287,291,292,]),'expression_statement':([50,145,271,272,284,289,290,],[151,151,151,151,151,151,151,]),'selection_statement':([50,145,271,272,284,289,290,],[153,153,153,153,153,153,153,]),'interation_statement':([50,145,271,272,284,289,290,],[154,154,154,154,154,154,154,]),'jump_statement':([50,145,271,272,284,289,290,],[155,155,155,155,155,155,155,]),'assert_statement':([50,145,271,272,284,289,290,],[156,156,156,156,156,156,156,]),'print_statement':([50,145,271,272,284,289,290,],[157,157,157,157,157,157,157,]),'read_statement':([50,145,271,272,284,289,290,],[158,158,158,158,158,158,158,]),'expression_opt':([50,145,165,222,226,259,271,272,273,281,284,285,289,290,],[159,159,224,258,262,274,159,159,280,286,159,288,159,159,]),'expression':([50,63,145,165,166,186,191,219,221,222,226,259,271,272,273,281,284,285,289,290,],[161,185,161,161,225,243,185,255,257,161,161,161,161,161,161,161,161,161,161,161,]),'initializer_list':([139,],[200,]),'assignment_operator':([141,],[203,]),'argument_expression':([187,227,],[245,263,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,132 +27,195 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> global_declaration_list','program',1,'p_program','uc_parser.py',149),
-  ('global_declaration_list -> global_declaration','global_declaration_list',1,'p_global_declaration_list','uc_parser.py',156),
-  ('global_declaration_list -> global_declaration_list global_declaration','global_declaration_list',2,'p_global_declaration_list','uc_parser.py',157),
-  ('global_declaration -> function_definition','global_declaration',1,'p_global_declaration_1','uc_parser.py',163),
-  ('global_declaration -> declaration','global_declaration',1,'p_global_declaration_2','uc_parser.py',169),
-  ('function_definition -> type_specifier declarator declaration_list_opt compound_statement','function_definition',4,'p_function_definition_1','uc_parser.py',175),
-  ('function_definition -> declarator declaration_list_opt compound_statement','function_definition',3,'p_function_definition_2','uc_parser.py',182),
-  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier','uc_parser.py',189),
-  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','uc_parser.py',190),
-  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','uc_parser.py',191),
-  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','uc_parser.py',192),
-  ('declaration_list_opt -> declaration_list','declaration_list_opt',1,'p_declaration_list_opt','uc_parser.py',199),
-  ('declaration_list_opt -> empty','declaration_list_opt',1,'p_declaration_list_opt','uc_parser.py',200),
-  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','uc_parser.py',206),
-  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','uc_parser.py',207),
-  ('declarator -> direct_declarator','declarator',1,'p_declarator_1','uc_parser.py',213),
-  ('declarator -> pointer direct_declarator','declarator',2,'p_declarator_2','uc_parser.py',219),
-  ('pointer -> TIMES','pointer',1,'p_pointer','uc_parser.py',225),
-  ('pointer -> TIMES pointer','pointer',2,'p_pointer','uc_parser.py',226),
-  ('direct_declarator -> identifier','direct_declarator',1,'p_direct_declarator_1','uc_parser.py',241),
-  ('direct_declarator -> LPAREN declarator RPAREN','direct_declarator',3,'p_direct_declarator_2','uc_parser.py',248),
-  ('direct_declarator -> direct_declarator LBRACKET constant_expression_opt RBRACKET','direct_declarator',4,'p_direct_declarator_3','uc_parser.py',254),
-  ('direct_declarator -> direct_declarator LPAREN parameter_list RPAREN','direct_declarator',4,'p_direct_declarator_4','uc_parser.py',263),
-  ('direct_declarator -> direct_declarator LPAREN identifier_list_opt RPAREN','direct_declarator',4,'p_direct_declarator_4','uc_parser.py',264),
-  ('identifier -> ID','identifier',1,'p_identifier','uc_parser.py',272),
-  ('identifier_list_opt -> identifier_list','identifier_list_opt',1,'p_identifier_list_opt','uc_parser.py',280),
-  ('identifier_list_opt -> empty','identifier_list_opt',1,'p_identifier_list_opt','uc_parser.py',281),
-  ('identifier_list -> identifier','identifier_list',1,'p_identifier_list','uc_parser.py',287),
-  ('identifier_list -> identifier_list COMMA identifier','identifier_list',3,'p_identifier_list','uc_parser.py',288),
-  ('constant_expression_opt -> constant_expression','constant_expression_opt',1,'p_constant_expression_opt','uc_parser.py',298),
-  ('constant_expression_opt -> empty','constant_expression_opt',1,'p_constant_expression_opt','uc_parser.py',299),
-  ('constant_expression -> binary_expression','constant_expression',1,'p_constant_expression','uc_parser.py',305),
-  ('binary_expression -> cast_expression','binary_expression',1,'p_binary_expression','uc_parser.py',311),
-  ('binary_expression -> binary_expression TIMES binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',312),
-  ('binary_expression -> binary_expression DIVIDE binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',313),
-  ('binary_expression -> binary_expression MOD binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',314),
-  ('binary_expression -> binary_expression PLUS binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',315),
-  ('binary_expression -> binary_expression MINUS binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',316),
-  ('binary_expression -> binary_expression LESSTHAN binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',317),
-  ('binary_expression -> binary_expression LESSTHANEQ binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',318),
-  ('binary_expression -> binary_expression GREATERTHANEQ binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',319),
-  ('binary_expression -> binary_expression GREATERTHAN binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',320),
-  ('binary_expression -> binary_expression EQ binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',321),
-  ('binary_expression -> binary_expression NOTEQ binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',322),
-  ('binary_expression -> binary_expression AND binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',323),
-  ('binary_expression -> binary_expression OR binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',324),
-  ('cast_expression -> unary_expression','cast_expression',1,'p_cast_expression_1','uc_parser.py',333),
-  ('cast_expression -> LPAREN type_specifier RPAREN cast_expression','cast_expression',4,'p_cast_expression_2','uc_parser.py',339),
-  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression_1','uc_parser.py',345),
-  ('unary_expression -> PLUSPLUS unary_expression','unary_expression',2,'p_unary_expression_2','uc_parser.py',351),
-  ('unary_expression -> MINUSMINUS unary_expression','unary_expression',2,'p_unary_expression_2','uc_parser.py',352),
-  ('unary_expression -> unary_operator cast_expression','unary_expression',2,'p_unary_expression_2','uc_parser.py',353),
-  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression_1','uc_parser.py',359),
-  ('postfix_expression -> postfix_expression LBRACKET expression RBRACKET','postfix_expression',4,'p_postfix_expression_2','uc_parser.py',365),
-  ('postfix_expression -> postfix_expression LPAREN RPAREN','postfix_expression',3,'p_postfix_expression_3','uc_parser.py',371),
-  ('postfix_expression -> postfix_expression LPAREN argument_expression RPAREN','postfix_expression',4,'p_postfix_expression_3','uc_parser.py',372),
-  ('postfix_expression -> postfix_expression PLUSPLUS','postfix_expression',2,'p_postfix_expression_4','uc_parser.py',378),
-  ('postfix_expression -> postfix_expression MINUSMINUS','postfix_expression',2,'p_postfix_expression_4','uc_parser.py',379),
-  ('primary_expression -> identifier','primary_expression',1,'p_primary_expression_1','uc_parser.py',385),
-  ('primary_expression -> constant','primary_expression',1,'p_primary_expression_1','uc_parser.py',386),
-  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression_2','uc_parser.py',392),
-  ('constant -> INT_CONST','constant',1,'p_constant_1','uc_parser.py',398),
-  ('constant -> CHAR_CONST','constant',1,'p_constant_2','uc_parser.py',404),
-  ('constant -> FLOAT_CONST','constant',1,'p_constant_3','uc_parser.py',410),
-  ('constant -> STRING','constant',1,'p_constant_4','uc_parser.py',416),
-  ('expression -> assignment_expression','expression',1,'p_expression_1','uc_parser.py',422),
-  ('expression -> expression COMMA assignment_expression','expression',3,'p_expression_2','uc_parser.py',428),
-  ('argument_expression -> assignment_expression','argument_expression',1,'p_argument_expression','uc_parser.py',438),
-  ('argument_expression -> argument_expression COMMA assignment_expression','argument_expression',3,'p_argument_expression','uc_parser.py',439),
-  ('assignment_expression -> binary_expression','assignment_expression',1,'p_assignment_expression','uc_parser.py',451),
-  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','uc_parser.py',452),
-  ('assignment_operator -> EQUALS','assignment_operator',1,'p_assignment_operator','uc_parser.py',461),
-  ('assignment_operator -> TIMESEQ','assignment_operator',1,'p_assignment_operator','uc_parser.py',462),
-  ('assignment_operator -> DIVEQ','assignment_operator',1,'p_assignment_operator','uc_parser.py',463),
-  ('assignment_operator -> MODEQ','assignment_operator',1,'p_assignment_operator','uc_parser.py',464),
-  ('assignment_operator -> PLUSEQ','assignment_operator',1,'p_assignment_operator','uc_parser.py',465),
-  ('assignment_operator -> MINUSEQ','assignment_operator',1,'p_assignment_operator','uc_parser.py',466),
-  ('unary_operator -> AND','unary_operator',1,'p_unary_operator','uc_parser.py',472),
-  ('unary_operator -> TIMES','unary_operator',1,'p_unary_operator','uc_parser.py',473),
-  ('unary_operator -> PLUS','unary_operator',1,'p_unary_operator','uc_parser.py',474),
-  ('unary_operator -> MINUS','unary_operator',1,'p_unary_operator','uc_parser.py',475),
-  ('unary_operator -> NOT','unary_operator',1,'p_unary_operator','uc_parser.py',476),
-  ('unary_operator -> ADDRESS','unary_operator',1,'p_unary_operator','uc_parser.py',477),
-  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','uc_parser.py',482),
-  ('parameter_list -> parameter_list COMMA parameter_declaration','parameter_list',3,'p_parameter_list','uc_parser.py',483),
-  ('parameter_declaration -> type_specifier declarator','parameter_declaration',2,'p_parameter_declaration','uc_parser.py',492),
-  ('declaration -> decl_body SEMI','declaration',2,'p_declaration','uc_parser.py',500),
-  ('decl_body -> type_specifier init_declarator_list_opt','decl_body',2,'p_decl_body','uc_parser.py',505),
-  ('init_declarator_list_opt -> init_declarator_list','init_declarator_list_opt',1,'p_init_declarator_list_opt','uc_parser.py',517),
-  ('init_declarator_list_opt -> empty','init_declarator_list_opt',1,'p_init_declarator_list_opt','uc_parser.py',518),
-  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','uc_parser.py',523),
-  ('init_declarator_list -> init_declarator_list COMMA init_declarator','init_declarator_list',3,'p_init_declarator_list','uc_parser.py',524),
-  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','uc_parser.py',529),
-  ('init_declarator -> declarator EQUALS initializer','init_declarator',3,'p_init_declarator','uc_parser.py',530),
-  ('initializer -> assignment_expression','initializer',1,'p_initializer_1','uc_parser.py',535),
-  ('initializer -> LBRACE initializer_list RBRACE','initializer',3,'p_initializer_2','uc_parser.py',539),
-  ('initializer -> LBRACE initializer_list COMMA RBRACE','initializer',4,'p_initializer_2','uc_parser.py',540),
-  ('initializer_list -> initializer','initializer_list',1,'p_initializer_list','uc_parser.py',548),
-  ('initializer_list -> initializer_list COMMA initializer','initializer_list',3,'p_initializer_list','uc_parser.py',549),
-  ('compound_statement -> LBRACE block_item_list_opt RBRACE','compound_statement',3,'p_compound_statement','uc_parser.py',559),
-  ('block_item_list_opt -> block_item_list','block_item_list_opt',1,'p_block_item_list_opt','uc_parser.py',565),
-  ('block_item_list_opt -> empty','block_item_list_opt',1,'p_block_item_list_opt','uc_parser.py',566),
-  ('block_item_list -> block_item','block_item_list',1,'p_block_item_list','uc_parser.py',571),
-  ('block_item_list -> block_item_list block_item','block_item_list',2,'p_block_item_list','uc_parser.py',572),
-  ('block_item -> declaration','block_item',1,'p_block_item','uc_parser.py',578),
-  ('block_item -> statement','block_item',1,'p_block_item','uc_parser.py',579),
-  ('statement -> expression_statement','statement',1,'p_statement','uc_parser.py',584),
-  ('statement -> compound_statement','statement',1,'p_statement','uc_parser.py',585),
-  ('statement -> selection_statement','statement',1,'p_statement','uc_parser.py',586),
-  ('statement -> interation_statement','statement',1,'p_statement','uc_parser.py',587),
-  ('statement -> jump_statement','statement',1,'p_statement','uc_parser.py',588),
-  ('statement -> assert_statement','statement',1,'p_statement','uc_parser.py',589),
-  ('statement -> print_statement','statement',1,'p_statement','uc_parser.py',590),
-  ('statement -> read_statement','statement',1,'p_statement','uc_parser.py',591),
-  ('expression_statement -> expression_opt SEMI','expression_statement',2,'p_expression_statement','uc_parser.py',596),
-  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','uc_parser.py',603),
-  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','uc_parser.py',604),
-  ('selection_statement -> IF LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement_1','uc_parser.py',609),
-  ('selection_statement -> IF LPAREN expression RPAREN statement ELSE statement','selection_statement',7,'p_selection_statement_2','uc_parser.py',614),
-  ('interation_statement -> WHILE LPAREN expression RPAREN statement','interation_statement',5,'p_interation_statement_1','uc_parser.py',619),
-  ('interation_statement -> FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN statement','interation_statement',9,'p_interation_statement_2','uc_parser.py',624),
-  ('interation_statement -> FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN statement','interation_statement',8,'p_interation_statement_3','uc_parser.py',629),
-  ('jump_statement -> BREAK SEMI','jump_statement',2,'p_jump_statement_1','uc_parser.py',634),
-  ('jump_statement -> RETURN expression_opt SEMI','jump_statement',3,'p_jump_statement_2','uc_parser.py',639),
-  ('assert_statement -> ASSERT expression SEMI','assert_statement',3,'p_assert_statement_2','uc_parser.py',644),
-  ('print_statement -> PRINT LPAREN expression_opt RPAREN SEMI','print_statement',5,'p_print_statement','uc_parser.py',649),
-  ('read_statement -> READ LPAREN argument_expression RPAREN SEMI','read_statement',5,'p_read_statement','uc_parser.py',654),
-  ('empty -> <empty>','empty',0,'p_empty','uc_parser.py',659),
+  ('program -> global_declaration_list','program',1,'p_program','uc_parser.py',79),
+  ('global_declaration_list -> global_declaration','global_declaration_list',1,'p_global_declaration_list','uc_parser.py',86),
+  ('global_declaration_list -> global_declaration_list global_declaration','global_declaration_list',2,'p_global_declaration_list','uc_parser.py',87),
+  ('global_declaration -> function_definition','global_declaration',1,'p_global_declaration_1','uc_parser.py',97),
+  ('global_declaration -> declaration','global_declaration',1,'p_global_declaration_2','uc_parser.py',103),
+  ('global_declaration -> error SEMI','global_declaration',2,'p_global_declaration_3','uc_parser.py',109),
+  ('global_declaration -> error brace_group','global_declaration',2,'p_global_declaration_3','uc_parser.py',110),
+  ('global_declaration -> resync declaration','global_declaration',2,'p_global_declaration_4','uc_parser.py',119),
+  ('global_declaration -> resync type_specifier declarator declaration_list_opt compound_statement','global_declaration',5,'p_global_declaration_4','uc_parser.py',120),
+  ('resync -> error','resync',1,'p_resync','uc_parser.py',129),
+  ('brace_group -> LBRACE skipped_tokens RBRACE','brace_group',3,'p_brace_group','uc_parser.py',137),
+  ('skipped_tokens -> empty','skipped_tokens',1,'p_skipped_tokens','uc_parser.py',143),
+  ('skipped_tokens -> skipped_tokens skipped_token','skipped_tokens',2,'p_skipped_tokens','uc_parser.py',144),
+  ('skipped_tokens -> skipped_tokens brace_group','skipped_tokens',2,'p_skipped_tokens','uc_parser.py',145),
+  ('skipped_token -> ASSERT','skipped_token',1,'p_skipped_token','uc_parser.py',151),
+  ('skipped_token -> BREAK','skipped_token',1,'p_skipped_token','uc_parser.py',152),
+  ('skipped_token -> CHAR','skipped_token',1,'p_skipped_token','uc_parser.py',153),
+  ('skipped_token -> ELSE','skipped_token',1,'p_skipped_token','uc_parser.py',154),
+  ('skipped_token -> FLOAT','skipped_token',1,'p_skipped_token','uc_parser.py',155),
+  ('skipped_token -> FOR','skipped_token',1,'p_skipped_token','uc_parser.py',156),
+  ('skipped_token -> IF','skipped_token',1,'p_skipped_token','uc_parser.py',157),
+  ('skipped_token -> INT','skipped_token',1,'p_skipped_token','uc_parser.py',158),
+  ('skipped_token -> PRINT','skipped_token',1,'p_skipped_token','uc_parser.py',159),
+  ('skipped_token -> READ','skipped_token',1,'p_skipped_token','uc_parser.py',160),
+  ('skipped_token -> RETURN','skipped_token',1,'p_skipped_token','uc_parser.py',161),
+  ('skipped_token -> VOID','skipped_token',1,'p_skipped_token','uc_parser.py',162),
+  ('skipped_token -> WHILE','skipped_token',1,'p_skipped_token','uc_parser.py',163),
+  ('skipped_token -> ID','skipped_token',1,'p_skipped_token','uc_parser.py',164),
+  ('skipped_token -> INT_CONST','skipped_token',1,'p_skipped_token','uc_parser.py',165),
+  ('skipped_token -> FLOAT_CONST','skipped_token',1,'p_skipped_token','uc_parser.py',166),
+  ('skipped_token -> STRING','skipped_token',1,'p_skipped_token','uc_parser.py',167),
+  ('skipped_token -> CHAR_CONST','skipped_token',1,'p_skipped_token','uc_parser.py',168),
+  ('skipped_token -> LESSTHAN','skipped_token',1,'p_skipped_token','uc_parser.py',169),
+  ('skipped_token -> LESSTHANEQ','skipped_token',1,'p_skipped_token','uc_parser.py',170),
+  ('skipped_token -> GREATERTHAN','skipped_token',1,'p_skipped_token','uc_parser.py',171),
+  ('skipped_token -> GREATERTHANEQ','skipped_token',1,'p_skipped_token','uc_parser.py',172),
+  ('skipped_token -> NOTEQ','skipped_token',1,'p_skipped_token','uc_parser.py',173),
+  ('skipped_token -> PLUSEQ','skipped_token',1,'p_skipped_token','uc_parser.py',174),
+  ('skipped_token -> MINUSEQ','skipped_token',1,'p_skipped_token','uc_parser.py',175),
+  ('skipped_token -> TIMESEQ','skipped_token',1,'p_skipped_token','uc_parser.py',176),
+  ('skipped_token -> DIVEQ','skipped_token',1,'p_skipped_token','uc_parser.py',177),
+  ('skipped_token -> MODEQ','skipped_token',1,'p_skipped_token','uc_parser.py',178),
+  ('skipped_token -> PLUSPLUS','skipped_token',1,'p_skipped_token','uc_parser.py',179),
+  ('skipped_token -> MINUSMINUS','skipped_token',1,'p_skipped_token','uc_parser.py',180),
+  ('skipped_token -> PLUS','skipped_token',1,'p_skipped_token','uc_parser.py',181),
+  ('skipped_token -> MINUS','skipped_token',1,'p_skipped_token','uc_parser.py',182),
+  ('skipped_token -> TIMES','skipped_token',1,'p_skipped_token','uc_parser.py',183),
+  ('skipped_token -> DIVIDE','skipped_token',1,'p_skipped_token','uc_parser.py',184),
+  ('skipped_token -> MOD','skipped_token',1,'p_skipped_token','uc_parser.py',185),
+  ('skipped_token -> EQUALS','skipped_token',1,'p_skipped_token','uc_parser.py',186),
+  ('skipped_token -> EQ','skipped_token',1,'p_skipped_token','uc_parser.py',187),
+  ('skipped_token -> SEMI','skipped_token',1,'p_skipped_token','uc_parser.py',188),
+  ('skipped_token -> COMMA','skipped_token',1,'p_skipped_token','uc_parser.py',189),
+  ('skipped_token -> ADDRESS','skipped_token',1,'p_skipped_token','uc_parser.py',190),
+  ('skipped_token -> AND','skipped_token',1,'p_skipped_token','uc_parser.py',191),
+  ('skipped_token -> OR','skipped_token',1,'p_skipped_token','uc_parser.py',192),
+  ('skipped_token -> NOT','skipped_token',1,'p_skipped_token','uc_parser.py',193),
+  ('skipped_token -> LPAREN','skipped_token',1,'p_skipped_token','uc_parser.py',194),
+  ('skipped_token -> RPAREN','skipped_token',1,'p_skipped_token','uc_parser.py',195),
+  ('skipped_token -> LBRACKET','skipped_token',1,'p_skipped_token','uc_parser.py',196),
+  ('skipped_token -> RBRACKET','skipped_token',1,'p_skipped_token','uc_parser.py',197),
+  ('function_definition -> type_specifier declarator declaration_list_opt compound_statement','function_definition',4,'p_function_definition_1','uc_parser.py',203),
+  ('function_definition -> declarator declaration_list_opt compound_statement','function_definition',3,'p_function_definition_2','uc_parser.py',210),
+  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier','uc_parser.py',222),
+  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','uc_parser.py',223),
+  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','uc_parser.py',224),
+  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','uc_parser.py',225),
+  ('declaration_list_opt -> declaration_list','declaration_list_opt',1,'p_declaration_list_opt','uc_parser.py',234),
+  ('declaration_list_opt -> empty','declaration_list_opt',1,'p_declaration_list_opt','uc_parser.py',235),
+  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','uc_parser.py',241),
+  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','uc_parser.py',242),
+  ('declarator -> direct_declarator','declarator',1,'p_declarator_1','uc_parser.py',248),
+  ('declarator -> pointer direct_declarator','declarator',2,'p_declarator_2','uc_parser.py',254),
+  ('pointer -> TIMES','pointer',1,'p_pointer','uc_parser.py',260),
+  ('pointer -> TIMES pointer','pointer',2,'p_pointer','uc_parser.py',261),
+  ('direct_declarator -> identifier','direct_declarator',1,'p_direct_declarator_1','uc_parser.py',276),
+  ('direct_declarator -> LPAREN declarator RPAREN','direct_declarator',3,'p_direct_declarator_2','uc_parser.py',283),
+  ('direct_declarator -> direct_declarator LBRACKET constant_expression_opt RBRACKET','direct_declarator',4,'p_direct_declarator_3','uc_parser.py',289),
+  ('direct_declarator -> direct_declarator LPAREN parameter_list RPAREN','direct_declarator',4,'p_direct_declarator_4','uc_parser.py',298),
+  ('direct_declarator -> direct_declarator LPAREN identifier_list_opt RPAREN','direct_declarator',4,'p_direct_declarator_4','uc_parser.py',299),
+  ('identifier -> ID','identifier',1,'p_identifier','uc_parser.py',307),
+  ('identifier_list_opt -> identifier_list','identifier_list_opt',1,'p_identifier_list_opt','uc_parser.py',315),
+  ('identifier_list_opt -> empty','identifier_list_opt',1,'p_identifier_list_opt','uc_parser.py',316),
+  ('identifier_list -> identifier','identifier_list',1,'p_identifier_list','uc_parser.py',322),
+  ('identifier_list -> identifier_list COMMA identifier','identifier_list',3,'p_identifier_list','uc_parser.py',323),
+  ('constant_expression_opt -> constant_expression','constant_expression_opt',1,'p_constant_expression_opt','uc_parser.py',333),
+  ('constant_expression_opt -> empty','constant_expression_opt',1,'p_constant_expression_opt','uc_parser.py',334),
+  ('constant_expression -> binary_expression','constant_expression',1,'p_constant_expression','uc_parser.py',340),
+  ('binary_expression -> cast_expression','binary_expression',1,'p_binary_expression','uc_parser.py',346),
+  ('binary_expression -> binary_expression TIMES binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',347),
+  ('binary_expression -> binary_expression DIVIDE binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',348),
+  ('binary_expression -> binary_expression MOD binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',349),
+  ('binary_expression -> binary_expression PLUS binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',350),
+  ('binary_expression -> binary_expression MINUS binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',351),
+  ('binary_expression -> binary_expression LESSTHAN binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',352),
+  ('binary_expression -> binary_expression LESSTHANEQ binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',353),
+  ('binary_expression -> binary_expression GREATERTHANEQ binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',354),
+  ('binary_expression -> binary_expression GREATERTHAN binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',355),
+  ('binary_expression -> binary_expression EQ binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',356),
+  ('binary_expression -> binary_expression NOTEQ binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',357),
+  ('binary_expression -> binary_expression AND binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',358),
+  ('binary_expression -> binary_expression OR binary_expression','binary_expression',3,'p_binary_expression','uc_parser.py',359),
+  ('cast_expression -> unary_expression','cast_expression',1,'p_cast_expression_1','uc_parser.py',368),
+  ('cast_expression -> LPAREN type_specifier RPAREN cast_expression','cast_expression',4,'p_cast_expression_2','uc_parser.py',374),
+  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression_1','uc_parser.py',380),
+  ('unary_expression -> PLUSPLUS unary_expression','unary_expression',2,'p_unary_expression_2','uc_parser.py',386),
+  ('unary_expression -> MINUSMINUS unary_expression','unary_expression',2,'p_unary_expression_2','uc_parser.py',387),
+  ('unary_expression -> unary_operator cast_expression','unary_expression',2,'p_unary_expression_2','uc_parser.py',388),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression_1','uc_parser.py',394),
+  ('postfix_expression -> postfix_expression LBRACKET expression RBRACKET','postfix_expression',4,'p_postfix_expression_2','uc_parser.py',400),
+  ('postfix_expression -> postfix_expression LPAREN RPAREN','postfix_expression',3,'p_postfix_expression_3','uc_parser.py',406),
+  ('postfix_expression -> postfix_expression LPAREN argument_expression RPAREN','postfix_expression',4,'p_postfix_expression_3','uc_parser.py',407),
+  ('postfix_expression -> postfix_expression PLUSPLUS','postfix_expression',2,'p_postfix_expression_4','uc_parser.py',413),
+  ('postfix_expression -> postfix_expression MINUSMINUS','postfix_expression',2,'p_postfix_expression_4','uc_parser.py',414),
+  ('primary_expression -> identifier','primary_expression',1,'p_primary_expression_1','uc_parser.py',420),
+  ('primary_expression -> constant','primary_expression',1,'p_primary_expression_1','uc_parser.py',421),
+  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression_2','uc_parser.py',427),
+  ('constant -> INT_CONST','constant',1,'p_constant_1','uc_parser.py',433),
+  ('constant -> CHAR_CONST','constant',1,'p_constant_2','uc_parser.py',439),
+  ('constant -> FLOAT_CONST','constant',1,'p_constant_3','uc_parser.py',445),
+  ('constant -> STRING','constant',1,'p_constant_4','uc_parser.py',451),
+  ('expression -> assignment_expression','expression',1,'p_expression_1','uc_parser.py',457),
+  ('expression -> expression COMMA assignment_expression','expression',3,'p_expression_2','uc_parser.py',463),
+  ('argument_expression -> assignment_expression','argument_expression',1,'p_argument_expression','uc_parser.py',473),
+  ('argument_expression -> argument_expression COMMA assignment_expression','argument_expression',3,'p_argument_expression','uc_parser.py',474),
+  ('assignment_expression -> binary_expression','assignment_expression',1,'p_assignment_expression','uc_parser.py',486),
+  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','uc_parser.py',487),
+  ('assignment_operator -> EQUALS','assignment_operator',1,'p_assignment_operator','uc_parser.py',496),
+  ('assignment_operator -> TIMESEQ','assignment_operator',1,'p_assignment_operator','uc_parser.py',497),
+  ('assignment_operator -> DIVEQ','assignment_operator',1,'p_assignment_operator','uc_parser.py',498),
+  ('assignment_operator -> MODEQ','assignment_operator',1,'p_assignment_operator','uc_parser.py',499),
+  ('assignment_operator -> PLUSEQ','assignment_operator',1,'p_assignment_operator','uc_parser.py',500),
+  ('assignment_operator -> MINUSEQ','assignment_operator',1,'p_assignment_operator','uc_parser.py',501),
+  ('unary_operator -> AND','unary_operator',1,'p_unary_operator','uc_parser.py',507),
+  ('unary_operator -> TIMES','unary_operator',1,'p_unary_operator','uc_parser.py',508),
+  ('unary_operator -> PLUS','unary_operator',1,'p_unary_operator','uc_parser.py',509),
+  ('unary_operator -> MINUS','unary_operator',1,'p_unary_operator','uc_parser.py',510),
+  ('unary_operator -> NOT','unary_operator',1,'p_unary_operator','uc_parser.py',511),
+  ('unary_operator -> ADDRESS','unary_operator',1,'p_unary_operator','uc_parser.py',512),
+  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','uc_parser.py',517),
+  ('parameter_list -> parameter_list COMMA parameter_declaration','parameter_list',3,'p_parameter_list','uc_parser.py',518),
+  ('parameter_declaration -> type_specifier declarator','parameter_declaration',2,'p_parameter_declaration','uc_parser.py',527),
+  ('declaration -> decl_body SEMI','declaration',2,'p_declaration','uc_parser.py',535),
+  ('decl_body -> type_specifier init_declarator_list_opt','decl_body',2,'p_decl_body','uc_parser.py',540),
+  ('init_declarator_list_opt -> init_declarator_list','init_declarator_list_opt',1,'p_init_declarator_list_opt','uc_parser.py',552),
+  ('init_declarator_list_opt -> empty','init_declarator_list_opt',1,'p_init_declarator_list_opt','uc_parser.py',553),
+  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','uc_parser.py',558),
+  ('init_declarator_list -> init_declarator_list COMMA init_declarator','init_declarator_list',3,'p_init_declarator_list','uc_parser.py',559),
+  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','uc_parser.py',564),
+  ('init_declarator -> declarator EQUALS initializer','init_declarator',3,'p_init_declarator','uc_parser.py',565),
+  ('initializer -> assignment_expression','initializer',1,'p_initializer_1','uc_parser.py',570),
+  ('initializer -> LBRACE initializer_list RBRACE','initializer',3,'p_initializer_2','uc_parser.py',574),
+  ('initializer -> LBRACE initializer_list COMMA RBRACE','initializer',4,'p_initializer_2','uc_parser.py',575),
+  ('initializer -> LBRACE error RBRACE','initializer',3,'p_initializer_error','uc_parser.py',583),
+  ('initializer -> LBRACE initializer_list error RBRACE','initializer',4,'p_initializer_error','uc_parser.py',584),
+  ('initializer_list -> initializer','initializer_list',1,'p_initializer_list','uc_parser.py',591),
+  ('initializer_list -> initializer_list COMMA initializer','initializer_list',3,'p_initializer_list','uc_parser.py',592),
+  ('compound_statement -> LBRACE block_item_list_opt RBRACE','compound_statement',3,'p_compound_statement','uc_parser.py',602),
+  ('compound_statement -> LBRACE error RBRACE','compound_statement',3,'p_compound_statement_error','uc_parser.py',608),
+  ('compound_statement -> LBRACE block_item_list error RBRACE','compound_statement',4,'p_compound_statement_error','uc_parser.py',609),
+  ('block_item_list_opt -> block_item_list','block_item_list_opt',1,'p_block_item_list_opt','uc_parser.py',618),
+  ('block_item_list_opt -> empty','block_item_list_opt',1,'p_block_item_list_opt','uc_parser.py',619),
+  ('block_item_list -> block_item','block_item_list',1,'p_block_item_list','uc_parser.py',624),
+  ('block_item_list -> block_item_list block_item','block_item_list',2,'p_block_item_list','uc_parser.py',625),
+  ('block_item -> declaration','block_item',1,'p_block_item','uc_parser.py',631),
+  ('block_item -> statement','block_item',1,'p_block_item','uc_parser.py',632),
+  ('block_item -> error SEMI','block_item',2,'p_block_item_error','uc_parser.py',638),
+  ('block_item -> error brace_group','block_item',2,'p_block_item_error','uc_parser.py',639),
+  ('block_item -> resync declaration','block_item',2,'p_block_item_resync','uc_parser.py',646),
+  ('statement -> expression_statement','statement',1,'p_statement','uc_parser.py',651),
+  ('statement -> compound_statement','statement',1,'p_statement','uc_parser.py',652),
+  ('statement -> selection_statement','statement',1,'p_statement','uc_parser.py',653),
+  ('statement -> interation_statement','statement',1,'p_statement','uc_parser.py',654),
+  ('statement -> jump_statement','statement',1,'p_statement','uc_parser.py',655),
+  ('statement -> assert_statement','statement',1,'p_statement','uc_parser.py',656),
+  ('statement -> print_statement','statement',1,'p_statement','uc_parser.py',657),
+  ('statement -> read_statement','statement',1,'p_statement','uc_parser.py',658),
+  ('expression_statement -> expression_opt SEMI','expression_statement',2,'p_expression_statement','uc_parser.py',663),
+  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','uc_parser.py',670),
+  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','uc_parser.py',671),
+  ('selection_statement -> IF LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement_1','uc_parser.py',676),
+  ('selection_statement -> IF LPAREN expression RPAREN statement ELSE statement','selection_statement',7,'p_selection_statement_2','uc_parser.py',681),
+  ('interation_statement -> WHILE LPAREN expression RPAREN statement','interation_statement',5,'p_interation_statement_1','uc_parser.py',686),
+  ('interation_statement -> FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN statement','interation_statement',9,'p_interation_statement_2','uc_parser.py',691),
+  ('interation_statement -> FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN statement','interation_statement',8,'p_interation_statement_3','uc_parser.py',696),
+  ('jump_statement -> BREAK SEMI','jump_statement',2,'p_jump_statement_1','uc_parser.py',701),
+  ('jump_statement -> RETURN expression_opt SEMI','jump_statement',3,'p_jump_statement_2','uc_parser.py',706),
+  ('assert_statement -> ASSERT expression SEMI','assert_statement',3,'p_assert_statement_2','uc_parser.py',711),
+  ('print_statement -> PRINT LPAREN expression_opt RPAREN SEMI','print_statement',5,'p_print_statement','uc_parser.py',716),
+  ('read_statement -> READ LPAREN argument_expression RPAREN SEMI','read_statement',5,'p_read_statement','uc_parser.py',721),
+  ('empty -> <empty>','empty',0,'p_empty','uc_parser.py',726),
 ]
@@ -9,11 +9,17 @@
 # ============================================================
 
 import sys
+import copy
+import hashlib
 from contextlib import contextmanager
+from uc_ast import Program, GlobalDecl, Decl, VarDecl, FuncDecl, shift_lines
 from uc_parser import UCParser
-from uc_sema import Visitor
-from uc_code import GenerateCode
+from uc_rdparser import UCRDParser
+from uc_sema import Visitor, TooManyErrors, check_parallel
+from uc_code import GenerateCode, reset
 from uc_interpreter import Interpreter
+from uc_cache import CompilationCache
+from uc_ir import write_ir, read_ir, write_ucb, read_ucb, IRError, UCBError
 
 """
 One of the most important (and difficult) parts of writing a compiler
@@ -112,59 +118,312 @@ def subscribe_errors(handler):
         _subscribers.remove(handler)
 
 
+class CompiledUnit(object):
+    """ A top-level unit (global declaration or function definition)
+        kept by the incremental compiler: its decorated AST, the line
+        it was parsed at, the global symbols it declares with their
+        side table entries and signatures, and the code generated for
+        its function, by name (see uc_code.FunctionCode).
+    """
+    __slots__ = ('key', 'gdecls', 'lineno', 'symbols', 'entries', 'signatures', 'code')
+
+    def __init__(self, key, gdecls, lineno, symbols, entries, signatures):
+        self.key = key
+        self.gdecls = gdecls
+        self.lineno = lineno
+        self.symbols = symbols
+        self.entries = entries
+        self.signatures = signatures
+        self.code = {}
+
+
+def _signature(decl, symbol):
+    """ What the units referring to a global see of it: its storage,
+        type and shape, and the types of the parameters of a function.
+    """
+    _parts = [symbol.storage, symbol.type, symbol.dims]
+    _type = decl.type
+    while not isinstance(_type, (VarDecl, FuncDecl)):
+        _type = _type.type
+    if isinstance(_type, FuncDecl) and _type.args is not None:
+        _parts.extend(_arg.name.type.names if isinstance(_arg, Decl) else None
+                      for _arg in _type.args)
+    return repr(_parts)
+
+
 class Compiler:
     """ This object encapsulates the compiler and serves as a
         facade interface for the compiler itself.
+
+        When incremental is set, the compiler keeps the decorated AST
+        of every top-level unit between calls to compile, and only the
+        units that changed since the last call (or that refer to
+        globals whose signature changed) are parsed and checked again.
+        A unit that only moved is reused, with its lines shifted. The
+        uCIR of the functions is kept too, and only generated again for
+        the ones that changed or moved: the line of an assert is in the
+        code. The uCIR is the same as when not compiling incrementally.
+
+        When rd_parser is set, the source is parsed by the hand-written
+        recursive descent parser (UCRDParser) instead of the PLY one.
+        Both build the same tree.
+
+        When jobs > 1, large sources are parsed in that many processes,
+        each parsing a group of top-level units. The same processes
+        check the bodies of the functions, once the global declarations
+        and the function signatures have been checked.
+
+        The semantic analysis stops after max_errors errors, or goes
+        on to report all of them if max_errors is 0.
+
+        When check_bounds is set, the array references the code
+        generator can't prove in bounds are checked when run, and an
+        out of bounds index stops the program.
+
+        When prune is set, no code is generated for the functions and
+        globals main can't reach.
     """
 
-    def __init__(self):
+    def __init__(self, incremental=False, cache=None, fast_lexer=False, rd_parser=False, jobs=1, max_errors=1,
+                 check_bounds=False, prune=True):
         self.total_errors = 0
         self.total_warnings = 0
+        self.incremental = incremental
+        self.units = {}
+        # The sids of the global names, kept from one incremental
+        # compile to the next so that the reused units stay bound
+        self.sids = {}
+        self.cache = cache
+        self.fast_lexer = fast_lexer
+        self.rd_parser = rd_parser
+        self.jobs = jobs
+        self.max_errors = max_errors
+        self.check_bounds = check_bounds
+        self.prune = prune
+
+    def _make_parser(self):
+        return (UCRDParser if self.rd_parser else UCParser)(self.fast_lexer)
 
     def _parse(self, susy, ast_file, debug):
         """ Parses the source code. If ast_file != None,
             or running at susy machine,
             prints out the abstract syntax tree.
         """
-        self.parser = UCParser()
-        self.ast = self.parser.parse(self.code, '', debug)
+        self.parser = self._make_parser()
+        self.sema = None
+        if self.jobs > 1:
+            # The tree may come back checked already, see _sema
+            self.ast, self.sema = check_parallel(self.parser, self.code, self.jobs, self.max_errors)
+        else:
+            self.ast = self.parser.parse(self.code, '', debug)
+        self._report_syntax_errors()
+
+    def _report_syntax_errors(self):
+        """ Reports the errors found by the last parse. """
+        for coord, msg in self.parser.errors:
+            if coord is None:
+                error(None, msg)
+            else:
+                error(None, f"{coord.line}:{coord.column} - {msg}")
         
     def _sema(self, susy, ast_file):
         """ Decorate AST with semantic actions. If ast_file != None,
             or running at susy machine,
             prints out the abstract syntax tree. """
-        try:
-            self.sema = Visitor()
-            self.sema.visit(self.ast)
-            if not susy and ast_file is not None:
-                self.ast.show(buf=ast_file, showcoord=True)
-        except AssertionError as e:
-            error(None, e)
-
-    def _gencode(self, susy, ir_file):
-        """ Generate uCIR Code for the decorated AST. """
-        self.gen = GenerateCode()
+        if self.sema is None:
+            self.sema = Visitor(self.max_errors)
+            self.sema.recovered = len(self.parser.errors) > 0
+            self.sema.dropped = self.parser.dropped
+            try:
+                self.sema.visit(self.ast)
+            except TooManyErrors:
+                pass
+        # The partial tree left by syntax errors isn't shown
+        if not self._report_semantic_errors() and not self.parser.errors:
+            self._emit_ast(susy, ast_file)
+
+    def _report_semantic_errors(self, start=0):
+        """ Reports the errors found by sema from the start-th on, and
+            returns whether there was any.
+        """
+        _errors = self.sema.errors[start:]
+        for _diagnostic in _errors:
+            error(None, _diagnostic)
+        return len(_errors) > 0
+
+    def _gencode(self, susy, ir_file, units=None):
+        """ Generate uCIR Code for the decorated AST. The code of the
+            functions of units is reused, and then kept in them.
+        """
+        _reuse = None
+        if units is not None:
+            _reuse = {}
+            for _unit in units:
+                _reuse.update(_unit.code)
+        self.gen = GenerateCode(self.sema.environment.symbols, self.check_bounds, self.prune, _reuse)
         self.gen.visit(self.ast)
         self.gencode = self.gen.code
-        _str = ''
+        if units is not None:
+            _functions = self.gen.functions
+            for _unit in units:
+                _unit.code = {_name: _functions[_name] for _name in _unit.symbols if _name in _functions}
+        self._emit_ir(susy, ir_file)
+
+    def _emit_ast(self, susy, ast_file):
+        """ Prints out the decorated AST, if ast_file != None. """
+        if not susy and ast_file is not None:
+            self.ast.show(buf=ast_file, showcoord=True)
+
+    def _emit_ir(self, susy, ir_file):
+        """ Prints out the uCIR code, if ir_file != None. """
         if not susy and ir_file is not None:
-            for _code in self.gencode:
-                _str += f"{_code}\n"
-            ir_file.write(_str)
+            write_ir(self.gencode, ir_file)
             
+    def _unit_key(self, text, column, names, signatures):
+        """ Computes the cache key of a unit from its source span, the
+            column it starts at and the signatures of the globals it
+            refers to. The line is left out: a unit that only moved is
+            reused, see shift_lines.
+        """
+        _hash = hashlib.sha1(text.encode())
+        _hash.update(f"{column}".encode())
+        for _name in sorted(names):
+            _hash.update(f"|{_name}={signatures.get(_name)}".encode())
+        return _hash.hexdigest()
+
+    def _compile_unit(self, key, text, lineno, column, debug):
+        """ Parses and checks a single unit. Returns the compiled unit,
+            or None if an error was found (the syntax errors are left
+            in self.parser.errors, the semantic ones in self.sema.errors).
+        """
+        _ast = self.parser.parse_unit(text, lineno, column, debug)
+        if _ast is None or self.parser.errors:
+            return None
+        _errors = len(self.sema.errors)
+        for _decl in _ast.gdecls:
+            self.sema.check(_decl)
+        if len(self.sema.errors) > _errors:
+            return None
+        environment = self.sema.environment
+        _scope = environment.peek()
+        _symbols = {}
+        _signatures = {}
+        for _decl in _ast.gdecls:
+            for _d in ((_decl.decls or ()) if isinstance(_decl, GlobalDecl) else [_decl.decl]):
+                _name = _symbols[_d.name.name] = _scope[_d.name.name]
+                _signatures[_d.name.name] = _signature(_d, environment.symbol(_name))
+        # Copies: a later unit may change the symbol (a definition
+        # completes the symbol of its prototype)
+        _entries = [copy.copy(environment.symbol(_name)) for _name in _symbols.values()]
+        return CompiledUnit(key, _ast.gdecls, lineno, _symbols, _entries, _signatures)
+
+    def _do_incremental_compile(self, susy, ast_file, ir_file, debug):
+        """ Compiles the code unit by unit, reusing the units of the
+            previous compilation whose key did not change. The errors
+            are the same as when not compiling incrementally: the
+            semantic ones are reported at the end. Returns False,
+            having reported nothing, if a unit has syntax errors, or if
+            there is a lexical error between units: the code is then to
+            be compiled as a whole.
+        """
+        if not hasattr(self, 'parser'):
+            self.parser = self._make_parser()
+        _split = self.parser.split_units(self.code)
+        if _split is None:
+            return False
+        self.sema = Visitor(self.max_errors)
+        environment = self.sema.environment
+        environment.sids = self.sids
+        environment.symbols = [None] * len(self.sids)
+        self.ast = Program([])
+        environment.push(self.ast)
+        self.ast.symtab = environment.peek_root()
+        _scope = environment.peek()
+
+        _units = {}
+        _signatures = {}
+        _stopped = False
+        _syntax = False
+        for (start, end, lineno, column, names) in _split:
+            _text = self.code[start:end]
+            if _stopped:
+                # Only look for the syntax errors of the remaining units
+                self.parser.parse_unit(_text, lineno, column, debug)
+                _syntax = len(self.parser.errors) > 0
+                if _syntax:
+                    break
+                continue
+            _key = self._unit_key(_text, column, names, _signatures)
+            # A unit appearing twice in the source is compiled again
+            _unit = self.units.get(_key) if _key not in _units else None
+            if _unit is not None:
+                if _unit.lineno != lineno:
+                    shift_lines(_unit.gdecls, lineno - _unit.lineno)
+                    _unit.lineno = lineno
+                    _unit.code = {}
+                if not _unit.code:
+                    reset(_unit.gdecls)
+                _scope.update(_unit.symbols)
+                environment.adopt(_unit.symbols.values(), _unit.entries)
+            else:
+                try:
+                    _unit = self._compile_unit(_key, _text, lineno, column, debug)
+                except TooManyErrors:
+                    _stopped = True
+                    continue
+                _syntax = len(self.parser.errors) > 0
+                if _syntax:
+                    break
+                if _unit is None:
+                    continue
+            _units[_key] = _unit
+            self.ast.gdecls.extend(_unit.gdecls)
+            _signatures.update(_unit.signatures)
+        environment.pop()
+        if _syntax:
+            # The units kept so far stay for the next compile
+            self.units.update(_units)
+            return False
+        self.units = _units
+        if not self._report_semantic_errors():
+            self._emit_ast(susy, ast_file)
+            self._gencode(susy, ir_file, _units.values())
+        return True
+
+    def _flags(self):
+        """ Returns the options that change the compiler output. """
+        return (('fast_lexer', self.fast_lexer), ('rd_parser', self.rd_parser),
+                ('check_bounds', self.check_bounds), ('prune', self.prune))
+
     def _do_compile(self, susy, ast_file, ir_file, debug):
         """ Compiles the code to the given file object. """
-        self._parse(susy, ast_file, debug)
-        if not errors_reported():
-            self._sema(susy, ast_file)
-        if not errors_reported():
-            self._gencode(susy, ir_file)
-
-    def compile(self, code, susy, ast_file, ir_file, run_ir, debug):
+        if self.cache is not None:
+            _key = self.cache.key(self.code, self._flags())
+            _entry = self.cache.load(_key)
+            if _entry is not None:
+                self.ast, self.gencode = _entry
+                self._emit_ast(susy, ast_file)
+                self._emit_ir(susy, ir_file)
+                return
+        if not self.incremental or not self._do_incremental_compile(susy, ast_file, ir_file, debug):
+            self._parse(susy, ast_file, debug)
+            # After syntax errors the partial tree is still checked,
+            # but no code is generated for it
+            if self.ast is not None:
+                self._sema(susy, ast_file)
+            if not errors_reported():
+                self._gencode(susy, ir_file)
+        if self.cache is not None and not errors_reported():
+            self.cache.store(_key, self.ast, self.gencode)
+
+    def compile(self, code, susy, ast_file, ir_file, run_ir, debug, ucb_file=None):
         """ Compiles the given code string """
         self.code = code
+        clear_errors()
         with subscribe_errors(lambda msg: sys.stderr.write(msg+"\n")):
             self._do_compile(susy, ast_file, ir_file, debug)
+            if not errors_reported() and ucb_file is not None:
+                write_ucb(self.gencode, ucb_file)
             if errors_reported():
                 sys.stderr.write("{} error(s) encountered.".format(errors_reported()))
             elif run_ir:
@@ -177,14 +436,24 @@ def run_compiler():
     """ Runs the command-line compiler. """
 
     if len(sys.argv) < 2:
-        print("Usage: ./uc <source-file> [-at-susy] [-no-ast] [-no-ir] [-no-run] [-debug]")
+        print("Usage: ./uc <source-file> [-at-susy] [-no-ast] [-no-ir] [-no-run] [-no-prune] [-ucb] [-run-ir] [-cache] [-fast-lexer] [-rd-parser] [-incremental] [-j<jobs>] [-max-errors<n>] [-check-bounds] [-debug]")
         sys.exit(1)
 
     emit_ast = True
     emit_ir = True
+    emit_ucb = False
     run_ir = True
     susy = False
     debug = False
+    cache = None
+    ir_input = False
+    fast_lexer = False
+    rd_parser = False
+    jobs = 1
+    max_errors = 1
+    check_bounds = False
+    prune = True
+    incremental = False
 
     params = sys.argv[1:]
     files = sys.argv[1:]
@@ -199,14 +468,57 @@ def run_compiler():
                 susy = True
             elif param == '-no-run':
                 run_ir = False
+            elif param == '-no-prune':
+                prune = False
+            elif param == '-ucb':
+                emit_ucb = True
+            elif param == '-run-ir':
+                ir_input = True
+            elif param == '-fast-lexer':
+                fast_lexer = True
+            elif param == '-rd-parser':
+                rd_parser = True
+            elif param == '-incremental':
+                incremental = True
+            elif param[:2] == '-j' and param[2:].isdigit():
+                jobs = int(param[2:])
+            elif param[:11] == '-max-errors' and param[11:].isdigit():
+                max_errors = int(param[11:])
+            elif param == '-check-bounds':
+                check_bounds = True
             elif param == '-debug':
                 debug = True
+            elif param == '-cache':
+                cache = CompilationCache('__uccache__')
             else:
                 print("Unknown option: %s" % param)
                 sys.exit(1)
             files.remove(param)
 
+    # With -incremental, every file reuses the units of the ones before
+    compiler = None
+    retval = 0
     for file in files:
+        if ir_input:
+            # Textual uCIR: read it back and run it
+            with open(file, 'r') as f:
+                try:
+                    code = read_ir(f)
+                except IRError as e:
+                    print("%s:%s" % (file, e))
+                    sys.exit(1)
+            Interpreter().run(code)
+            continue
+        if file[-4:] == '.ucb':
+            # Precompiled uCIR: run it straight away
+            with open(file, 'rb') as f:
+                try:
+                    code = read_ucb(f)
+                except UCBError as e:
+                    print("%s:%s" % (file, e))
+                    sys.exit(1)
+            Interpreter().run(code)
+            continue
         if file[-3:] == '.uc':
             source_filename = file
         else:
@@ -228,11 +540,22 @@ def run_compiler():
             ir_file = open(ir_filename, 'w')
             open_files.append(ir_file)
 
+        ucb_file = None
+        if emit_ucb and not susy:
+            ucb_filename = source_filename[:-3] + '.ucb'
+            print("Outputting the binary uCIR to %s." % ucb_filename)
+            ucb_file = open(ucb_filename, 'wb')
+            open_files.append(ucb_file)
+
         source = open(source_filename, 'r')
         code = source.read()
         source.close()
 
-        retval = Compiler().compile(code, susy, ast_file, ir_file, run_ir, debug)
+        if compiler is None or not incremental:
+            compiler = Compiler(cache=cache, fast_lexer=fast_lexer, rd_parser=rd_parser, jobs=jobs,
+                                max_errors=max_errors, check_bounds=check_bounds, prune=prune,
+                                incremental=incremental)
+        retval = compiler.compile(code, susy, ast_file, ir_file, run_ir, debug, ucb_file)
         for f in open_files:
             f.close()
         if retval != 0:
@@ -1,4 +1,5 @@
 import sys
+from inspect import isgeneratorfunction
 
 def _repr(obj):
     """
@@ -9,6 +10,33 @@ def _repr(obj):
     else:
         return repr(obj)
 
+class ChunkedWriter(object):
+    """
+    Collects the small strings written to it and forwards them to the
+    underlying buffer in chunks of about chunk_size characters, so
+    dumping a big tree or program costs one write per chunk instead of
+    one per fragment, while holding at most one chunk in memory.
+    """
+    __slots__ = ('buf', 'chunk_size', 'parts', 'size')
+
+    def __init__(self, buf, chunk_size=1 << 16):
+        self.buf = buf
+        self.chunk_size = chunk_size
+        self.parts = []
+        self.size = 0
+
+    def write(self, text):
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            self.buf.write(''.join(self.parts))
+            self.parts = []
+            self.size = 0
+
 class Node(object):
     """
     Base class example for the AST nodes.
@@ -19,8 +47,32 @@ class Node(object):
     The __slots__ declaration takes a sequence of instance variables and reserves
     just enough space in each instance to hold a value for each variable.
     Space is saved because __dict__ is not created for each instance.
+
+    Every node class lists all its fields in __slots__: the ones set by
+    the parser, and the ones filled in later by the semantic analysis
+    (type, scope, kind, bind, sid, symtab, decls, symbols, refs) and the code
+    generator (gen_location, exit_label, value). __init__ sets all of
+    them, so no field is ever missing. attr_names are the fields shown
+    by show() and repr_names the ones shown by repr().
+
+    The coordinates are kept in pos, usually as an int packed by
+    pack_coord: the parsers build no Coord object at all, and the
+    coord property materializes one when it is read.
     """
     __slots__ = ()
+    attr_names = ()
+    repr_names = ()
+
+    @property
+    def coord(self):
+        pos = self.pos
+        if pos.__class__ is int:
+            return coord_at(pos)
+        return pos
+
+    @coord.setter
+    def coord(self, coord):
+        self.pos = coord
 
     def __repr__(self):
         """ Generates a python representation of the current node
@@ -29,7 +81,7 @@ class Node(object):
         indent = ''
         separator = ''
         
-        for name in self.__slots__[:-2]:
+        for name in self.repr_names:
             result += separator
             result += indent
             
@@ -59,60 +111,160 @@ class Node(object):
             showcoord:
                 Do you want the coordinates of each Node to be displayed.
         """
-        lead = ' ' * offset
-        if nodenames and _my_node_name is not None:
-            buf.write(lead + self.__class__.__name__+ ' <' + _my_node_name + '>: ')
-        else:
-            buf.write(lead + self.__class__.__name__+ ': ')
-
-        if self.attr_names:
-            if attrnames:
-                nvlist = [(n, getattr(self, n)) for n in self.attr_names if getattr(self, n) is not None]
-                attrstr = ', '.join('%s=%s' % nv for nv in nvlist)
+        if not isinstance(buf, ChunkedWriter):
+            out = ChunkedWriter(buf)
+            self.show(out, offset, attrnames, nodenames, showcoord, _my_node_name)
+            out.flush()
+            return
+
+        def write(node, name, depth):
+            lead = ' ' * (offset + 4 * depth)
+            if nodenames and name is not None:
+                line = lead + node.__class__.__name__+ ' <' + name + '>: '
             else:
-                vlist = [getattr(self, n) for n in self.attr_names]
-                attrstr = ', '.join('%s' % v for v in vlist)
-            buf.write(attrstr)
-
-        if showcoord:
-            if self.coord:
-                buf.write('%s' % self.coord)
-        buf.write('\n')
-        for (child_name, child) in self.children():
-            child.show(buf, offset + 4, attrnames, nodenames, showcoord, child_name)
+                line = lead + node.__class__.__name__+ ': '
+
+            if node.attr_names:
+                if attrnames:
+                    nvlist = [(n, getattr(node, n)) for n in node.attr_names if getattr(node, n) is not None]
+                    line += ', '.join('%s=%s' % nv for nv in nvlist)
+                else:
+                    vlist = [getattr(node, n) for n in node.attr_names]
+                    line += ', '.join(str(v) for v in vlist)
+
+            if showcoord:
+                if node.coord:
+                    line += '%s' % node.coord
+            buf.write(line + '\n')
+
+        walk(self, write, name=_my_node_name)
+
+
+def walk(node, pre=None, post=None, name=None):
+    """ Walks the tree rooted at node, depth first, on an explicit stack
+        instead of the Python one, so trees of any depth can be walked.
+        pre(node, name, depth) is called before the children of a node
+        are walked, and post(node, name, depth) after them; name is the
+        one given by the children() of the parent. The children are
+        skipped when pre returns False.
+    """
+    stack = [(node, name, 0, False)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node, name, depth, done = pop()
+        if done:
+            post(node, name, depth)
+            continue
+        if pre is not None and pre(node, name, depth) is False:
+            continue
+        if post is not None:
+            push((node, name, depth, True))
+        children = node.children()
+        for i in range(len(children) - 1, -1, -1):
+            child_name, child = children[i]
+            push((child, child_name, depth + 1, False))
+
+
+# Returned by next() when a generator visit method is over
+_done = object()
 
 
 class NodeVisitor(object):
-   
+    """ Base class of the passes over the tree. visit(node) calls the
+        visit_<class name> method of the node, or generic_visit.
+
+        A visit method may be a generator: it visits a child by
+        yielding it, and is resumed once the child has been visited.
+        visit() runs nested generator methods on an explicit stack, so
+        deeply nested expressions and long else if chains don't grow
+        the Python stack. An exception raised by the visit of a child
+        is raised at the yield in its parent. The visit of a node with
+        a generator method returns None.
+    """
 
     _method_cache = None
 
-    def visit(self, node):
-        """ Visit a node.
+    def _visitor(self, node):
+        """ Returns the visit method of node, and whether it is a
+            generator.
         """
         if self._method_cache is None:
             self._method_cache = {}
 
-        visitor = self._method_cache.get(node.__class__.__name__, None)
+        visitor = self._method_cache.get(node.__class__, None)
         if visitor is None:
-            method = 'visit_' + node.__class__.__name__
-            visitor = getattr(self, method, self.generic_visit)
-            self._method_cache[node.__class__.__name__] = visitor
+            method = getattr(self, 'visit_' + node.__class__.__name__, self.generic_visit)
+            visitor = (method, isgeneratorfunction(method))
+            self._method_cache[node.__class__] = visitor
+        return visitor
 
-        return visitor(node)
+    def visit(self, node):
+        """ Visit a node.
+        """
+        method, nested = self._visitor(node)
+        if not nested:
+            return method(node)
+        return self._run(method(node))
+
+    def _run(self, gen):
+        # gen is the running generator, stack holds its callers. The
+        # generators are resumed with next(gen, _done), which doesn't
+        # raise StopIteration when they return.
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        get = self._method_cache.get
+        error = None
+        while True:
+            if error is None:
+                try:
+                    child = next(gen, _done)
+                except BaseException as e:
+                    child = _done
+                    error = e
+            else:
+                try:
+                    child = gen.throw(error)
+                    error = None
+                except StopIteration:
+                    child = _done
+                    error = None
+                except BaseException as e:
+                    child = _done
+                    error = e
+            if child is _done:
+                if not stack:
+                    if error is not None:
+                        raise error
+                    return None
+                gen = pop()
+                continue
+            visitor = get(child.__class__)
+            if visitor is None:
+                visitor = self._visitor(child)
+            method, nested = visitor
+            if nested:
+                push(gen)
+                gen = method(child)
+            else:
+                try:
+                    method(child)
+                except BaseException as e:
+                    error = e
 
     def generic_visit(self, node):
         for c in node:
             print("Generic_visit: {0}".format(c))
-            self.visit(c)
+            yield c
 
             
 class VarDecl(Node):
-    __slots__ = ('declname', 'type', 'coord', 'gen_location')
+    __slots__ = ('declname', 'type', 'pos', 'gen_location')
     def __init__(self, declname, type, coord=None):
         self.declname = declname
         self.type = type
-        self.coord = coord
+        self.pos = coord
         self.gen_location = None
 
     def children(self):
@@ -121,13 +273,14 @@ class VarDecl(Node):
         return tuple(nodelist)
 
     attr_names = ('declname', 'type', 'coord')
+    repr_names = ('declname', 'type')
 
 class ArrayDecl(Node):
-    __slots__ = ('type', 'dim', 'coord')
+    __slots__ = ('type', 'dim', 'pos')
     def __init__(self, type, dim, coord=None):
         self.type = type
         self.dim = dim
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -142,13 +295,14 @@ class ArrayDecl(Node):
             yield self.dim
 
     attr_names = ()
+    repr_names = ('type',)
             
 class ArrayRef(Node):
-    __slots__ = ('name', 'subscript', 'coord', 'bind', 'type', 'kind', 'gen_location')
+    __slots__ = ('name', 'subscript', 'pos', 'bind', 'type', 'kind', 'gen_location')
     def __init__(self, name, subscript, coord=None):
         self.name = name
         self.subscript = subscript
-        self.coord = coord
+        self.pos = coord
         self.bind = None
         self.type = None
         self.kind = None
@@ -167,14 +321,17 @@ class ArrayRef(Node):
             yield self.subscript
 
     attr_names = ()
+    repr_names = ('name', 'subscript', 'coord', 'bind', 'type')
 
 class Assignment(Node):
-    __slots__ = ('op', 'lvalue', 'rvalue', 'coord')
+    __slots__ = ('op', 'lvalue', 'rvalue', 'pos', 'type', 'gen_location')
     def __init__(self, op, lvalue, rvalue, coord=None):
         self.op = op
         self.lvalue = lvalue
         self.rvalue = rvalue
-        self.coord = coord
+        self.pos = coord
+        self.type = None
+        self.gen_location = None
 
     def children(self):
         nodelist = []
@@ -188,15 +345,16 @@ class Assignment(Node):
         if self.rvalue is not None:
             yield self.rvalue
 
-    attr_names = ('op', )           
+    attr_names = ('op', )
+    repr_names = ('op', 'lvalue')
             
 class BinaryOp(Node):
-    __slots__ = ('op', 'left', 'right', 'coord', 'type', 'gen_location')
+    __slots__ = ('op', 'left', 'right', 'pos', 'type', 'gen_location')
     def __init__(self, op, left, right, coord=None):
         self.op = op
         self.left = left
         self.right = right
-        self.coord = coord
+        self.pos = coord
         self.type = None
         self.gen_location =  None
 
@@ -213,11 +371,13 @@ class BinaryOp(Node):
             yield self.right 
             
     attr_names = ('op', )
+    repr_names = ('op', 'left', 'right', 'coord')
             
 class Break(Node):
-    __slots__ = ('coord')
+    __slots__ = ('pos', 'bind')
     def __init__(self, coord=None):
-        self.coord = coord
+        self.pos = coord
+        self.bind = None
 
     def children(self):
         return ()
@@ -227,13 +387,14 @@ class Break(Node):
         yield
 
     attr_names = ()
+    repr_names = ()
 
 class Cast(Node):
-    __slots__ = ('to_type', 'expr', 'coord', 'type', 'gen_location')
+    __slots__ = ('to_type', 'expr', 'pos', 'type', 'gen_location')
     def __init__(self, to_type, expr, coord=None):
         self.to_type = to_type
         self.expr = expr
-        self.coord = coord
+        self.pos = coord
         self.type = None
         self.gen_location = None
 
@@ -250,12 +411,13 @@ class Cast(Node):
             yield self.expr
 
     attr_names = ()
+    repr_names = ('to_type', 'expr', 'coord')
 
 class Compound(Node):
-    __slots__ = ('block_items', 'coord')
+    __slots__ = ('block_items', 'pos')
     def __init__(self, block_items, coord=None):
         self.block_items = block_items
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -268,13 +430,14 @@ class Compound(Node):
             yield child
 
     attr_names = ()
+    repr_names = ()
           
 class Constant(Node):
-    __slots__ = ('type', 'value', 'coord', 'rawtype', 'gen_location')
+    __slots__ = ('type', 'value', 'pos', 'rawtype', 'gen_location')
     def __init__(self, type, value, coord=None):
         self.type = type
         self.value = value
-        self.coord = coord
+        self.pos = coord
         self.rawtype = type
         self.gen_location = None
         
@@ -287,15 +450,16 @@ class Constant(Node):
         yield
 
     attr_names = ('type', 'value')
+    repr_names = ('type', 'value', 'coord')
 
 
 class Decl(Node):
-    __slots__ = ('name', 'type', 'init', 'coord')
+    __slots__ = ('name', 'type', 'init', 'pos')
     def __init__(self, name, type, init, coord=None):
         self.name = name
         self.type = type
         self.init = init
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -310,12 +474,13 @@ class Decl(Node):
             yield self.init
 
     attr_names = ('name',)
+    repr_names = ('name', 'type')
 
 class DeclList(Node):
-    __slots__ = ('decls', 'coord')
+    __slots__ = ('decls', 'pos')
     def __init__(self, decls, coord=None):
         self.decls = decls
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -328,11 +493,12 @@ class DeclList(Node):
             yield child
 
     attr_names = ()
+    repr_names = ()
 
 class EmptyStatement(Node):
-    __slots__ = ('coord')
+    __slots__ = ('pos',)
     def __init__(self, coord=None):
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         return ()
@@ -342,12 +508,15 @@ class EmptyStatement(Node):
         yield
 
     attr_names = ()
+    repr_names = ()
 
 class ExprList(Node):
-    __slots__ = ('exprs', 'coord')
+    __slots__ = ('exprs', 'pos', 'type', 'gen_location')
     def __init__(self, exprs, coord=None):
         self.exprs = exprs
-        self.coord = coord
+        self.pos = coord
+        self.type = None
+        self.gen_location = None
 
     def children(self):
         nodelist = []
@@ -359,16 +528,17 @@ class ExprList(Node):
         for child in (self.exprs or []):
             yield child
 
-    attr_names = ()            
+    attr_names = ()
+    repr_names = ()
 
 class For(Node):
-    __slots__ = ('init', 'cond', 'next', 'stmt', 'coord', 'exit_label')
+    __slots__ = ('init', 'cond', 'next', 'stmt', 'pos', 'exit_label')
     def __init__(self, init, cond, next, stmt, coord=None):
         self.init = init
         self.cond = cond
         self.next = next
         self.stmt = stmt
-        self.coord = coord
+        self.pos = coord
         self.exit_label = None
 
     def children(self):
@@ -389,14 +559,15 @@ class For(Node):
         if self.stmt is not None:
             yield self.stmt
 
-    attr_names = ()           
+    attr_names = ()
+    repr_names = ('init', 'cond', 'next', 'stmt')
             
 class FuncCall(Node):
-    __slots__ = ('name', 'args', 'coord', 'type', 'gen_location')
+    __slots__ = ('name', 'args', 'pos', 'type', 'gen_location')
     def __init__(self, name, args, coord=None):
         self.name = name
         self.args = args
-        self.coord = coord
+        self.pos = coord
         self.type = None
         self.gen_location = None
 
@@ -413,13 +584,14 @@ class FuncCall(Node):
             yield self.args
 
     attr_names = ()
+    repr_names = ('name', 'args', 'coord')
 
 class FuncDecl(Node):
-    __slots__ = ('args', 'type', 'coord', 'gen_location')
+    __slots__ = ('args', 'type', 'pos', 'gen_location')
     def __init__(self, args, type, coord=None):
         self.args = args
         self.type = type
-        self.coord = None
+        self.pos = None
         self.gen_location = None
         
     def children(self):
@@ -434,17 +606,20 @@ class FuncDecl(Node):
         if self.type is not None:
             yield self.type
 
-    attr_names = ()  
+    attr_names = ()
+    repr_names = ('args', 'type')
 
 class FuncDef(Node):
-    __slots__ = ('spec', 'decl', 'param_decls', 'body', 'coord', 'decls')
+    __slots__ = ('spec', 'decl', 'param_decls', 'body', 'pos', 'decls', 'symbols', 'refs')
     def __init__(self, spec, decl, param_decls, body, coord=None):
         self.spec = spec
         self.decl = decl
         self.param_decls = param_decls
         self.body = body
-        self.coord = coord
+        self.pos = coord
         self.decls = None
+        self.symbols = None
+        self.refs = None
 
     def children(self):
         nodelist = []
@@ -465,17 +640,19 @@ class FuncDef(Node):
         for child in (self.param_decls or []):
             yield child
 
-    attr_names = ()         
+    attr_names = ()
+    repr_names = ('spec', 'decl', 'param_decls', 'body')
             
 class ID(Node):
-    __slots__ = ('name', 'coord', 'type', 'scope', 'kind', 'bind', 'gen_location')
+    __slots__ = ('name', 'pos', 'type', 'scope', 'kind', 'bind', 'sid', 'gen_location')
     def __init__(self, name, coord=None):
         self.name = name
-        self.coord = coord
+        self.pos = coord
         self.type = None
         self.scope = None
         self.kind = None
         self.bind = None
+        self.sid = None
         self.gen_location = None
         
     def children(self):
@@ -487,15 +664,16 @@ class ID(Node):
         yield
 
     attr_names = ('name', )
+    repr_names = ('name', 'coord', 'type', 'scope', 'kind')
 
 
 class If(Node):
-    __slots__ = ('cond', 'iftrue', 'iffalse', 'coord')
+    __slots__ = ('cond', 'iftrue', 'iffalse', 'pos')
     def __init__(self, cond, iftrue, iffalse, coord=None):
         self.cond = cond
         self.iftrue = iftrue
         self.iffalse = iffalse
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -512,13 +690,14 @@ class If(Node):
         if self.iffalse is not None:
             yield self.iffalse
 
-    attr_names = ()           
+    attr_names = ()
+    repr_names = ('cond', 'iftrue')
 
 class InitList(Node):
-    __slots__ = ('exprs', 'coord', 'value', 'gen_location')
+    __slots__ = ('exprs', 'pos', 'value', 'gen_location')
     def __init__(self, exprs, coord=None):
         self.exprs = exprs
-        self.coord = coord
+        self.pos = coord
         self.value = None
         self.gen_location = None
 
@@ -532,13 +711,14 @@ class InitList(Node):
         for child in (self.exprs or []):
             yield child
     
-    attr_names = () 
+    attr_names = ()
+    repr_names = ('exprs', 'coord')
             
 class ParamList(Node):
-    __slots__ = ('params', 'coord')
+    __slots__ = ('params', 'pos')
     def __init__(self, params, coord=None):
         self.params = params
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -550,13 +730,14 @@ class ParamList(Node):
         for child in (self.params or []):
             yield child
 
-    attr_names = ()       
+    attr_names = ()
+    repr_names = ()
 
 class GlobalDecl(Node):
-    __slots__ = ('decls', 'coord')
+    __slots__ = ('decls', 'pos')
     def __init__(self, decls, coord=None):
         self.decls = decls
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -569,13 +750,14 @@ class GlobalDecl(Node):
         if self.decls is not None:
             yield self.decls
 
-    attr_names = ()     
+    attr_names = ()
+    repr_names = ()
 
 class PtrDecl(Node):
-    __slots__ = ('type', 'coord')
+    __slots__ = ('type', 'pos')
     def __init__(self, quals, type, coord=None):
         self.type = type
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -586,13 +768,14 @@ class PtrDecl(Node):
         if self.type is not None:
             yield self.type
 
-    attr_names = ('quals', )
+    attr_names = ()
+    repr_names = ()
 
 class Return(Node):
-    __slots__ = ('expr', 'coord')
+    __slots__ = ('expr', 'pos')
     def __init__(self, expr, coord=None):
         self.expr = expr
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -603,14 +786,15 @@ class Return(Node):
         if self.expr is not None:
             yield self.expr
 
-    attr_names = ()          
+    attr_names = ()
+    repr_names = ()
 
 class UnaryOp(Node):
-    __slots__ = ('op', 'expr', 'coord', 'gen_location', 'type')
+    __slots__ = ('op', 'expr', 'pos', 'gen_location', 'type')
     def __init__(self, op, expr, coord=None):
         self.op = op
         self.expr = expr
-        self.coord = coord
+        self.pos = coord
         self.gen_location = None
         self.type = None
 
@@ -623,14 +807,15 @@ class UnaryOp(Node):
         if self.expr is not None:
             yield self.expr
 
-    attr_names = ('op', )           
+    attr_names = ('op', )
+    repr_names = ('op', 'expr', 'coord')
 
 class While(Node):
-    __slots__ = ('cond', 'stmt', 'coord', 'exit_label')
+    __slots__ = ('cond', 'stmt', 'pos', 'exit_label')
     def __init__(self, cond, stmt, coord=None):
         self.cond = cond
         self.stmt = stmt
-        self.coord = coord
+        self.pos = coord
         self.exit_label = None
 
     def children(self):
@@ -646,12 +831,13 @@ class While(Node):
             yield self.stmt
 
     attr_names = ()
+    repr_names = ('cond', 'stmt')
 
 class Type(Node):
-    __slots__ = ('names', 'coord')
+    __slots__ = ('names', 'pos')
     def __init__(self, names, coord=None):
         self.names = names
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -661,14 +847,15 @@ class Type(Node):
         return
         yield
 
-    attr_names = ('names', )       
+    attr_names = ('names', )
+    repr_names = ()
             
 class Program(Node):
-    __slots__ = ('gdecls', 'symtab', 'coord')
+    __slots__ = ('gdecls', 'symtab', 'pos')
     def __init__(self, gdecls, symtab=None, coord=None):
         self.gdecls = gdecls
         self.symtab = None
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -676,13 +863,14 @@ class Program(Node):
             nodelist.append(("gdecls[%d]" % i, child))
         return tuple(nodelist)
 
-    attr_names = ()           
+    attr_names = ()
+    repr_names = ('gdecls',)
           
 class Print(Node):
-    __slots__ = ('expr', 'coord')    
+    __slots__ = ('expr', 'pos')    
     def __init__(self, expr, coord=None):
         self.expr = expr
-        self.coord = coord
+        self.pos = coord
 
     def children(self):
         nodelist = []
@@ -690,25 +878,27 @@ class Print(Node):
         return tuple(nodelist)
 
     attr_names = ()
+    repr_names = ()
     
 class Read(Node):
-    __slots__ = ('names', 'coord')
+    __slots__ = ('names', 'pos')
     def __init__(self, names, coord=None):
         self.names = names
-        self.coord = coord
+        self.pos = coord
         
     def children(self):
         nodelist = []
-        if self.expr is not None: nodelist.append(("read", self.expr))
+        if self.names is not None: nodelist.append(("names", self.names))
         return tuple(nodelist)
 
     attr_names = ()
+    repr_names = ()
          
 class Assert(Node):
-    __slots__ = ('expr', 'coord')
+    __slots__ = ('expr', 'pos')
     def __init__(self, expr, coord=None):
         self.expr = expr
-        self.coord = coord
+        self.pos = coord
         
     def children(self):
         nodelist = []
@@ -716,7 +906,54 @@ class Assert(Node):
         return tuple(nodelist)
 
     attr_names = ()
+    repr_names = ()
             
+# A position packed in an int: the line in the high bits, the column
+# in the low COLUMN_BITS ones
+COLUMN_BITS = 32
+_COLUMN_MASK = (1 << COLUMN_BITS) - 1
+
+
+def pack_coord(line, column):
+    return (line << COLUMN_BITS) | column
+
+
+# Materialized Coords, shared by all the nodes at the same position.
+# Coords are never modified, so sharing them is safe.
+_coords = {}
+
+
+def coord_at(pos):
+    """ Returns the interned Coord of a position packed by pack_coord. """
+    coord = _coords.get(pos)
+    if coord is None:
+        if len(_coords) >= 1 << 16:
+            _coords.clear()
+        coord = _coords[pos] = Coord(pos >> COLUMN_BITS, pos & _COLUMN_MASK)
+    return coord
+
+
+def shift_lines(nodes, lines):
+    """ Moves the nodes, and every node under them, lines lines down
+        (up if lines is negative), as if the source they were parsed
+        from had moved.
+    """
+    _delta = lines << COLUMN_BITS
+    _seen = set()
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        if id(node) in _seen:
+            continue
+        _seen.add(id(node))
+        pos = node.pos
+        if pos.__class__ is int:
+            node.pos = pos + _delta
+        elif pos is not None:
+            node.pos = Coord(pos.line + lines, pos.column)
+        stack.extend(_child for _, _child in node.children())
+
+
 class Coord(object):
     """ Coordinates of a syntactic element. Consists of:
             - Line number
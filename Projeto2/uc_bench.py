@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# ============================================================
+# uc_bench.py -- Benchmarks for the uc compiler
+#
+# Generates synthetic uC programs of growing size and times the
+# phases of the compiler on them. Usage:
+#
+#     python uc_bench.py parse [lines]
+#     python uc_bench.py parallel [lines] [jobs]
+#     python uc_bench.py sema [lines]
+#     python uc_bench.py scopes [depth]
+# ============================================================
+
+import sys
+import time
+from uc_parser import UCParser
+from uc_rdparser import UCRDParser
+from uc_sema import Visitor
+
+_function = """int f{n}(int a, int b) {{
+    int i, s = 0;
+    for (i = 0; i < a; i++) {{
+        s = s + (i * b + {n}) % 7;
+        if (s > 100)
+            s = s - 100;
+    }}
+    while (b > 0)
+        b = b - 1;
+    return s + b;
+}}
+"""
+
+
+def generate(lines):
+    """ Returns a uC program with about the given number of lines. """
+    _count = max(1, lines // _function.count('\n'))
+    _funcs = [_function.format(n=n) for n in range(_count)]
+    _funcs.append("int main() {\n    return f0(3, 4);\n}\n")
+    return ''.join(_funcs)
+
+
+def generate_nested(depth, count=20):
+    """ Returns a uC program whose functions nest depth for loops,
+        each declaring its own variable and so opening a scope, with
+        the innermost statement using names of the outer scopes.
+    """
+    _funcs = ["int g = 1;\n"]
+    for n in range(count):
+        _body = "s = s + i0 + i%d + a + g;" % (depth - 1)
+        for k in reversed(range(depth)):
+            _body = "for (int i%d = 0; i%d < a; i%d++) {\n%s\n}" % (k, k, k, _body)
+        _funcs.append("int f%d(int a) {\nint s = 0;\n%s\nreturn s;\n}\n" % (n, _body))
+    _funcs.append("int main() {\n    return f0(1);\n}\n")
+    return ''.join(_funcs)
+
+
+def minify(code):
+    """ Puts the whole program in a single line. """
+    return ' '.join(code.split())
+
+
+def _time(func, *args):
+    _start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - _start
+
+
+def bench_parse(lines=100000):
+    """ Times the parser on programs of lines/4, lines/2 and lines
+        lines, and on the same programs written in a single line.
+        Parse time should grow linearly in both cases. Both parser
+        backends are timed: UCParser (PLY) and UCRDParser.
+    """
+    parser = UCParser()
+    rdparser = UCRDParser()
+    print("%10s %10s %10s %12s %10s %12s" % ("lines", "chars", "parse (s)", "us/char", "rd (s)", "us/char"))
+    for _shape in (lambda c: c, minify):
+        for _lines in (lines // 4, lines // 2, lines):
+            _code = _shape(generate(_lines))
+            _t = _time(parser.parse, _code)
+            _rd = _time(rdparser.parse, _code)
+            print("%10d %10d %10.2f %12.3f %10.2f %12.3f" % (_code.count('\n') + 1, len(_code),
+                  _t, 1e6 * _t / len(_code), _rd, 1e6 * _rd / len(_code)))
+
+
+def bench_parallel(lines=20000, jobs=4):
+    """ Times parse against parse_parallel with jobs workers, for
+        both parser backends, on a program of lines lines.
+    """
+    _code = generate(lines)
+    print("%10s %10s %14s" % ("", "parse (s)", "parallel (s)"))
+    for _parser in (UCParser(), UCRDParser()):
+        print("%10s %10.2f %14.2f" % (type(_parser).__name__, _time(_parser.parse, _code),
+              _time(_parser.parse_parallel, _code, jobs)))
+
+
+def bench_sema(lines=100000):
+    """ Times the semantic analysis alone on programs of lines/4,
+        lines/2 and lines lines, best of three runs on fresh trees.
+    """
+    parser = UCRDParser()
+    print("%10s %10s %12s" % ("lines", "sema (s)", "us/line"))
+    for _lines in (lines // 4, lines // 2, lines):
+        _code = generate(_lines)
+        _best = None
+        for _ in range(3):
+            _ast = parser.parse(_code)
+            _t = _time(Visitor().visit, _ast)
+            _best = _t if _best is None else min(_best, _t)
+        _lines = _code.count('\n')
+        print("%10d %10.2f %12.2f" % (_lines, _best, 1e6 * _best / _lines))
+
+
+def bench_scopes(depth=400):
+    """ Times the semantic analysis alone on functions nesting
+        depth/4, depth/2 and depth scopes, best of three runs on
+        fresh trees. Symbol lookup doesn't depend on the depth, so
+        the time per scope should stay flat. The trees are built by
+        UCParser, as UCRDParser recurses on the nesting of statements.
+    """
+    parser = UCParser()
+    print("%10s %10s %12s" % ("depth", "sema (s)", "us/scope"))
+    for _depth in (depth // 4, depth // 2, depth):
+        _code = generate_nested(_depth)
+        _best = None
+        for _ in range(3):
+            _ast = parser.parse(_code)
+            _t = _time(Visitor().visit, _ast)
+            _best = _t if _best is None else min(_best, _t)
+        print("%10d %10.2f %12.2f" % (_depth, _best, 1e6 * _best / (20 * _depth)))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in ('parse', 'parallel', 'sema', 'scopes'):
+        print("Usage: python uc_bench.py parse|parallel|sema|scopes [lines|depth] [jobs]")
+        sys.exit(1)
+    _args = [int(arg) for arg in sys.argv[2:4 if sys.argv[1] == 'parallel' else 3]]
+    if sys.argv[1] == 'parse':
+        bench_parse(*_args)
+    elif sys.argv[1] == 'parallel':
+        bench_parallel(*_args)
+    elif sys.argv[1] == 'sema':
+        bench_sema(*_args)
+    elif sys.argv[1] == 'scopes':
+        bench_scopes(*_args)
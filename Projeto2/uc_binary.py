@@ -0,0 +1,153 @@
+# ============================================================
+# uc_binary.py -- Binary encoding of the uc file formats
+#
+# The .ucb files of uc_ir are laid out as tables of strings
+# followed by a body of varints and tagged operands. This module
+# holds the pieces of that encoding.
+#
+# Counts, lengths and indexes are unsigned varints, strings are
+# UTF-8 behind their length, and every operand starts with a one
+# byte tag:
+#
+#     INT     zigzag varint
+#     FLOAT   8 bytes, IEEE 754 double
+#     STR     varint index into a StringPool
+#     LIST    varint count, then the items
+#     NONE    no payload
+# ============================================================
+
+import struct
+
+_INT, _FLOAT, _STR, _LIST, _NONE = range(5)
+
+_double = struct.Struct('<d')
+
+
+class BinaryError(Exception):
+    """ Raised when binary data is malformed, or when a value can't
+        be encoded.
+    """
+    pass
+
+
+def write_varint(out, value):
+    """ Appends the unsigned varint value to the bytearray out. """
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def write_str(out, value):
+    """ Appends value to out, UTF-8 encoded behind its length. """
+    _data = value.encode('utf-8')
+    write_varint(out, len(_data))
+    out += _data
+
+
+class StringPool(object):
+    """ Interns the strings of a table, keeping them in the order
+        they were first seen.
+    """
+    def __init__(self):
+        self.index = {}
+        self.items = []
+
+    def add(self, value):
+        _idx = self.index.get(value)
+        if _idx is None:
+            _idx = self.index[value] = len(self.items)
+            self.items.append(value)
+        return _idx
+
+
+def write_operand(out, strings, value):
+    """ Appends the tagged operand value to out, interning its
+        strings in the StringPool strings.
+    """
+    if isinstance(value, bool):
+        out.append(_INT)
+        write_varint(out, int(value) << 1)
+    elif isinstance(value, int):
+        out.append(_INT)
+        write_varint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _double.pack(value)
+    elif isinstance(value, str):
+        out.append(_STR)
+        write_varint(out, strings.add(value))
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST)
+        write_varint(out, len(value))
+        for _item in value:
+            write_operand(out, strings, _item)
+    elif value is None:
+        out.append(_NONE)
+    else:
+        raise BinaryError("Can't encode operand %r" % (value,))
+
+
+class Reader(object):
+    """ Decodes binary data held in memory, from pos on. name tells
+        what the data is in the error messages.
+    """
+    def __init__(self, data, name='binary data'):
+        self.data = data
+        self.name = name
+        self.pos = 0
+
+    def varint(self):
+        data = self.data
+        pos = self.pos
+        _value = 0
+        _shift = 0
+        while True:
+            try:
+                _byte = data[pos]
+            except IndexError:
+                raise BinaryError("Unexpected end of %s" % self.name)
+            pos += 1
+            _value |= (_byte & 0x7f) << _shift
+            if _byte < 0x80:
+                break
+            _shift += 7
+        self.pos = pos
+        return _value
+
+    def string(self):
+        _len = self.varint()
+        _start = self.pos
+        self.pos += _len
+        if self.pos > len(self.data):
+            raise BinaryError("Unexpected end of %s" % self.name)
+        try:
+            return str(self.data[_start:self.pos], 'utf-8')
+        except UnicodeDecodeError:
+            raise BinaryError("Bad UTF-8 string at offset %d of %s" % (_start, self.name)) from None
+
+    def table(self):
+        return [self.string() for _ in range(self.varint())]
+
+    def operand(self, strings):
+        try:
+            _tag = self.data[self.pos]
+        except IndexError:
+            raise BinaryError("Unexpected end of %s" % self.name)
+        self.pos += 1
+        if _tag == _INT:
+            _value = self.varint()
+            return -((_value + 1) >> 1) if _value & 1 else _value >> 1
+        elif _tag == _STR:
+            return strings[self.varint()]
+        elif _tag == _FLOAT:
+            _start = self.pos
+            self.pos += 8
+            if self.pos > len(self.data):
+                raise BinaryError("Unexpected end of %s" % self.name)
+            return _double.unpack_from(self.data, _start)[0]
+        elif _tag == _LIST:
+            return [self.operand(strings) for _ in range(self.varint())]
+        elif _tag == _NONE:
+            return None
+        raise BinaryError("Bad operand tag %d at offset %d" % (_tag, self.pos - 1))
@@ -0,0 +1,115 @@
+# ============================================================
+# uc_cache.py -- On-disk cache of compilation artifacts
+#
+# Keeps the decorated AST and the uCIR of every program the
+# compiler has seen, keyed by the hash of its source code, the
+# compiler version and the flags that change the output, so a
+# program that did not change since the last run goes straight
+# to execution.
+# ============================================================
+
+import os
+import pickle
+import hashlib
+
+_modules = ('uc.py', 'uc_ast.py', 'uc_lexer.py', 'uc_parser.py',
+            'uc_parsebase.py', 'uc_rdparser.py', 'uc_sema.py', 'uc_code.py')
+
+
+def compiler_version():
+    """ Returns a digest of the compiler sources, so that artifacts
+        produced by a different version of the compiler are never
+        taken from the cache.
+    """
+    _hash = hashlib.sha1()
+    _dir = os.path.dirname(os.path.abspath(__file__))
+    for _name in _modules:
+        with open(os.path.join(_dir, _name), 'rb') as f:
+            _hash.update(f.read())
+    return _hash.hexdigest()
+
+
+class CompilationCache(object):
+    """ A directory of pickled (AST, uCIR) pairs. Every entry is a
+        file named after its key. Entries are touched when they are
+        read, and the least recently used ones are evicted when the
+        total size of the directory grows over max_size bytes.
+    """
+    def __init__(self, directory, max_size=64 * 1024 * 1024):
+        self.directory = directory
+        self.max_size = max_size
+        self.version = compiler_version()
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, code, flags=()):
+        """ Computes the key of a source code compiled with flags. """
+        _hash = hashlib.sha1(self.version.encode())
+        _hash.update(repr(tuple(flags)).encode())
+        _hash.update(code.encode())
+        return _hash.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def load(self, key):
+        """ Returns the (ast, code) pair stored under key, or None. An
+            entry that can't be read back is removed.
+        """
+        _path = self._path(key)
+        try:
+            with open(_path, 'rb') as f:
+                _entry = pickle.load(f)
+            if not (isinstance(_entry, tuple) and len(_entry) == 2):
+                raise pickle.UnpicklingError("not an (ast, code) pair")
+            os.utime(_path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or garbage data can raise about anything while
+            # unpickling, RecursionError included
+            try:
+                os.remove(_path)
+            except OSError:
+                pass
+            return None
+        return _entry
+
+    def store(self, key, ast, code):
+        """ Stores the (ast, code) pair under key, evicting the least
+            recently used entries if the cache is over its size limit.
+        """
+        _path = self._path(key)
+        _tmp = _path + '.%d.tmp' % os.getpid()
+        try:
+            with open(_tmp, 'wb') as f:
+                pickle.dump((ast, code), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(_tmp, _path)
+        except (OSError, RecursionError, pickle.PicklingError):
+            if os.path.exists(_tmp):
+                os.remove(_tmp)
+            return
+        self._evict()
+
+    def _evict(self):
+        _entries = []
+        _total = 0
+        for _entry in os.scandir(self.directory):
+            if _entry.name.endswith('.pickle'):
+                _stat = _entry.stat()
+                _entries.append((_stat.st_mtime, _stat.st_size, _entry.path))
+                _total += _stat.st_size
+        _entries.sort()
+        for (_, _size, _path) in _entries:
+            if _total <= self.max_size:
+                break
+            try:
+                os.remove(_path)
+            except OSError:
+                pass
+            _total -= _size
+
+    def clear(self):
+        """ Removes every entry from the cache. """
+        for _entry in os.scandir(self.directory):
+            if _entry.name.endswith('.pickle'):
+                os.remove(_entry.path)
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+# ============================================================
+# uc_check.py -- Differential checks for the uc compiler
+#
+# Runs the same inputs through the interchangeable parts of the
+# compiler and reports where they disagree. Usage:
+#
+#     python uc_check.py lex [files]
+#     python uc_check.py flags [files]
+#     python uc_check.py ucb [files]
+#     python uc_check.py errors [files]
+#     python uc_check.py parallel [files]
+#     python uc_check.py loops
+#
+# lex compares the token streams of the two lexers. flags compiles
+# and runs every program with each option that should not change
+# its behavior, and incrementally, and compares the output (and the
+# uCIR, for the options that should not change it either) with the
+# ones of a default compile. ucb round trips the uCIR of every
+# program through the .ucb format, and checks that corrupt .ucb data
+# is reported. errors compiles every program with each parser and
+# lexer and compares the errors reported with the ones in the .err
+# file beside it, if any. parallel parses every program with
+# parse_parallel and with parse, with each parser, and compares the
+# trees and the errors. loops checks which for loops of _loops
+# -check-bounds finds the range of. The files default to the test
+# programs in Testes.
+# ============================================================
+
+import io
+import os
+import re
+import sys
+import glob
+import shutil
+import tempfile
+import pickle
+import contextlib
+import uc_parsebase
+from uc import Compiler, errors_reported
+from uc_lexer import UCLexer, UCFastLexer
+from uc_parser import UCParser
+from uc_rdparser import UCRDParser
+from uc_sema import Visitor
+from uc_code import GenerateCode
+from uc_ast import FuncDef, For
+from uc_cache import CompilationCache
+from uc_ir import read_ir, read_ucb, dump_ucb, load_ucb, UCBError
+from uc_interpreter import Interpreter
+
+_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Inputs the lexers are known to have disagreed on: identifiers
+# that start with a keyword, and comments
+_lex_inputs = [
+    "int integer; float floaty; char chart, character;",
+    "intx = int_ + floatchar - char2; int_ = 1;",
+    "printx(readonly); if_ ifx elsewhere; returned = voidness;",
+    "forward whiley assertion breaking",
+    "/* a */ int x; /* b */\nint y;",
+    "int x; /* a\n * b\n */ int y;\nint z;",
+    "int x = 1 / 2; // c",
+    "int x;\n/* a\nint y;",
+]
+
+# Corrupt .ucb data, each of which must raise UCBError
+_bad_ucb = [
+    ('no magic', b'UCB0'),
+    ('truncated table', b'UCB1\x01\x05ab'),
+    ('bad UTF-8 in the string table', b'UCB1\x01\x02\xff\xfe'),
+    ('bad opcode index', b'UCB1\x00\x00\x01\x00\x00'),
+    ('bad operand tag', b'UCB1\x01\x01a\x00\x01\x00\x01\x09'),
+    ('truncated float', b'UCB1\x01\x01a\x00\x01\x00\x01\x01\x00'),
+    ('trailing bytes', dump_ucb([('return_void',)]) + b'\x00'),
+]
+
+# Programs with a for loop over a[10], and whether -check-bounds may
+# take the range of its induction variable as known in the body
+_loops = [
+    ('plain loop', True,
+     "int main() { int a[10]; int i; for (i = 0; i < 10; i++) a[i] = 0; return 0; }"),
+    ('call in the body', True,
+     "void f() { return; } int main() { int a[10]; int i;"
+     " for (i = 0; i < 10; i++) { f(); a[i] = 0; } return 0; }"),
+    ('assigned in the body', False,
+     "int main() { int a[10]; int i; for (i = 0; i < 10; i++) { a[i] = 0; i = 20; } return 0; }"),
+    ('aliased by a pointer', False,
+     "int main() { int a[10]; int i; int *p = &i;"
+     " for (i = 0; i < 10; i++) { *p = 100; a[i] = 0; } return 0; }"),
+    ('address taken after the loop', False,
+     "int main() { int a[10]; int i; int *p;"
+     " for (i = 0; i < 10; i++) a[i] = 0; p = &i; return 0; }"),
+    ('global variable', False,
+     "int i; int main() { int a[10]; for (i = 0; i < 10; i++) a[i] = 0; return 0; }"),
+]
+
+# The options whose errors are compared with a program's .err file
+_error_variants = (
+    ('', {}),
+    ('-fast-lexer', {'fast_lexer': True}),
+    ('-rd-parser', {'rd_parser': True}),
+)
+
+# What the programs read, when they read
+_input = "3 4 5\n"
+
+# Corrupt cache entries, each of which must be taken as a miss
+_bad_entries = [
+    ('empty', b''),
+    ('garbage', b'garbage'),
+    ('truncated', pickle.dumps(('ast', 'code'))[:-3]),
+    ('unknown class', b'cno_such_module\nNoSuchClass\n.'),
+    ('not a pair', pickle.dumps(None)),
+]
+
+# The options compared with a default compile: their flag, their
+# Compiler arguments and whether the uCIR must be the same
+_variants = (
+    ('-fast-lexer', {'fast_lexer': True}, True),
+    ('-rd-parser', {'rd_parser': True}, True),
+    ('-j2', {'jobs': 2}, True),
+    ('-check-bounds', {'check_bounds': True}, False),
+    ('-no-prune', {'prune': False}, False),
+)
+
+
+def _programs():
+    """ The test programs, in order. """
+    return sorted(glob.glob(os.path.join(_dir, 'Testes', '*.uc')))
+
+
+def tokens(lexer_class, text):
+    """ Returns the tokens of text lexed by lexer_class, as (type,
+        value, line, offset) tuples, and the lexical errors found.
+    """
+    _errors = []
+    lexer = lexer_class(lambda msg, line, column: _errors.append((msg, line, column)))
+    lexer.build()
+    lexer.input(text)
+    _tokens = []
+    while True:
+        tok = lexer.token()
+        if not tok:
+            break
+        _tokens.append((tok.type, tok.value, tok.lineno, tok.lexpos))
+    return _tokens, _errors
+
+
+def check_lex(paths):
+    """ Compares the token streams of UCLexer and UCFastLexer on the
+        given files and on the inputs they once disagreed on. Returns
+        the number of inputs where they differ.
+    """
+    _inputs = [('<input %d>' % n, text) for n, text in enumerate(_lex_inputs)]
+    for _path in paths:
+        with open(_path) as f:
+            _inputs.append((_path, f.read()))
+    _failed = 0
+    for (_name, _text) in _inputs:
+        _slow = tokens(UCLexer, _text)
+        _fast = tokens(UCFastLexer, _text)
+        if _slow != _fast:
+            _failed += 1
+            for (_a, _b) in zip(_slow[0] + [None], _fast[0] + [None]):
+                if _a != _b:
+                    print("%s: UCLexer %s, UCFastLexer %s" % (_name, _a, _b))
+                    break
+            else:
+                print("%s: lexical errors differ" % _name)
+    print("%d of %d inputs lexed differently" % (_failed, len(_inputs)))
+    return _failed
+
+
+def _capture(func, *args):
+    """ Runs func, returning what it wrote, how it exited and the
+        exception it raised, if any.
+    """
+    _out = io.StringIO()
+    _stdin = sys.stdin
+    sys.stdin = io.StringIO(_input)
+    try:
+        with contextlib.redirect_stdout(_out), contextlib.redirect_stderr(_out):
+            func(*args)
+        _status = "exit 0"
+    except SystemExit as e:
+        _status = "exit %s" % e.code
+    except Exception as e:
+        _status = "raised %s" % type(e).__name__
+    finally:
+        sys.stdin = _stdin
+    return "%s[%s]" % (_out.getvalue(), _status)
+
+
+def compile_run(compiler, code):
+    """ Compiles and runs code with compiler. Returns the output and
+        the uCIR written.
+    """
+    _ir = io.StringIO()
+    _output = _capture(compiler.compile, code, False, None, _ir, True, False)
+    return _output, _ir.getvalue()
+
+
+def _run_ucb(code):
+    """ Compiles code to .ucb, then runs it. """
+    _ucb = io.BytesIO()
+    def _run():
+        Compiler().compile(code, False, None, None, False, False, _ucb)
+        if not errors_reported():
+            _ucb.seek(0)
+            Interpreter().run(read_ucb(_ucb))
+    return _capture(_run)
+
+
+def _run_ir(code):
+    """ Compiles code to textual uCIR, then reads it back and runs it. """
+    _ir = io.StringIO()
+    def _run():
+        Compiler().compile(code, False, None, _ir, False, False)
+        if not errors_reported():
+            _ir.seek(0)
+            Interpreter().run(read_ir(_ir))
+    return _capture(_run)
+
+
+def check_flags(paths):
+    """ Compiles and runs the programs in paths with every variant,
+        comparing them with a default compile. The .ucb and textual
+        uCIR are run after the compile, the cache is checked on a miss,
+        on a hit and on each of _bad_entries, and one incremental
+        compiler goes through all the programs. Each is followed by
+        itself with a line added at the end, so that the code of its
+        functions is reused, then moved one line down, so that its
+        units are reused with their lines shifted.
+        The parsers recover from syntax errors each their own way, so
+        only the first error of UCRDParser is compared on those.
+        Returns the number of runs that differ.
+    """
+    _codes = []
+    for _path in paths:
+        with open(_path) as f:
+            _codes.append((os.path.basename(_path), f.read()))
+    # Small sources are parsed sequentially otherwise
+    uc_parsebase.PARALLEL_MIN_SIZE = 0
+    _cache = tempfile.mkdtemp()
+    _runs = 0
+    _failed = 0
+
+    def compare(name, flag, expected, got):
+        """ Compares two (output, uCIR) pairs. """
+        nonlocal _runs, _failed
+        _runs += 1
+        if expected != got:
+            _failed += 1
+            print("%s %s: %s" % (name, flag, "output differs" if expected[0] != got[0] else "uCIR differs"))
+
+    _parser = UCParser()
+    _incremental = Compiler(incremental=True)
+    try:
+        for (_name, _code) in _codes:
+            _default = compile_run(Compiler(), _code)
+            _parser.parse(_code)
+            _syntax = len(_parser.errors) > 0
+            for (_flag, _options, _same_ir) in _variants:
+                _got = compile_run(Compiler(**_options), _code)
+                if _syntax and _options.get('rd_parser'):
+                    compare(_name, _flag, (_default[0].split('\n')[0],), (_got[0].split('\n')[0],))
+                elif _same_ir:
+                    compare(_name, _flag, _default, _got)
+                else:
+                    compare(_name, _flag, (_default[0],), (_got[0],))
+            compare(_name, '-ucb', (_default[0],), (_run_ucb(_code),))
+            compare(_name, '-run-ir', (_default[0],), (_run_ir(_code),))
+            for _ in range(2):
+                compare(_name, '-cache', _default, compile_run(Compiler(cache=CompilationCache(_cache)), _code))
+            for (_what, _data) in _bad_entries:
+                for _entry in glob.glob(os.path.join(_cache, '*.pickle')):
+                    with open(_entry, 'wb') as f:
+                        f.write(_data)
+                compare(_name, '-cache (%s entry)' % _what, _default,
+                        compile_run(Compiler(cache=CompilationCache(_cache)), _code))
+            compare(_name, '-incremental', _default, compile_run(_incremental, _code))
+            _longer = _code + "\n"
+            compare(_name, '-incremental (longer)', compile_run(Compiler(), _longer), compile_run(_incremental, _longer))
+            _moved = "\n" + _code
+            compare(_name, '-incremental (moved)', compile_run(Compiler(), _moved), compile_run(_incremental, _moved))
+    finally:
+        shutil.rmtree(_cache)
+    print("%d of %d runs differ" % (_failed, _runs))
+    return _failed
+
+
+def check_ucb(paths):
+    """ Round trips the uCIR of the programs in paths through the
+        .ucb format, and loads the corrupt data of _bad_ucb, which
+        must be reported as UCBError. Returns the number of failures.
+    """
+    _failed = 0
+    for _path in paths:
+        with open(_path) as f:
+            _code = f.read()
+        _ir = io.StringIO()
+        _capture(Compiler().compile, _code, False, None, _ir, False, False)
+        if errors_reported():
+            continue
+        _ir.seek(0)
+        _insts = read_ir(_ir)
+        if load_ucb(dump_ucb(_insts)) != _insts:
+            _failed += 1
+            print("%s: uCIR differs after a .ucb round trip" % _path)
+    for (_name, _data) in _bad_ucb:
+        try:
+            load_ucb(_data)
+            print("%s: loaded" % _name)
+        except UCBError:
+            continue
+        except Exception as e:
+            print("%s: raised %s" % (_name, type(e).__name__))
+        _failed += 1
+    print("%d of %d .ucb checks failed" % (_failed, len(paths) + len(_bad_ucb)))
+    return _failed
+
+
+def check_errors(paths):
+    """ Compiles the programs in paths with each of _error_variants
+        and compares the errors reported with the ones expected in the
+        .err file beside each program, or with none if there is no
+        such file. Returns the number of compiles that differ.
+    """
+    _runs = 0
+    _failed = 0
+    for _path in paths:
+        with open(_path) as f:
+            _code = f.read()
+        _expected = ''
+        if os.path.exists(_path[:-3] + '.err'):
+            with open(_path[:-3] + '.err') as f:
+                _expected = f.read().strip()
+        for (_flag, _options) in _error_variants:
+            _runs += 1
+            # The output, without how the compile exited
+            _got = _capture(Compiler(**_options).compile, _code, False, None, None, False, False)
+            _got = _got[:_got.rindex('[')].strip()
+            if _got != _expected:
+                _failed += 1
+                print("%s %s: errors differ" % (os.path.basename(_path), _flag or 'default'))
+                print(_got)
+    print("%d of %d compiles differ" % (_failed, _runs))
+    return _failed
+
+
+def _dump(ast):
+    """ The tree dump of ast, with the object addresses left out. """
+    if ast is None:
+        return None
+    buf = io.StringIO()
+    ast.show(buf=buf, showcoord=True)
+    return re.sub(r' at 0x[0-9a-f]+', '', buf.getvalue())
+
+
+def check_parallel_parse(paths):
+    """ Parses the programs in paths with parse_parallel, in two
+        workers, and with parse, with each parser. Returns the number
+        of parses whose tree or errors differ.
+    """
+    # Small sources are parsed sequentially otherwise
+    uc_parsebase.PARALLEL_MIN_SIZE = 0
+    _runs = 0
+    _failed = 0
+    for _path in paths:
+        with open(_path) as f:
+            _code = f.read()
+        for _parser in (UCParser(), UCRDParser()):
+            _runs += 1
+            _expected = (_dump(_parser.parse(_code)), [(str(_c), _m) for (_c, _m) in _parser.errors])
+            _got = (_dump(_parser.parse_parallel(_code, 2)), [(str(_c), _m) for (_c, _m) in _parser.errors])
+            if _got != _expected:
+                _failed += 1
+                print("%s %s: %s differ" % (os.path.basename(_path), type(_parser).__name__,
+                      "trees" if _got[0] != _expected[0] else "errors"))
+    print("%d of %d parses differ" % (_failed, _runs))
+    return _failed
+
+
+def check_loops():
+    """ Runs the loop range analysis of -check-bounds on the for
+        loops of _loops. Returns the number of loops it gets wrong.
+    """
+    _failed = 0
+    for (_name, _proven, _code) in _loops:
+        _ast = UCParser().parse(_code)
+        _sema = Visitor(0)
+        _sema.visit(_ast)
+        if _sema.errors:
+            _failed += 1
+            print("%s: %s" % (_name, _sema.errors[0]))
+            continue
+        gen = GenerateCode(_sema.environment.symbols, check_bounds=True)
+        _got = []
+        for _decl in _ast.gdecls:
+            if not isinstance(_decl, FuncDef):
+                continue
+            gen.frame = _decl.symbols
+            gen.addressed = gen.addressed_symbols(_decl.body)
+            _got.extend(gen.loop_range(_stmt) is not None
+                        for _stmt in _decl.body if isinstance(_stmt, For))
+        if _got != [_proven]:
+            _failed += 1
+            print("%s: range %s" % (_name, "not found" if _proven else "found"))
+    print("%d of %d loops analyzed wrongly" % (_failed, len(_loops)))
+    return _failed
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in ('lex', 'flags', 'ucb', 'errors', 'parallel', 'loops'):
+        print("Usage: python uc_check.py lex|flags|ucb|errors|parallel|loops [files]")
+        sys.exit(1)
+    _paths = sys.argv[2:] or _programs()
+    if sys.argv[1] == 'lex':
+        sys.exit(1 if check_lex(_paths) else 0)
+    elif sys.argv[1] == 'flags':
+        sys.exit(1 if check_flags(_paths) else 0)
+    elif sys.argv[1] == 'ucb':
+        sys.exit(1 if check_ucb(_paths) else 0)
+    elif sys.argv[1] == 'errors':
+        sys.exit(1 if check_errors(_paths) else 0)
+    elif sys.argv[1] == 'parallel':
+        sys.exit(1 if check_parallel_parse(_paths) else 0)
+    elif sys.argv[1] == 'loops':
+        sys.exit(1 if check_loops() else 0)
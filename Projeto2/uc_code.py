@@ -1,19 +1,106 @@
 from uc_ast import *
 from uc_sema import *
 
+def reachable(program):
+    '''
+    Returns the sids of the globals and functions reachable from main
+    in the call graph of a checked program, where every function has
+    an edge to the global names it uses (its refs, found by sema).
+    Returns None if the program has no main.
+    '''
+    graph = {}
+    _main = None
+    for _decl in program.gdecls:
+        if isinstance(_decl, FuncDef):
+            _name = _decl.decl.name
+            if _name.name == 'main':
+                _main = _name.sid
+            graph[_name.sid] = _decl.refs or ()
+    if _main is None:
+        return None
+    live = {_main}
+    _stack = [_main]
+    while _stack:
+        for _sid in graph.get(_stack.pop(), ()):
+            if _sid not in live:
+                live.add(_sid)
+                _stack.append(_sid)
+    return live
+
+def reset(nodes):
+    '''
+    Clears the locations left in the nodes, and every node under them,
+    by an earlier GenerateCode, so that code can be generated for them
+    again (see the incremental Compiler).
+    '''
+    _stack = list(nodes)
+    while _stack:
+        node = _stack.pop()
+        if getattr(node, 'gen_location', None) is not None:
+            node.gen_location = None
+        if getattr(node, 'exit_label', None) is not None:
+            node.exit_label = None
+        _stack.extend(_child for _, _child in node.children())
+
+class FunctionCode(object):
+    '''
+    The code generated for a function: its instructions, the strings of
+    the constant pool they refer to (value -> global), in the order they
+    were first used, and the number of temporaries it took.
+    '''
+    __slots__ = ('code', 'strings', 'temps')
+
+    def __init__(self, code, strings, temps):
+        self.code = code
+        self.strings = strings
+        self.temps = temps
+
 class GenerateCode(NodeVisitor):
     '''
     Node visitor class that creates 3-address encoded instruction sequences.
     '''
-    def __init__(self):
+    def __init__(self, symbols=None, check_bounds=False, prune=False, reuse=None):
         super(GenerateCode, self).__init__()
 
+        # the side tables of the symbols found by sema: the one of the
+        # globals, and the one of the function being generated
+        self.symbols = symbols if symbols is not None else []
+        self.frame = None
+
+        # with check_bounds, the array references not proven in bounds
+        # are checked at run time. ranges holds the [lo, hi) range of
+        # the induction variables of the enclosing for loops, and
+        # addressed the symbols of the variables of the function being
+        # generated whose address is taken
+        self.check_bounds = check_bounds
+        self.ranges = {}
+        self.addressed = set()
+
+        # with prune, the functions and globals main can't reach are
+        # left out of a whole program. live holds the sids of the
+        # others, or is None when nothing is left out
+        self.prune = prune
+        self.live = None
+
+        # with reuse, the FunctionCode of an earlier compile, by name,
+        # of the functions that didn't change: it is emitted instead of
+        # generating their code again. functions then gets the one of
+        # every function emitted, and used_strings the strings used by
+        # the function being generated
+        self.reuse = reuse
+        self.functions = {} if reuse is not None else None
+        self.used_strings = None
+
         # version dictionary for temporaries
         self.fname = '_glob_'  # We use the function name as a key
         self.versions = {self.fname: 0}
 
         self.text = []
         self.code = [] 
+
+        # the constant pool: the global holding each string, so equal
+        # strings are emitted only once
+        self.strings = {}
         
         self.binary_opcodes = {"+": "add", "-": "sub", "*": "mul", "/": "div", 
                                "%": "mod", "==": "eq", "!=": "ne", "<": "lt",
@@ -46,7 +133,40 @@ class GenerateCode(NodeVisitor):
         name = "@.str." + "%d" % (self.versions['_glob_'])
         self.versions['_glob_'] += 1
         return name        
+
+    def new_string(self, value):
+        '''
+        The global holding the string value, adding it to the constant
+        pool the first time it is seen.
+        '''
+        name = self.strings.get(value)
+        if name is None:
+            name = self.strings[value] = self.new_text()
+            self.text.append(('global_string', name, value))
+        if self.used_strings is not None:
+            self.used_strings.setdefault(value, name)
+        return name
    
+    def symbol(self, name):
+        '''
+        The Symbol of a declared name, or of an ID bound to one.
+        '''
+        return (self.symbols if name.scope == 1 else self.frame)[name.sid]
+
+    def suffix(self, symbol):
+        '''
+        The suffix the opcodes on a variable take after its type:
+        '_n' per array dimension and '_*' per pointer.
+        '''
+        _suffix = ""
+        _dims = iter(symbol.dims)
+        for _name in symbol.type[:-1]:
+            if _name is PtrType:
+                _suffix += "_*"
+            else:
+                _suffix += "_" + str(next(_dims))
+        return _suffix
+
     def clean(self):
         self.items = []
 
@@ -56,71 +176,190 @@ class GenerateCode(NodeVisitor):
     def dequeue(self):
         return self.items.pop()
  
-    def visit_VarDecl(self, node, decl, dim):
-        if node.declname.scope == 1:
-            self.global_location(node, decl, dim)  
-        else:
-            typename = node.type.names[-1].typename + dim
-            if self.alloc_phase == 'arg_decl' or self.alloc_phase == 'var_decl':
-                varname = self.new_temp()
-                self.code.append(('alloc_' + typename, varname))
-                node.declname.gen_location = varname
-                decl.name.gen_location = varname               
-            elif self.alloc_phase == 'arg_init':
-                self.code.append(('store_' + typename, self.dequeue(), node.declname.gen_location))
-                
-            elif self.alloc_phase == 'var_init':
-                if decl.init is not None:
-                    self.store_location(typename, decl.init, node.declname.gen_location)
-    
-    def visit_ArrayDecl(self, node, decl, dim):
-        _type = node
-        dim += "_" + str(node.dim.value)
-        while not isinstance(_type, VarDecl):
-            _type = _type.type
-            if isinstance(_type, ArrayDecl):
-                dim += "_" + str(_type.dim.value)
-            elif isinstance(_type, PtrDecl):
-                dim += "_*"
-        self.visit_VarDecl(_type, decl, dim)
-      
+    def local_location(self, symbol, decl):
+        typename = symbol.type[-1].typename + self.suffix(symbol)
+        if self.alloc_phase == 'arg_decl' or self.alloc_phase == 'var_decl':
+            varname = self.new_temp()
+            self.code.append(('alloc_' + typename, varname))
+            symbol.slot = varname
+        elif self.alloc_phase == 'arg_init':
+            self.code.append(('store_' + typename, self.dequeue(), symbol.slot))
+
+        elif self.alloc_phase == 'var_init':
+            if decl.init is not None:
+                self.store_location(typename, decl.init, symbol.slot)
+
     def visit_ArrayRef(self, node):
-        subs_j = node.subscript
-        self.visit(subs_j)
-        if isinstance(node.name, ArrayRef):
-            subs_i = node.name.subscript
-            self.visit(subs_i)
-            dim = node.name.name.bind.type.dim
-            self.visit(dim)
-            if isinstance(subs_i, ID) or isinstance(subs_i, ArrayRef):
-                self.load_location(subs_i)
-            target = self.new_temp()
-            self.code.append(('mul_' + node.type.names[-1].typename, dim.gen_location, subs_i.gen_location, target))
-            if isinstance(subs_j, ID) or isinstance(subs_j, ArrayRef):
-                self.load_location(subs_j)
-            idx = self.new_temp()
-            self.code.append(('add_' + node.type.names[-1].typename, target, subs_j.gen_location, idx))
-            var = node.name.name.bind.type.type.declname.gen_location
-            node.gen_location = self.new_temp()
-            self.code.append(('elem_' + node.type.names[-1].typename, var, idx, node.gen_location))  
+        subscripts = []
+        _name = node
+        while isinstance(_name, ArrayRef):
+            subscripts.insert(0, _name.subscript)
+            _name = _name.name
+        _symbol = self.symbol(_name)
+        _strides = _symbol.strides
+        # One index for the whole reference: the constant subscripts
+        # fold into offset, and the others add their value times the
+        # stride of their dimension. Sema only lets the first dim be
+        # unknown, so every stride is known
+        offset = 0
+        idx = None
+        for (_k, _subs) in enumerate(subscripts):
+            _stride = _strides[_k] if _k < len(_strides) else 1
+            if isinstance(_subs, Constant):
+                offset += _subs.value * _stride
+                continue
+            yield _subs
+            if isinstance(_subs, ID) or isinstance(_subs, ArrayRef):
+                self.load_location(_subs)
+            term = _subs.gen_location
+            if _stride != 1:
+                stride = self.new_temp()
+                self.code.append(('literal_int', _stride, stride))
+                term = self.new_temp()
+                self.code.append(('mul_int', stride, _subs.gen_location, term))
+            idx = term if idx is None else self.add_index(idx, term)
+        if idx is None or offset != 0:
+            const = self.new_temp()
+            self.code.append(('literal_int', offset, const))
+            idx = const if idx is None else self.add_index(idx, const)
+        if self.check_bounds:
+            self.bounds_check(node, _symbol, subscripts, idx)
+        node.gen_location = self.new_temp()
+        self.code.append(('elem_' + node.type.names[-1].typename, _symbol.slot, idx, node.gen_location))
+
+    def add_index(self, left, right):
+        target = self.new_temp()
+        self.code.append(('add_int', left, right, target))
+        return target
+
+    def bounds_check(self, node, symbol, subscripts, idx):
+        '''
+        Checks the index idx of an array reference against the extent
+        of the array, unless every subscript is known to be within its
+        dimension. Arrays of unknown extent are not checked.
+        '''
+        _dims = symbol.dims
+        if len(subscripts) > len(_dims) or None in _dims:
+            return
+        _safe = True
+        for (_subs, _dim) in zip(subscripts, _dims):
+            _range = self.subscript_range(_subs)
+            if _range is None or _range[0] < 0 or _range[1] > _dim:
+                _safe = False
+                break
+        if _safe:
+            return
+        extent = 1
+        for _dim in _dims:
+            extent *= _dim
+        message = self.new_string("index out of bounds on " + f"{node.coord.line}:{node.coord.column}")
+        self.code.append(('check_bounds', idx, extent, message))
+
+    def subscript_range(self, subs):
+        '''
+        The range [lo, hi) of the values of a subscript known
+        statically, or None.
+        '''
+        if isinstance(subs, Constant):
+            return (subs.value, subs.value + 1)
+        if isinstance(subs, ID):
+            return self.ranges.get(self.symbol(subs))
+        if isinstance(subs, BinaryOp) and subs.op in ('+', '-') and isinstance(subs.right, Constant):
+            _range = self.subscript_range(subs.left)
+            if _range is not None:
+                _shift = subs.right.value if subs.op == '+' else -subs.right.value
+                return (_range[0] + _shift, _range[1] + _shift)
+        return None
+
+    def loop_range(self, node):
+        '''
+        Finds the induction variable of a for loop of the form
+        for (i = lo; i < hi; i++), with constant lo and hi, whose body
+        doesn't change i. Only a local variable whose address is never
+        taken qualifies: nothing else, a call or a store through a
+        pointer, can change it then. Returns its symbol and the
+        [lo, hi) range it takes in the body, or None.
+        '''
+        _init = node.init
+        if isinstance(_init, DeclList) and len(_init.decls) == 1:
+            _var, _lo = _init.decls[0].name, _init.decls[0].init
+        elif isinstance(_init, Assignment) and _init.op == '=':
+            _var, _lo = _init.lvalue, _init.rvalue
         else:
-            if isinstance(subs_j, ID) or isinstance(subs_j, ArrayRef):
-                self.load_location(subs_j)
-                var = node.name.bind.type.declname.gen_location
-                idx = subs_j.gen_location
-                target = self.new_temp()
-                node.gen_location = target
-                self.code.append(('elem_' + node.type.names[-1].typename, var, idx, target))     
-       
+            return None
+        _cond = node.cond
+        if not (isinstance(_var, ID) and isinstance(_lo, Constant) and _var.type.names == (IntType,)
+                and isinstance(_cond, BinaryOp) and _cond.op in ('<', '<=')
+                and isinstance(_cond.left, ID) and isinstance(_cond.right, Constant)):
+            return None
+        if _var.scope == 1:
+            return None
+        symbol = self.symbol(_var)
+        if symbol in self.addressed or self.symbol(_cond.left) is not symbol or not self.is_increment(node.next, symbol):
+            return None
+        _hi = _cond.right.value + (1 if _cond.op == '<=' else 0)
+        # Look for anything in the body that could change the variable
+        _stack = [node.stmt]
+        while _stack:
+            _node = _stack.pop()
+            if _node is None:
+                continue
+            if isinstance(_node, list):
+                _stack.extend(_node)
+                continue
+            if isinstance(_node, Assignment):
+                _targets = [_node.lvalue]
+            elif isinstance(_node, UnaryOp) and _node.op in ('++', '--', 'p++', 'p--'):
+                _targets = [_node.expr]
+            elif isinstance(_node, Read):
+                _targets = []
+                for _loc in _node.names:
+                    _targets.extend(_loc.exprs if isinstance(_loc, ExprList) else [_loc])
+            else:
+                _targets = ()
+            for _target in _targets:
+                if isinstance(_target, ID) and self.symbol(_target) is symbol:
+                    return None
+            _stack.extend(_child for (_name, _child) in _node.children())
+        return (symbol, _lo.value, _hi)
+
+    def addressed_symbols(self, node):
+        '''
+        The symbols of the variables whose address is taken in node.
+        '''
+        _symbols = set()
+        _stack = [node]
+        while _stack:
+            _node = _stack.pop()
+            if _node is None:
+                continue
+            if isinstance(_node, list):
+                _stack.extend(_node)
+                continue
+            if isinstance(_node, UnaryOp) and _node.op == '&' and isinstance(_node.expr, ID):
+                _symbols.add(self.symbol(_node.expr))
+            _stack.extend(_child for (_name, _child) in _node.children())
+        return _symbols
+
+    def is_increment(self, node, symbol):
+        ''' Tells if node adds a positive constant to the variable of symbol. '''
+        if isinstance(node, UnaryOp) and node.op in ('++', 'p++'):
+            _var = node.expr
+        elif isinstance(node, Assignment) and node.op == '+=' and isinstance(node.rvalue, Constant) and node.rvalue.value > 0:
+            _var = node.lvalue
+        else:
+            return False
+        return isinstance(_var, ID) and self.symbol(_var) is symbol
+
     def visit_Assignment(self, node): 
         rval = node.rvalue
-        self.visit(rval)
+        yield rval
         if isinstance(rval, ID) or isinstance(rval, ArrayRef):
             self.load_location(rval)
         elif isinstance(rval, UnaryOp) and rval.op == "*":      
             self.load_reference(rval)     
         lvar =  node.lvalue
-        self.visit(lvar)
+        yield lvar
         if node.op in self.assign_opcodes:
             lval = self.new_temp()
             target = self.new_temp()
@@ -135,8 +374,8 @@ class GenerateCode(NodeVisitor):
                 typename = lvar.type.names[-1].typename
                 if isinstance(lvar, ArrayRef):
                     typename += '_*'
-                elif isinstance(lvar.bind, ArrayDecl):
-                    typename += '_' + str(lvar.bind.dim.value)
+                elif lvar.type.names[0] is ArrayType:
+                    typename += '_' + str(self.symbol(lvar).dims[0])
                 elif lvar.type.names[0] == PtrType:
                     if lvar.kind == 'func':
                         lvar.bind.type.gen_location = lvar.gen_location
@@ -152,8 +391,8 @@ class GenerateCode(NodeVisitor):
                     self.code.append(('store_' + typename, node.rvalue.gen_location, lvar.gen_location))
                            
     def visit_BinaryOp(self, node):
-        self.visit(node.left)
-        self.visit(node.right)   
+        yield node.left
+        yield node.right
         if isinstance(node.left, ID) or isinstance(node.left, ArrayRef):
             self.load_location(node.left)
         elif isinstance(node.left, UnaryOp) and node.left.op == "*":
@@ -171,7 +410,7 @@ class GenerateCode(NodeVisitor):
         self.code.append(('jump', node.bind.exit_label))
                 
     def visit_Cast(self, node):
-        self.visit(node.expr)
+        yield node.expr
         if isinstance(node.expr, ID) or isinstance(node.expr, ArrayRef):
             self.load_location(node.expr)
         temp = self.new_temp()
@@ -184,34 +423,29 @@ class GenerateCode(NodeVisitor):
             
     def visit_Compound(self, node):
         for item in node.block_items:
-            self.visit(item)
+            yield item
     
     def visit_Constant(self, node):
         if node.rawtype == 'string':
-            target = self.new_text()
-            self.text.append(('global_string', target, node.value))
+            target = self.new_string(node.value)
         else:
             target = self.new_temp()
             self.code.append(('literal_' + node.rawtype, node.value, target))
         node.gen_location = target
   
     def visit_Decl(self, node):
-        _type = node.type
-        dim = ""
-        if isinstance(_type, VarDecl):
-            self.visit_VarDecl(_type, node, dim)
-        elif isinstance(_type, ArrayDecl):
-            self.visit_ArrayDecl(_type, node, dim)
-        elif isinstance(_type, PtrDecl):
-            self.visit_PtrDecl(_type, node, dim)
-        elif isinstance(_type, FuncDecl):
-            self.visit_FuncDecl(_type)
+        if isinstance(node.type, FuncDecl):
+            self.visit_FuncDecl(node.type)
+        elif node.name.scope == 1:
+            self.global_location(self.symbol(node.name), node)
+        else:
+            self.local_location(self.symbol(node.name), node)
   
     def visit_DeclList(self, node):
         for decl in node.decls:
-            self.visit(decl)
+            yield decl
      
-    def visit_EmptyStatement(Node):
+    def visit_EmptyStatement(self, node):
         pass
      
     def visit_ExprList(Node):
@@ -222,13 +456,18 @@ class GenerateCode(NodeVisitor):
         body_label = self.new_temp()
         exit_label = self.new_temp()
         node.exit_label = exit_label
-        self.visit(node.init)
+        yield node.init
         self.code.append((entry_label[1:],))
-        self.visit(node.cond)
+        yield node.cond
         self.code.append(('cbranch', node.cond.gen_location, body_label, exit_label))
         self.code.append((body_label[1:],))
-        self.visit(node.stmt)
-        self.visit(node.next)
+        _range = self.loop_range(node) if self.check_bounds else None
+        if _range is not None:
+            self.ranges[_range[0]] = _range[1:]
+        yield node.stmt
+        if _range is not None:
+            del self.ranges[_range[0]]
+        yield node.next
         self.code.append(('jump', entry_label))
         self.code.append((exit_label[1:],))       
       
@@ -237,7 +476,7 @@ class GenerateCode(NodeVisitor):
             if isinstance(node.args, ExprList):
                 tcode = []
                 for arg in node.args.exprs:
-                    self.visit(arg)
+                    yield arg
                     if isinstance(arg, ID) or isinstance(arg, ArrayRef):
                         self.load_location(arg)   
                     inst = ('param_' + arg.type.names[-1].typename, arg.gen_location)
@@ -245,7 +484,7 @@ class GenerateCode(NodeVisitor):
                 for inst in tcode:
                     self.code.append(inst)
             else:
-                self.visit(node.args)
+                yield node.args
                 if isinstance(node.args, ID) or isinstance(node.args, ArrayRef):  
                     self.load_location(node.args)
                 self.code.append(('param_' + node.args.type.names[-1].typename, node.args.gen_location))
@@ -257,13 +496,13 @@ class GenerateCode(NodeVisitor):
             self.code.append(('call', target, node.gen_location))          
         else:
             node.gen_location = self.new_temp()
-            self.visit(node.name)
+            yield node.name
             self.code.append(('call', '@' + node.name.name, node.gen_location))
      
     def visit_FuncDecl(self, node):
         self.fname = '@' + node.type.declname.name
         self.code.append(('define', self.fname))
-        node.type.declname.gen_location = self.fname
+        self.symbol(node.type.declname).slot = self.fname
         if node.args is not None:
             self.clean()
             for _ in node.args.params:
@@ -279,23 +518,49 @@ class GenerateCode(NodeVisitor):
             for arg in node.args:
                 self.visit(arg)
        
+    def reuse_function(self, node, function):
+        '''
+        Emits the code an earlier compile generated for the function of
+        node, its strings being added to the constant pool again.
+        '''
+        _names = {_value: self.new_string(_value) for _value in function.strings}
+        if _names != function.strings:
+            _globals = {function.strings[_value]: _name for (_value, _name) in _names.items()}
+            function = FunctionCode([tuple(_globals.get(_op, _op) if _op.__class__ is str else _op for _op in _inst)
+                                     for _inst in function.code], _names, function.temps)
+        self.code.extend(function.code)
+        self.fname = '@' + node.decl.name.name
+        self.versions[self.fname] = function.temps
+        self.symbol(node.decl.name).slot = self.fname
+        self.functions[node.decl.name.name] = function
+
     def visit_FuncDef(self, node):
+        _name = node.decl.name.name
+        if self.reuse is not None:
+            if _name in self.reuse:
+                self.reuse_function(node, self.reuse[_name])
+                return
+            _start = len(self.code)
+            self.used_strings = {}
         self.alloc_phase = None
-        self.visit(node.decl)
+        self.frame = node.symbols
+        if self.check_bounds:
+            self.addressed = self.addressed_symbols(node.body)
+        yield node.decl
         if node.param_decls is not None:
             for par in node.param_decls:
-                self.visit(par)
+                yield par
 
         if node.body is not None:
             self.alloc_phase = 'var_decl'
             for body in node.body:
                 if isinstance(body, Decl):
-                    self.visit(body)        
+                    yield body
             for decl in node.decls:
-                self.visit(decl)
+                yield decl
             self.alloc_phase = 'var_init'
             for body in node.body:
-                self.visit(body)
+                yield body
         self.code.append((self.ret_label[1:],))
         if node.spec.names[-1].typename == 'void':
             self.code.append(('return_void',))
@@ -303,30 +568,31 @@ class GenerateCode(NodeVisitor):
             rvalue = self.new_temp()
             self.code.append(('load_' + node.spec.names[-1].typename, self.ret_location, rvalue))
             self.code.append(('return_' + node.spec.names[-1].typename, rvalue))
+        if self.reuse is not None:
+            self.functions[_name] = FunctionCode(self.code[_start:], self.used_strings, self.versions[self.fname])
+            self.used_strings = None
                  
     def visit_ID(self, node):  
         if node.gen_location is None:
-            _type = node.bind
-            while not isinstance(_type, VarDecl):
-                _type = _type.type 
-            if _type.declname.gen_location is None:
+            _slot = self.symbol(node).slot
+            if _slot is None:
                 if node.kind == 'func' and node.scope == 1:
                     node.gen_location = '@' + node.name
             else:
-                node.gen_location = _type.declname.gen_location
+                node.gen_location = _slot
       
     def visit_If(self, node):
         true_label = self.new_temp()
         false_label = self.new_temp()
         exit_label = self.new_temp()
-        self.visit(node.cond)
+        yield node.cond
         self.code.append(('cbranch', node.cond.gen_location, true_label, false_label))
         self.code.append((true_label[1:],))
-        self.visit(node.iftrue)
+        yield node.iftrue
         if node.iffalse is not None:
             self.code.append(('jump', exit_label))
             self.code.append((false_label[1:],))
-            self.visit(node.iffalse)
+            yield node.iffalse
             self.code.append((exit_label[1:],))
         else:
             self.code.append((false_label[1:],))
@@ -335,7 +601,7 @@ class GenerateCode(NodeVisitor):
         node.value = []
         for expr in node.exprs:
             if isinstance(expr, InitList):
-                self.visit(expr)
+                yield expr
             node.value.append(expr.value)     
  
     def visit_ParamList(self, node):
@@ -343,31 +609,23 @@ class GenerateCode(NodeVisitor):
                 self.visit(param)      
    
     def visit_GlobalDecl(self, node):
-        for decl in node.decls:
-            if not isinstance(decl.type, FuncDecl):
-                self.visit(decl)  
+        for decl in node.decls or ():
+            if not isinstance(decl.type, FuncDecl) and self.is_live(decl.name):
+                yield decl
+
+    def is_live(self, name):
+        return self.live is None or name.sid in self.live
     
-    def visit_PtrDecl(self, node, decl, dim):
-        _type = node
-        dim += "_*"
-        while not isinstance(_type, VarDecl):
-            _type = _type.type
-            if isinstance(_type, PtrDecl):
-                dim += "_*"
-            elif isinstance(_type, ArrayDecl):
-                dim += "_" + str(_type.dim.value)
-        self.visit_VarDecl(_type, decl, dim)
-     
     def visit_Return(self, node):
          if node.expr is not None:
-            self.visit(node.expr)
+            yield node.expr
             if isinstance(node.expr, ID) or isinstance(node.expr, ArrayRef):
                 self.load_location(node.expr)
             self.code.append(('store_' + node.expr.type.names[-1].typename, node.expr.gen_location, self.ret_location))
          self.code.append(('jump', self.ret_label))
              
     def visit_UnaryOp(self, node):
-        self.visit(node.expr)
+        yield node.expr
         source = node.expr.gen_location
 
         if node.op == '&':
@@ -407,11 +665,11 @@ class GenerateCode(NodeVisitor):
         exit_label = self.new_temp()
         node.exit_label = exit_label
         self.code.append((entry_label[1:],))
-        self.visit(node.cond)
+        yield node.cond
         self.code.append(('cbranch', node.cond.gen_location, true_label, exit_label))
         self.code.append((true_label[1:],))
         if node.stmt is not None:
-            self.visit(node.stmt)
+            yield node.stmt
         self.code.append(('jump', entry_label))
         self.code.append((exit_label[1:],))
      
@@ -419,15 +677,19 @@ class GenerateCode(NodeVisitor):
         pass
                           
     def visit_Program(self, node):   
+        if self.prune:
+            self.live = reachable(node)
         for decl in node.gdecls:
-            self.visit(decl)
+            if isinstance(decl, FuncDef) and not self.is_live(decl.decl.name):
+                continue
+            yield decl
         self.code = self.text + self.code 
                  
     def visit_Print(self, node):
          if node.expr is not None:
             if isinstance(node.expr[0], ExprList):
                 for expr in node.expr[0].exprs:
-                    self.visit(expr)                    
+                    yield expr
                     if isinstance(expr, ID) or isinstance(expr, ArrayRef):
                         self.load_location(expr)
 
@@ -439,17 +701,17 @@ class GenerateCode(NodeVisitor):
     
     def visit_Read(self, node):
         for loc in node.names:
-            self.visit(loc)      
+            yield loc
             if isinstance(loc, ID) or isinstance(loc, ArrayRef):
                     self.read_location(loc)
             elif isinstance(loc, ExprList):
                     for var in loc.exprs:
-                        self.visit(var)
+                        yield var
                         self.read_location(var)
                                      
     def visit_Assert(self, node):
         expr = node.expr
-        self.visit(expr)
+        yield expr
         true_label = self.new_temp()
         false_label = self.new_temp()
         exit_label = self.new_temp()
@@ -457,19 +719,16 @@ class GenerateCode(NodeVisitor):
         self.code.append((true_label[1:],))
         self.code.append(('jump', exit_label))
         self.code.append((false_label[1:],))
-        target = self.new_text()
         line = node.expr.coord.line
         col = node.expr.coord.column
-        self.text.append(('global_string', target, "assertion_fail on " + f"{line}:{col}"))
+        target = self.new_string("assertion_fail on " + f"{line}:{col}")
         self.code.append(('print_string', target))
         self.code.append(('jump', self.ret_label))
         self.code.append((exit_label[1:],))
       
-    def global_location(self, node, decl, dim):
-        _type = node.type.names[-1].typename
-        if dim is not None:
-            _type += dim
-        varname = "@" + node.declname.name
+    def global_location(self, symbol, decl):
+        _type = symbol.type[-1].typename + self.suffix(symbol)
+        varname = "@" + symbol.name
         if decl.init is None:
             self.text.append(('global_' + _type, varname))
         elif isinstance(decl.init, Constant):
@@ -477,15 +736,15 @@ class GenerateCode(NodeVisitor):
         elif isinstance(decl.init, InitList):
             self.visit(decl.init)
             self.text.append(('global_' + _type, varname, decl.init.value))
-        node.declname.gen_location = varname
+        symbol.slot = varname
        
     def load_location(self, node):
         varname = self.new_temp()
         typename = node.type.names[-1].typename
         if isinstance(node, ArrayRef):
             typename += '_*'     
-        elif isinstance(node.bind, ArrayDecl):
-            typename += '_' + str(node.bind.dim.value)
+        elif node.type.names[0] is ArrayType:
+            typename += '_' + str(self.symbol(node).dims[0])
         self.code.append(('load_' + typename, node.gen_location, varname))
         node.gen_location = varname
         
@@ -42,6 +42,8 @@ class Interpreter(object):
         M = 10000 * [None]      # Memory for global & local vars
 
         self.globals = {}       # Dictionary of address of global vars & constants
+        self.strings = {}       # Dictionary of address of each string constant, so
+                                # equal strings are stored once, as immutable objects
         self.vars = {}          # Dictionary of address of local vars relative to sp
 
         self.offset = 0         # offset (index) of local & global vars. Note that
@@ -76,7 +78,7 @@ class Interpreter(object):
 
     def _copy_data(self, address, size, value):
         if isinstance(value, str):
-            _value = list(value)
+            _value = value
         elif any(isinstance(item, list) for item in value):
             _value = [item for sublist in value for item in sublist]
         else:
@@ -102,7 +104,16 @@ class Interpreter(object):
                 break
             if not op[0].isdigit():
                 opcode, modifier = self._extract_operation(op[0])
-                if opcode.startswith('global'):
+                if opcode == 'global_string':
+                    # the whole string goes in one slot, shared by the
+                    # constants with the same value
+                    _address = self.strings.get(op[2])
+                    if _address is None:
+                        _address = self.strings[op[2]] = self.offset
+                        M[self.offset] = op[2]
+                        self.offset += 1
+                    self.globals[op[1]] = _address
+                elif opcode.startswith('global'):
                     self.globals[op[1]] = self.offset
                     # get the size of global var
                     if not modifier:
@@ -255,8 +266,7 @@ class Interpreter(object):
         _right = self._get_address(value)
         if value.startswith('@'):
             if isinstance(M[_right], str):
-                _value = list(M[_right])
-                M[_left:_left+dim] = _value
+                M[_left:_left+dim] = M[_right]
                 return
         M[_left:_left+dim] = M[_right:_right+dim]
 
@@ -317,6 +327,15 @@ class Interpreter(object):
         else:
             self._push()
 
+    def run_check_bounds(self, index, extent, message):
+        # Only generated in -check-bounds mode, before the references
+        # to arrays the compiler could not prove in bounds
+        _idx = self._get_value(index)
+        if not 0 <= _idx < extent:
+            self.run_print_string(message)
+            print(" (index %d, size %d)" % (_idx, extent), flush=True)
+            sys.exit(1)
+
     def run_elem_int(self, source, index, target):
         self._alloc_reg(target)
         _aux = self._get_address(source)
@@ -383,9 +402,7 @@ class Interpreter(object):
     run_param_char = run_param_int
 
     def run_print_string(self, source):
-        _res = list(self._get_value((source)))
-        for c in _res:
-            print(c, end="", flush=True)
+        print(self._get_value(source), end="", flush=True)
 
     def run_print_int(self, source):
         print(self._get_value(source), end="", flush=True)
@@ -0,0 +1,194 @@
+# ============================================================
+# uc_ir.py -- Readers and writers for uCIR programs
+#
+# uCIR is a list of instruction tuples, as produced by the code
+# generator and consumed by the interpreter. This module stores
+# such a list in a compact binary format (.ucb) and loads it back,
+# so a compiled program can be run without going through the
+# lexer, parser, semantic analysis and code generation again.
+#
+# Textual uCIR (.ir files) is written by write_ir, one instruction
+# per line, and read back by read_ir, which checks every opcode
+# against the handlers of the interpreter.
+#
+# The .ucb layout is:
+#
+#     magic       b'UCB1'
+#     opcodes     count, then every opcode name
+#     strings     count, then every string operand
+#     code        count, then every instruction
+#
+# where an instruction is the index of its opcode, the number of
+# operands and the operands themselves, encoded as described in
+# uc_binary.
+# ============================================================
+
+import re
+import ast
+from uc_ast import ChunkedWriter
+from uc_interpreter import Interpreter
+from uc_binary import BinaryError, StringPool, Reader, write_varint, write_str, write_operand
+
+UCB_MAGIC = b'UCB1'
+
+
+class IRError(Exception):
+    """ Raised when a uCIR program can't be read back. """
+    pass
+
+
+class UCBError(IRError, BinaryError):
+    """ Raised when a .ucb file is malformed. """
+    pass
+
+
+def dump_ucb(code):
+    """ Encodes a list of uCIR instructions, returning bytes. """
+    opcodes = StringPool()
+    strings = StringPool()
+    body = bytearray()
+    write_varint(body, len(code))
+    for inst in code:
+        write_varint(body, opcodes.add(inst[0]))
+        write_varint(body, len(inst) - 1)
+        for _arg in inst[1:]:
+            write_operand(body, strings, _arg)
+
+    out = bytearray(UCB_MAGIC)
+    for table in (opcodes, strings):
+        write_varint(out, len(table.items))
+        for _item in table.items:
+            write_str(out, _item)
+    out += body
+    return bytes(out)
+
+
+def write_ucb(code, buf):
+    """ Writes a list of uCIR instructions to a binary file. """
+    buf.write(dump_ucb(code))
+
+
+def load_ucb(data):
+    """ Decodes bytes produced by dump_ucb back into a list of uCIR
+        instructions.
+    """
+    if data[:len(UCB_MAGIC)] != UCB_MAGIC:
+        raise UCBError("Not a .ucb file")
+    reader = Reader(memoryview(data), '.ucb data')
+    reader.pos = len(UCB_MAGIC)
+    code = []
+    try:
+        opcodes = reader.table()
+        strings = reader.table()
+        for _ in range(reader.varint()):
+            _opcode = opcodes[reader.varint()]
+            _nargs = reader.varint()
+            if _nargs == 0:
+                code.append((_opcode,))
+            else:
+                code.append((_opcode,) + tuple(reader.operand(strings) for _ in range(_nargs)))
+        if reader.pos != len(data):
+            raise BinaryError("Trailing bytes at offset %d of .ucb data" % reader.pos)
+    except IndexError:
+        raise UCBError("Bad table index in .ucb data")
+    except BinaryError as e:
+        raise UCBError(*e.args) from None
+    return code
+
+
+def read_ucb(buf):
+    """ Reads a list of uCIR instructions from a binary file. """
+    return load_ucb(buf.read())
+
+
+def write_ir(code, buf):
+    """ Writes textual uCIR, one instruction per line, streaming the
+        lines to buf in chunks.
+    """
+    out = ChunkedWriter(buf)
+    write = out.write
+    for inst in code:
+        write(f"{inst}\n")
+    out.flush()
+
+
+# One operand of an instruction written by repr(): a plain quoted
+# string, an int or a float, followed by a comma or the closing
+# parenthesis. Anything else (lists, escapes) is left to literal_eval.
+_ir_operand = re.compile(r"""\s*(?:'([^'\\]*)'|(-?\d+)|(-?(?:\d+\.\d*|\.\d+)(?:[eE][-+]?\d+)?|-?\d+[eE][-+]?\d+))\s*(,|\)$)""")
+
+
+def _parse_ir_line(line):
+    if not (line.startswith('(') and line.endswith(')')):
+        raise ValueError
+    _items = []
+    _pos = 1
+    _end = len(line)
+    match = _ir_operand.match
+    while _pos < _end:
+        m = match(line, _pos)
+        if m is None:
+            return ast.literal_eval(line)
+        _str, _int, _float, _sep = m.groups()
+        if _str is not None:
+            _items.append(_str)
+        elif _int is not None:
+            _items.append(int(_int))
+        else:
+            _items.append(float(_float))
+        _pos = m.end()
+        if _sep == ')':
+            break
+        if line.startswith(')', _pos):
+            _pos += 1
+            break
+    if _pos != _end:
+        return ast.literal_eval(line)
+    return tuple(_items)
+
+
+def _valid_opcodes():
+    """ Returns a predicate telling if an opcode has a handler in the
+        interpreter.
+    """
+    _seen = {}
+    _vm = Interpreter.__new__(Interpreter)
+
+    def valid(name):
+        _ok = _seen.get(name)
+        if _ok is None:
+            if name.isdigit():
+                _ok = True
+            else:
+                opcode, modifier = _vm._extract_operation(name)
+                _ok = (opcode in ('global_int', 'global_float', 'global_char', 'global_string', 'define')
+                       or hasattr(Interpreter, 'run_' + opcode + ('_' if modifier else '')))
+            _seen[name] = _ok
+        return _ok
+    return valid
+
+
+def iter_ir(buf):
+    """ Reads textual uCIR, as written by the compiler (one instruction
+        tuple per line), yielding the instructions one at a time.
+        Raises IRError on malformed lines and unknown opcodes.
+    """
+    valid = _valid_opcodes()
+    for lineno, line in enumerate(buf, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            inst = _parse_ir_line(line)
+        except (ValueError, SyntaxError):
+            raise IRError("%d: malformed instruction %s" % (lineno, line))
+        if not isinstance(inst, tuple) or not inst or not isinstance(inst[0], str):
+            raise IRError("%d: malformed instruction %s" % (lineno, line))
+        if not valid(inst[0]):
+            raise IRError("%d: unknown opcode '%s'" % (lineno, inst[0]))
+        yield inst
+
+
+def read_ir(buf):
+    """ Reads textual uCIR into a list of instructions. """
+    return list(iter_ir(buf))
@@ -1,5 +1,41 @@
+import re
 import ply.lex as lex
 import sys
+from array import array
+from bisect import bisect_right
+
+
+class LineIndex(object):
+    """ The offsets at which every line of a text starts, so that any
+        offset can be mapped to its line and column by binary search
+        instead of scanning back to the previous newline.
+    """
+    __slots__ = ('text', 'starts')
+
+    def __init__(self, text):
+        self.text = text
+        starts = array('l', [0])
+        find = text.find
+        pos = find('\n')
+        while pos >= 0:
+            pos += 1
+            starts.append(pos)
+            pos = find('\n', pos)
+        self.starts = starts
+
+    def line(self, offset):
+        """ Line number (starting at 1) of offset. """
+        return bisect_right(self.starts, offset)
+
+    def column(self, offset):
+        """ Column (starting at 1) of offset in its line. """
+        return offset - self.starts[bisect_right(self.starts, offset) - 1] + 1
+
+    def coord(self, offset):
+        """ (line, column) pair of offset. """
+        line = bisect_right(self.starts, offset)
+        return (line, offset - self.starts[line - 1] + 1)
+
 
 class UCLexer():
     """ A lexer for the uC language. After building it, set the
@@ -14,6 +50,7 @@ class UCLexer():
         """
         self.error_func = error_func
         self.filename = ''
+        self.line_index = None
 
         # Keeps track of the last token returned from self.token()
         self.last_token = None
@@ -39,11 +76,18 @@ class UCLexer():
         self.last_token = self.lexer.token()
         return self.last_token
 
+    def lines(self):
+        """ Returns the line index of the current input, building it
+            the first time it's needed.
+        """
+        if self.line_index is None or self.line_index.text is not self.lexer.lexdata:
+            self.line_index = LineIndex(self.lexer.lexdata)
+        return self.line_index
+
     def find_tok_column(self, token):
         """ Find the column of the token in its line.
         """
-        last_cr = self.lexer.lexdata.rfind('\n', 0, token.lexpos)
-        return token.lexpos - last_cr
+        return self.lines().column(token.lexpos)
 
     # Internal auxiliary methods
     def _error(self, msg, token):
@@ -109,33 +153,20 @@ class UCLexer():
     # Literals.  Should be placed in module given to lex()
     literals = ['+','-','*','/' ]
     
-    def t_uccomment(self, t):
-        r'/\*.*\n'
-        t.lexer.lineno += t.value.count('\n')
-
     def t_comment(self, t):
         r'/\*(.|\n)*?\*/'
         t.lexer.lineno += t.value.count('\n')
+
+    def t_unterminated_comment(self, t):
+        r'/\*'
+        # The rest of the input is the comment: lexing stops
+        self._error("Unterminated comment", t)
+        t.lexer.lineno += t.lexer.lexdata.count('\n', t.lexpos)
+        t.lexer.lexpos = len(t.lexer.lexdata)
         
     def t_cppcomment(self, t):
-        r'//.*\n'
-        t.lexer.lineno += t.value.count('\n')
+        r'//.*'
         
-    def t_INT(self, t):
-        r"int"
-        t.type = self.keyword_map.get(t.value, "INT")    
-        return t
-    
-    def t_FLOAT(self, t):
-        r"float"
-        t.type = self.keyword_map.get(t.value, "FLOAT")    
-        return t
-    
-    def t_CHAR(self, t):
-        r"char"
-        t.type = self.keyword_map.get(t.value, "CHAR")    
-        return t
-    
     def t_FLOAT_CONST(self, t):
         r'([0-9]*\.[0-9]+)|([0-9]+\.)'
         t.type = self.keyword_map.get(t.value, "FLOAT_CONST")    
@@ -317,6 +348,8 @@ class UCLexer():
         r'\n+'
         t.lexer.lineno += t.value.count("\n")
 
+    # Keywords are told apart from identifiers here, so that names
+    # starting with one (integer, chart) are still a single ID
     def t_ID(self, t):
         r'[a-zA-Z_][0-9a-zA-Z_]*'
         t.type = self.keyword_map.get(t.value, "ID")
@@ -335,3 +368,257 @@ class UCLexer():
                 break
             print(tok)
 
+
+class UCToken(object):
+    """ A token produced by UCFastLexer. It has the same attributes
+        as the LexToken objects made by PLY, so the parser can't
+        tell them apart.
+    """
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __init__(self, type, value, lineno, lexpos):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __str__(self):
+        return "LexToken(%s,%r,%d,%d)" % (self.type, self.value, self.lineno, self.lexpos)
+
+    __repr__ = __str__
+
+
+class TokenArray(object):
+    """ The tokens of a whole text, stored as parallel arrays: the
+        type id (an index into UCLexer.tokens), start offset, length
+        and line number of every token. The line index maps offsets
+        to columns.
+    """
+    __slots__ = ('text', 'types', 'starts', 'lengths', 'lines', 'line_index')
+
+    type_names = UCLexer.tokens
+    type_ids = {name: i for i, name in enumerate(UCLexer.tokens)}
+
+    def __init__(self, text, types, starts, lengths, lines, line_index):
+        self.text = text
+        self.types = types
+        self.starts = starts
+        self.lengths = lengths
+        self.lines = lines
+        self.line_index = line_index
+
+    def __len__(self):
+        return len(self.types)
+
+    def type(self, i):
+        return self.type_names[self.types[i]]
+
+    def value(self, i):
+        start = self.starts[i]
+        return self.text[start:start + self.lengths[i]]
+
+    def column(self, i):
+        return self.line_index.column(self.starts[i])
+
+    def token(self, i):
+        """ Materializes the i-th token as a UCToken. """
+        return UCToken(self.type(i), self.value(i), self.lines[i], self.starts[i])
+
+    def __iter__(self):
+        for i in range(len(self.types)):
+            yield self.token(i)
+
+
+class UCFastLexer():
+    """ A hand-tuned lexer for the uC language, with the same interface
+        and token stream as UCLexer. All the rules are compiled into
+        a single regular expression, and identifiers are told apart
+        from keywords with a dictionary lookup. UCLexer is kept for
+        differential testing.
+    """
+    keywords = UCLexer.keywords
+    keyword_map = UCLexer.keyword_map
+    tokens = UCLexer.tokens
+
+    operators = {
+        '<=': 'LESSTHANEQ', '>=': 'GREATERTHANEQ', '==': 'EQ', '!=': 'NOTEQ',
+        '+=': 'PLUSEQ', '-=': 'MINUSEQ', '*=': 'TIMESEQ', '/=': 'DIVEQ',
+        '%=': 'MODEQ', '++': 'PLUSPLUS', '--': 'MINUSMINUS', '&&': 'AND',
+        '||': 'OR', '<': 'LESSTHAN', '>': 'GREATERTHAN', '+': 'PLUS',
+        '-': 'MINUS', '*': 'TIMES', '/': 'DIVIDE', '%': 'MOD', '=': 'EQUALS',
+        '!': 'NOT', ';': 'SEMI', ',': 'COMMA', '&': 'ADDRESS', '(': 'LPAREN',
+        ')': 'RPAREN', '{': 'LBRACE', '}': 'RBRACE', '[': 'LBRACKET',
+        ']': 'RBRACKET',
+    }
+
+    keyword_ids = {name.lower(): TokenArray.type_ids[name] for name in keywords}
+    operator_ids = {op: TokenArray.type_ids[name] for (op, name) in operators.items()}
+
+    # Blanks are folded into the front of every match, so they never
+    # cost a match of their own.
+    master = re.compile(r"""[ \t]*(?:
+          (?P<ID>[a-zA-Z_][0-9a-zA-Z_]*)
+        | (?P<OP><=|>=|==|!=|\+=|-=|\*=|/=|%=|\+\+|--|&&|\|\||[-+*%<>=!;,&(){}\[\]]|/(?![*/]))
+        | (?P<NEWLINE>\n+)
+        | (?P<FLOAT_CONST>[0-9]*\.[0-9]+|[0-9]+\.)
+        | (?P<INT_CONST>[0-9]+)
+        | (?P<CHAR_CONST>'.')
+        | (?P<STRING>".*?")
+        | (?P<COMMENT>/\*[\s\S]*?\*/|//[^\n]*)
+        | (?P<UNTERMINATED>/\*)
+        | (?P<ERROR>[\s\S])
+        | \Z)
+        """, re.VERBOSE)
+
+    def __init__(self, error_func):
+        """ Create a new Lexer.
+            An error function. Will be called with an error
+            message, line and column as arguments, in case of
+            an error during lexing.
+        """
+        self.error_func = error_func
+        self.filename = ''
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lineno = 1
+        self.line_index = None
+        self._tokens = iter(())
+
+        # Keeps track of the last token returned from self.token()
+        self.last_token = None
+
+    def build(self, **kwargs):
+        """ Kept for compatibility with UCLexer; there are no tables
+            to build.
+        """
+        # The parser talks to the inner PLY lexer of UCLexer through
+        # the lexer attribute; here it's the object itself.
+        self.lexer = self
+
+    def reset_lineno(self):
+        """ Resets the internal line number counter of the lexer.
+        """
+        self.lineno = 1
+
+    def input(self, text, pos=0):
+        """ Sets the input text, lexed from the offset pos on. """
+        self.lexdata = text
+        self.lexpos = pos
+        self._tokens = self._scan(text, pos)
+
+    def token(self):
+        self.last_token = next(self._tokens, None)
+        return self.last_token
+
+    def lines(self):
+        """ Returns the line index of the current input, building it
+            the first time it's needed.
+        """
+        if self.line_index is None or self.line_index.text is not self.lexdata:
+            self.line_index = LineIndex(self.lexdata)
+        return self.line_index
+
+    def find_tok_column(self, token):
+        """ Find the column of the token in its line.
+        """
+        return self.lines().column(token.lexpos)
+
+    def tokenize_all(self, text, lineno=1):
+        """ Tokenizes the whole text at once, returning a TokenArray
+            instead of one token object per token. lineno is the line
+            number of the start of text.
+        """
+        type_ids = TokenArray.type_ids
+        keyword_ids = self.keyword_ids
+        operator_ids = self.operator_ids
+        types = array('B')
+        starts = array('l')
+        lengths = array('l')
+        lines = array('l')
+        self.lexdata = text
+        self.lineno = lineno
+        for m in self.master.finditer(text):
+            kind = m.lastgroup
+            if kind == 'ID':
+                start, end = m.span(kind)
+                types.append(keyword_ids.get(m.group(kind), type_ids['ID']))
+            elif kind == 'OP':
+                start, end = m.span(kind)
+                types.append(operator_ids[m.group(kind)])
+            elif kind == 'NEWLINE':
+                lineno += m.end() - m.start(kind)
+                continue
+            elif kind is None:
+                continue
+            elif kind == 'COMMENT':
+                lineno += m.group(kind).count('\n')
+                continue
+            elif kind == 'UNTERMINATED':
+                self.lineno = lineno
+                self._error("Unterminated comment", m.start(kind))
+                break
+            elif kind == 'ERROR':
+                self.lineno = lineno
+                self._error("Illegal character %s" % repr(m.group(kind)), m.start(kind))
+                continue
+            else:
+                start, end = m.span(kind)
+                types.append(type_ids[kind])
+            starts.append(start)
+            lengths.append(end - start)
+            lines.append(lineno)
+        self.lineno = lineno
+        return TokenArray(text, types, starts, lengths, lines, self.lines())
+
+    def _scan(self, text, pos):
+        keyword_map = self.keyword_map
+        operators = self.operators
+        token = UCToken
+        for m in self.master.finditer(text, pos):
+            kind = m.lastgroup
+            if kind == 'ID':
+                value = m.group(kind)
+                yield token(keyword_map.get(value, kind), value, self.lineno, m.start(kind))
+            elif kind == 'OP':
+                value = m.group(kind)
+                yield token(operators[value], value, self.lineno, m.start(kind))
+            elif kind == 'NEWLINE':
+                self.lineno += m.end() - m.start(kind)
+            elif kind is None:
+                continue
+            elif kind == 'COMMENT':
+                self.lineno += m.group(kind).count('\n')
+            elif kind == 'UNTERMINATED':
+                self._error("Unterminated comment", m.start(kind))
+                self.lineno += text.count('\n', m.start(kind))
+                break
+            elif kind == 'ERROR':
+                self._error("Illegal character %s" % repr(m.group(kind)), m.start(kind))
+            else:
+                yield token(kind, m.group(kind), self.lineno, m.start(kind))
+            self.lexpos = m.end()
+        self.lexpos = len(text)
+
+    def _error(self, msg, lexpos):
+        self.error_func(msg, self.lineno, self.lines().column(lexpos))
+
+    # Scanner (used only for test)
+    def scan(self, data):
+        self.input(data)
+        while True:
+            tok = self.token()
+            if not tok:
+                break
+            print(tok)
+
+
+def tokenize_all(text, error_func=None):
+    """ Tokenizes the whole text with UCFastLexer, returning a
+        TokenArray. Lexical errors are passed to error_func (message,
+        line, column) or printed if no error_func is given.
+    """
+    if error_func is None:
+        error_func = lambda msg, x, y: print("Lexical error: %s at %d:%d" % (msg, x, y))
+    lexer = UCFastLexer(error_func)
+    lexer.build()
+    return lexer.tokenize_all(text)
@@ -0,0 +1,321 @@
+# ============================================================
+# uc_parsebase.py -- Parts shared by the uC parser backends
+#
+# UCParser (PLY, LALR) and UCRDParser (hand-written recursive
+# descent) build the very same trees. The helpers that turn
+# declarators into Decl nodes, and the splitting of a source into
+# its top-level units (and into the chunks check_parallel hands to
+# its workers), live here so both backends use one copy.
+#
+# parse_parallel also lives here: it only parses, in a process
+# pool, the chunks split_chunks cuts, and joins the declarations
+# back into one Program.
+# ============================================================
+
+import gc
+import uc_ast
+from concurrent.futures import ProcessPoolExecutor
+from uc_lexer import UCFastLexer
+
+# Sources smaller than this (in characters) are not split in chunks:
+# starting the workers would cost more than it saves.
+PARALLEL_MIN_SIZE = 1 << 16
+
+# The parser of a worker process, built once by _init_worker
+_worker_parser = None
+
+_type_specifiers = frozenset(('VOID', 'CHAR', 'INT', 'FLOAT'))
+
+# Where the error recovery stops skipping
+_sync_types = _type_specifiers | frozenset(('SEMI', 'LBRACE', 'RBRACE'))
+
+# Stands for an initializer list skipped by the error recovery: the
+# declaration it belongs to is dropped
+SKIPPED_INIT = object()
+
+
+def _skipped(init):
+    if isinstance(init, uc_ast.InitList):
+        return any(_skipped(_expr) for _expr in init.exprs)
+    return init is SKIPPED_INIT
+
+
+def _init_worker(parser_class, fast_lexer):
+    global _worker_parser
+    _worker_parser = parser_class(fast_lexer)
+
+
+def _parse_chunk(chunk):
+    """ Parses a group of consecutive units in a worker process.
+        Returns their declarations (None if the parse failed), the
+        errors found and the names dropped by the error recovery.
+    """
+    text, lineno, column, _names = chunk
+    ast = _worker_parser.parse_unit(text, lineno, column)
+    return (ast.gdecls if ast is not None else None), _worker_parser.errors, _worker_parser.dropped
+
+
+class ParserBase(object):
+    """ Base class of the uC parsers. Subclasses set self.lexer, and
+        collect the errors of the last parse in self.errors, as
+        (coord, message) pairs; coord is None at the end of input.
+        The names declared by the declarations the error recovery
+        dropped are collected in self.dropped.
+    """
+
+    def _syntax_error(self, msg, coord):
+        self.errors.append((coord, msg))
+
+    def _lex_error(self, msg, line, column):
+        self.errors.append((uc_ast.Coord(line, column), "Lexical error: %s" % msg))
+
+    def _drop(self, text, start, error):
+        """ Records the names declared by the declaration at offset
+            start of text, which the recovery from the error found at
+            offset error skips: the identifiers its declarators start
+            with, up to where the recovery syncs.
+        """
+        scanner = UCFastLexer(lambda msg, x, y: None)
+        scanner.input(text, start)
+        tok = scanner.token()
+        if tok is None or tok.type not in _type_specifiers:
+            return
+        depth = 0
+        expect = True
+        for tok in iter(scanner.token, None):
+            _type = tok.type
+            if tok.lexpos >= error and _type in _sync_types:
+                break
+            if _type in ('LPAREN', 'LBRACKET', 'LBRACE'):
+                depth += 1
+            elif _type in ('RPAREN', 'RBRACKET', 'RBRACE'):
+                depth -= 1
+            elif depth == 0:
+                if _type == 'ID' and expect:
+                    self.dropped.add(tok.value)
+                # Pointers, and the next declarator
+                expect = _type == 'COMMA' or (expect and _type == 'TIMES')
+
+    def parse_parallel(self, text, jobs):
+        """ Parses text in up to jobs worker processes, with no
+            semantic analysis (check_parallel has its workers check
+            the function bodies as well). The chunks of split_chunks
+            are parsed in a process pool, and their declarations are
+            joined, in order, into one Program. Errors are collected in
+            self.errors as by parse. Sources split_chunks doesn't split
+            are parsed sequentially.
+        """
+        chunks = self.split_chunks(text, jobs)
+        if chunks is None:
+            return self.parse(text)
+
+        # Unpickling the trees sent back by the workers allocates a lot
+        # of objects; the cyclic collector is paused meanwhile (the
+        # trees hold no cycles).
+        _gc = gc.isenabled()
+        gc.disable()
+        try:
+            with ProcessPoolExecutor(jobs, initializer=_init_worker,
+                                     initargs=(type(self), self.fast_lexer)) as pool:
+                results = list(pool.map(_parse_chunk, chunks))
+        finally:
+            if _gc:
+                gc.enable()
+
+        self.errors = []
+        self.dropped = set()
+        gdecls = []
+        failed = False
+        for (_gdecls, _errors, _dropped) in results:
+            self.errors.extend(_errors)
+            self.dropped.update(_dropped)
+            if _gdecls is None:
+                failed = True
+            else:
+                gdecls.extend(_gdecls)
+        return None if failed else uc_ast.Program(gdecls)
+
+    def split_chunks(self, text, jobs):
+        """ Splits text in chunks of consecutive top-level units, to be
+            parsed by up to jobs workers, as (text, lineno, column,
+            names) tuples, where names is the set of identifiers
+            referenced in the chunk. Returns None if text is better
+            parsed sequentially.
+        """
+        units = self.split_units(text) if jobs > 1 and len(text) >= PARALLEL_MIN_SIZE else None
+        if units is None or len(units) < 2:
+            return None
+
+        # A few chunks per worker, so that a slow chunk doesn't leave
+        # the other workers idle at the end.
+        _size = len(text) // (jobs * 4) + 1
+        # Chunks are cut at the start of a unit and cover the whole
+        # text, so whatever lies between two units is still lexed.
+        chunks = []
+        _start, _lineno, _column = 0, 1, 1
+        _names = set(units[0][4])
+        for unit in units[1:]:
+            if unit[0] - _start > _size:
+                chunks.append((text[_start:unit[0]], _lineno, _column, _names))
+                _start, _lineno, _column = unit[0], unit[2], unit[3]
+                _names = set()
+            _names.update(unit[4])
+        chunks.append((text[_start:], _lineno, _column, _names))
+        return chunks
+
+    def split_units(self, text):
+        """ Splits the source text at the boundaries of its top-level
+            units (global declarations and function definitions) by
+            brace matching over the token stream. Returns a list of
+            (start, end, lineno, column, names) tuples, where start and
+            end are offsets into text and names is the set of
+            identifiers referenced inside the unit. Returns None if there
+            is a lexical error outside the units, which parsing them
+            would not report.
+        """
+        if self.scanner is None:
+            self.scanner = type(self.lexer)(None)
+            self.scanner.build()
+        scanner = self.scanner
+        units = []
+        start = None
+        outside = []
+        scanner.error_func = lambda msg, x, y: outside.append(msg) if start is None else None
+        scanner.input(text)
+        scanner.reset_lineno()
+
+        depth = 0
+        body = False        # unit is a function definition
+        krstyle = False     # old style parameter declarations
+        prev = None
+        for tok in iter(scanner.token, None):
+            _type = tok.type
+            if start is None:
+                start = tok.lexpos
+                lineno = tok.lineno
+                column = scanner.find_tok_column(tok)
+                names = set()
+            if _type == 'ID':
+                names.add(tok.value)
+            elif _type == 'LBRACE':
+                if depth == 0 and (prev == 'RPAREN' or krstyle):
+                    body = True
+                depth += 1
+            elif _type == 'RBRACE':
+                depth -= 1
+            elif depth == 0 and prev == 'RPAREN' and _type in ('VOID', 'CHAR', 'INT', 'FLOAT'):
+                krstyle = True
+            prev = _type
+            if depth == 0 and ((_type == 'RBRACE' and body) or (_type == 'SEMI' and not krstyle)):
+                end = tok.lexpos + len(tok.value)
+                units.append((start, end, lineno, column, names))
+                start = None
+                body = krstyle = False
+        if start is not None:
+            # Unterminated unit: hand it to the parser as it is, so the
+            # syntax error is reported at the right place.
+            units.append((start, len(text), lineno, column, names))
+        return units if not outside else None
+
+    def _build_declarations(self, spec, decls):
+        """ Builds a list of declarations all sharing the given specifiers.
+        """
+        declarations = []
+        for decl in decls:
+            assert decl['decl'] is not None
+            if _skipped(decl.get('init')):
+                _type = decl['decl']
+                while not isinstance(_type, uc_ast.VarDecl):
+                    _type = _type.type
+                self.dropped.add(_type.declname.name)
+                continue
+            declaration = uc_ast.Decl(
+                    name=None,
+                    type=decl['decl'],
+                    init=decl.get('init'),
+                    coord=decl['decl'].pos)
+            fixed_decl = self._fix_decl_name_type(declaration, spec)
+            declarations.append(fixed_decl)
+
+        return declarations
+      
+    def _build_function_definition(self, spec, decl, param_decls, body):
+        """ Builds a function definition.
+        """
+        declaration = self._build_declarations(
+            spec=spec,
+            decls=[dict(decl=decl, init=None)],
+            )[0]
+
+        return uc_ast.FuncDef(
+            spec,
+            decl=declaration,
+            param_decls=param_decls,
+            body=body,
+            coord=decl.pos)
+ 
+    def _fix_decl_name_type(self, decl, typename):
+        """ Fixes a declaration. Modifies decl.
+        """
+        # Reach the underlying basic type
+        type = decl
+        while not isinstance(type, uc_ast.VarDecl):
+            type = type.type
+
+        decl.name = type.declname
+
+        # The typename is a list of types. If any type in this
+        # list isn't an Type, it must be the only
+        # type in the list.
+        # If all the types are basic, they're collected in the
+        # Type holder.
+        for tn in typename:
+            if not isinstance(tn, uc_ast.Type):
+                if len(typename) > 1:
+                    self._parse_error(
+                        "Invalid multiple types specified", tn.coord)
+                else:
+                    type.type = tn
+                    return decl
+
+        if not typename:
+            # Functions default to returning int
+            if not isinstance(decl.type, uc_ast.FuncDecl):
+                self._parse_error("Missing type in declaration", decl.coord)
+            type.type = uc_ast.Type(['int'], coord=decl.pos)
+        else:
+            # At this point, we know that typename is a list of Type
+            # nodes. Concatenate all the names into a single list.
+            type.type = uc_ast.Type(
+                [typename.names[0]],
+                coord=typename.pos)
+        return decl
+    
+    def _type_modify_decl(self, decl, modifier):
+        """ Tacks a type modifier on a declarator, and returns
+            the modified declarator.
+            Note: the declarator and modifier may be modified
+        """
+        modifier_head = modifier
+        modifier_tail = modifier
+
+        # The modifier may be a nested list. Reach its tail.
+        while modifier_tail.type:
+            modifier_tail = modifier_tail.type
+
+        # If the decl is a basic type, just tack the modifier onto it
+        if isinstance(decl, uc_ast.VarDecl):
+            modifier_tail.type = decl
+            return modifier
+        else:
+            # Otherwise, the decl is a list of modifiers. Reach
+            # its tail and splice the modifier onto the tail,
+            # pointing to the underlying basic type.
+            decl_tail = decl
+
+            while not isinstance(decl_tail.type, uc_ast.VarDecl):
+                decl_tail = decl_tail.type
+
+            modifier_tail.type = decl_tail.type
+            decl_tail.type = modifier_head
+            return decl
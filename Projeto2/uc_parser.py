@@ -1,135 +1,73 @@
 import ply.yacc as yacc
 
 # import the lex class
-from uc_lexer import UCLexer
+from uc_lexer import UCLexer, UCFastLexer
 import uc_ast
+from uc_parsebase import ParserBase, SKIPPED_INIT
 #tokens = UCLexer.tokens
 
-def print_error(msg, x, y):
-    print("Lexical error: %s at %d:%d" % (msg, x, y))
+class UCParser(ParserBase):
 
-class UCParser():
-
-    def __init__(self):
-        self.lexer = UCLexer(print_error)
+    def __init__(self, fast_lexer=False):
+        """ Builds the parser. If fast_lexer is set, the input is
+            tokenized by UCFastLexer instead of the PLY based UCLexer.
+        """
+        self.lexer = (UCFastLexer if fast_lexer else UCLexer)(self._lex_error)
         self.lexer.build()
+        self.fast_lexer = fast_lexer
         self.filename = ''
         self.last_token = None
         self.tokens = UCLexer.tokens
-        self.parser = yacc.yacc(module=self,)
+        self.scanner = None
+        self.errors = []
+        self.dropped = set()
+        self.build()
     
     def build(self):
         self.parser = yacc.yacc(module=self,)
+        # The error rules reduce without reading the next token, so
+        # that their errok runs before it: an error on it is reported
+        for _state, _actions in self.parser.action.items():
+            _rules = set(_actions.values())
+            if len(_rules) == 1:
+                _rule = _rules.pop()
+                if _rule < 0 and 'error' in self.parser.productions[-_rule].str.split():
+                    self.parser.defaulted_states[_state] = _rule
         
     def parse(self, text, filename='', debug=False):
+        """ Parses text, returning the AST. Syntax errors don't stop the
+            parse: they are collected in self.errors and the erroneous
+            declaration or statement is left out of the tree.
+        """
+        self.errors = []
+        self.dropped = set()
+        self.lexer.reset_lineno()
         return self.parser.parse(
                 input=text,
+                lexer=self.lexer.lexer,
                 debug=debug)
-    
-    def _token_coord(self, p, token_idx, set_column=False):
-        last_cr = p.lexer.lexdata.rfind('\n', 0, p.lexpos(token_idx))
-        if last_cr < 0:
-            last_cr = -1
-        column = (p.lexpos(token_idx) - (last_cr))
-        return uc_ast.Coord(p.lineno(token_idx), 1 if set_column else column)    
-    
-    
-    def _build_declarations(self, spec, decls):
-        """ Builds a list of declarations all sharing the given specifiers.
-        """
-        declarations = []
-        for decl in decls:
-            assert decl['decl'] is not None
-            declaration = uc_ast.Decl(
-                    name=None,
-                    type=decl['decl'],
-                    init=decl.get('init'),
-                    coord=decl['decl'].coord)
-            fixed_decl = self._fix_decl_name_type(declaration, spec)
-            declarations.append(fixed_decl)
-
-        return declarations
-      
-    def _build_function_definition(self, spec, decl, param_decls, body):
-        """ Builds a function definition.
-        """
-        declaration = self._build_declarations(
-            spec=spec,
-            decls=[dict(decl=decl, init=None)],
-            )[0]
-
-        return uc_ast.FuncDef(
-            spec,
-            decl=declaration,
-            param_decls=param_decls,
-            body=body,
-            coord=decl.coord)
- 
-    def _fix_decl_name_type(self, decl, typename):
-        """ Fixes a declaration. Modifies decl.
-        """
-        # Reach the underlying basic type
-        type = decl
-        while not isinstance(type, uc_ast.VarDecl):
-            type = type.type
-
-        decl.name = type.declname
-
-        # The typename is a list of types. If any type in this
-        # list isn't an Type, it must be the only
-        # type in the list.
-        # If all the types are basic, they're collected in the
-        # Type holder.
-        for tn in typename:
-            if not isinstance(tn, uc_ast.Type):
-                if len(typename) > 1:
-                    self._parse_error(
-                        "Invalid multiple types specified", tn.coord)
-                else:
-                    type.type = tn
-                    return decl
-
-        if not typename:
-            # Functions default to returning int
-            if not isinstance(decl.type, uc_ast.FuncDecl):
-                self._parse_error("Missing type in declaration", decl.coord)
-            type.type = uc_ast.Type(['int'], coord=decl.coord)
-        else:
-            # At this point, we know that typename is a list of Type
-            # nodes. Concatenate all the names into a single list.
-            type.type = uc_ast.Type(
-                [typename.names[0]],
-                coord=typename.coord)
-        return decl
-    
-    def _type_modify_decl(self, decl, modifier):
-        """ Tacks a type modifier on a declarator, and returns
-            the modified declarator.
-            Note: the declarator and modifier may be modified
-        """
-        modifier_head = modifier
-        modifier_tail = modifier
-
-        # The modifier may be a nested list. Reach its tail.
-        while modifier_tail.type:
-            modifier_tail = modifier_tail.type
-
-        # If the decl is a basic type, just tack the modifier onto it
-        if isinstance(decl, uc_ast.VarDecl):
-            modifier_tail.type = decl
-            return modifier
-        else:
-            # Otherwise, the decl is a list of modifiers. Reach
-            # its tail and splice the modifier onto the tail,
-            # pointing to the underlying basic type.
-            decl_tail = decl
 
-            while not isinstance(decl_tail.type, uc_ast.VarDecl):
-                decl_tail = decl_tail.type
+    def parse_unit(self, text, lineno=1, column=1, debug=False):
+        """ Parses a single top-level unit taken out of a larger source.
+            lineno and column give the position of the unit in the
+            original text, so the coordinates of the resulting nodes
+            are the same as if the whole source had been parsed.
+        """
+        self.errors = []
+        self.dropped = set()
+        self.lexer.input(' ' * (column - 1) + text)
+        self.lexer.lexer.lineno = lineno
+        return self.parser.parse(
+                lexer=self.lexer.lexer,
+                debug=debug)
 
-            modifier_tail.type = decl_tail.type
-            decl_tail.type = modifier_head
-            return decl
+    def _token_coord(self, p, token_idx, set_column=False):
+        # Columns come from the line index of the input (built once
+        # per input), instead of scanning back to the last newline.
+        # The coord is packed in an int, see uc_ast.pack_coord.
+        column = 1 if set_column else self.lexer.lines().column(p.lexpos(token_idx))
+        return uc_ast.pack_coord(p.lineno(token_idx), column)
+    
     
     precedence = (
         ('left', 'COMMA'),
@@ -156,7 +94,11 @@ class UCParser():
         global_declaration_list : global_declaration
                                 | global_declaration_list global_declaration
         '''
-        p[0] = [p[1]] if len(p) == 2 else p[1] + [p[2]]
+        # Declarations dropped by error recovery are None
+        if len(p) == 2:
+            p[0] = [p[1]] if p[1] is not None else []
+        else:
+            p[0] = p[1] + [p[2]] if p[2] is not None else p[1]
     
     def p_global_declaration_1(self,p):
         '''
@@ -169,6 +111,100 @@ class UCParser():
         global_declaration : declaration
         '''
         p[0] = uc_ast.GlobalDecl(p[1])
+
+    def p_global_declaration_3(self, p):
+        '''
+        global_declaration : error SEMI
+                           | error brace_group
+        '''
+        # Skips to the end of the declaration, or past the body of
+        # the broken function
+        p.parser.errok()
+        p[0] = None
+
+    def p_global_declaration_4(self, p):
+        '''
+        global_declaration : resync declaration
+                           | resync type_specifier declarator declaration_list_opt compound_statement
+        '''
+        if len(p) == 3:
+            p[0] = uc_ast.GlobalDecl(p[2])
+        else:
+            p[0] = self._build_function_definition(spec=p[2], decl=p[3], param_decls=p[4], body=p[5])
+
+    def p_resync(self, p):
+        '''
+        resync : error
+        '''
+        # A type specifier found while skipping starts a declaration,
+        # as after a missing ';': the parse goes on from it
+        p.parser.errok()
+
+    def p_brace_group(self, p):
+        '''
+        brace_group : LBRACE skipped_tokens RBRACE
+        '''
+        pass
+
+    def p_skipped_tokens(self, p):
+        '''
+        skipped_tokens : empty
+                       | skipped_tokens skipped_token
+                       | skipped_tokens brace_group
+        '''
+        pass
+
+    def p_skipped_token(self, p):
+        '''
+        skipped_token : ASSERT
+                      | BREAK
+                      | CHAR
+                      | ELSE
+                      | FLOAT
+                      | FOR
+                      | IF
+                      | INT
+                      | PRINT
+                      | READ
+                      | RETURN
+                      | VOID
+                      | WHILE
+                      | ID
+                      | INT_CONST
+                      | FLOAT_CONST
+                      | STRING
+                      | CHAR_CONST
+                      | LESSTHAN
+                      | LESSTHANEQ
+                      | GREATERTHAN
+                      | GREATERTHANEQ
+                      | NOTEQ
+                      | PLUSEQ
+                      | MINUSEQ
+                      | TIMESEQ
+                      | DIVEQ
+                      | MODEQ
+                      | PLUSPLUS
+                      | MINUSMINUS
+                      | PLUS
+                      | MINUS
+                      | TIMES
+                      | DIVIDE
+                      | MOD
+                      | EQUALS
+                      | EQ
+                      | SEMI
+                      | COMMA
+                      | ADDRESS
+                      | AND
+                      | OR
+                      | NOT
+                      | LPAREN
+                      | RPAREN
+                      | LBRACKET
+                      | RBRACKET
+        '''
+        pass
      
     def p_function_definition_1(self,p):
         '''
@@ -181,8 +217,13 @@ class UCParser():
         '''
         function_definition : declarator declaration_list_opt compound_statement
         '''
-        spec = dict(type=[uc_ast.IdentifierType(['void'], coord=self._token_coord(p, 1))],function=[])
-        p[0] = self._build_function_definition(spec=spec,decl=p[1],param_decls=p[2],body=p[3])
+        # Functions without a return type are not supported, as by
+        # UCRDParser: the definition is reported and left out
+        _decl = p[1]
+        while not isinstance(_decl, uc_ast.VarDecl):
+            _decl = _decl.type
+        self._syntax_error("Error near the symbol %s" % _decl.declname.name, _decl.declname.coord)
+        p[0] = None
 
     def p_type_specifier(self,p):
         '''
@@ -193,6 +234,8 @@ class UCParser():
         '''
         coord = self._token_coord(p,1)
         p[0] = uc_ast.Type([p[1]], coord)
+        # Where a declaration starts, for p_error
+        p.set_lexpos(0, p.lexpos(1))
   
     def p_declaration_list_opt(self, p):
         '''
@@ -226,7 +269,7 @@ class UCParser():
                 | TIMES pointer
         ''' 
         coord = self._token_coord(p, 1)
-        nested_type = uc_ast.PtrDecl(quals=p[2] or [], type=None, coord=coord)
+        nested_type = uc_ast.PtrDecl(quals=[], type=None, coord=coord)
         if len(p) > 2:
             tail_type = p[2]
             while tail_type.type is not None:
@@ -254,7 +297,7 @@ class UCParser():
         direct_declarator : direct_declarator LBRACKET constant_expression_opt RBRACKET
         '''
         arr = uc_ast.ArrayDecl(
-            None, p[3] if len(p) > 4 else None, p[1].coord)
+            None, p[3] if len(p) > 4 else None, p[1].pos)
         p[0] = self._type_modify_decl(p[1], arr)
             
 
@@ -264,7 +307,7 @@ class UCParser():
                           | direct_declarator LPAREN identifier_list_opt RPAREN
         '''  
        
-        func = uc_ast.FuncDecl(p[3], None, p[1].coord)
+        func = uc_ast.FuncDecl(p[3], None, p[1].pos)
         p[0] = self._type_modify_decl(p[1], func)
 
     def p_identifier(self,p):
@@ -288,7 +331,7 @@ class UCParser():
                         | identifier_list COMMA identifier
         ''' 
         if len(p) == 2: 
-            p[0] = uc_ast.ParamList([p[1]], p[1].coord)
+            p[0] = uc_ast.ParamList([p[1]], p[1].pos)
         else:
             p[1].params.append(p[3])
             p[0] = p[1]
@@ -326,7 +369,7 @@ class UCParser():
         if len(p) == 2:
             p[0] = p[1]
         else:
-            p[0] = uc_ast.BinaryOp(p[2], p[1], p[3], p[1].coord)
+            p[0] = uc_ast.BinaryOp(p[2], p[1], p[3], p[1].pos)
     
     def p_cast_expression_1(self,p):
         '''
@@ -352,7 +395,7 @@ class UCParser():
                          | MINUSMINUS unary_expression
                          | unary_operator cast_expression
         '''
-        p[0] = uc_ast.UnaryOp(p[1], p[2], p[2].coord)
+        p[0] = uc_ast.UnaryOp(p[1], p[2], p[2].pos)
                    
     def p_postfix_expression_1(self,p): 
         '''
@@ -364,21 +407,21 @@ class UCParser():
         '''
         postfix_expression : postfix_expression LBRACKET expression RBRACKET
         '''
-        p[0] = uc_ast.ArrayRef(p[1], p[3], p[1].coord)
+        p[0] = uc_ast.ArrayRef(p[1], p[3], p[1].pos)
          
     def p_postfix_expression_3(self,p): 
         '''
         postfix_expression : postfix_expression LPAREN RPAREN
                            | postfix_expression LPAREN argument_expression RPAREN
         '''  
-        p[0] = uc_ast.FuncCall(p[1], p[3] if len(p) > 4 else None, p[1].coord)
+        p[0] = uc_ast.FuncCall(p[1], p[3] if len(p) > 4 else None, p[1].pos)
 
     def p_postfix_expression_4(self,p): 
         '''
         postfix_expression : postfix_expression PLUSPLUS
                            | postfix_expression MINUSMINUS
         '''  
-        p[0] = uc_ast.UnaryOp('p' + p[2], p[1], p[1].coord)
+        p[0] = uc_ast.UnaryOp('p' + p[2], p[1], p[1].pos)
 
     def p_primary_expression_1(self,p):
         '''
@@ -428,7 +471,7 @@ class UCParser():
         expression : expression COMMA assignment_expression
         '''
         if not isinstance(p[1], uc_ast.ExprList):
-            p[1] = uc_ast.ExprList([p[1]], p[1].coord)
+            p[1] = uc_ast.ExprList([p[1]], p[1].pos)
         p[1].exprs.append(p[3])
         p[0] = p[1]
 
@@ -442,7 +485,7 @@ class UCParser():
             p[0] = p[1]
         else:
             if (not isinstance(p[1], uc_ast.ExprList)):
-                p[1] = uc_ast.ExprList([p[1]], p[1].coord)
+                p[1] = uc_ast.ExprList([p[1]], p[1].pos)
             p[1].exprs.append(p[3])
             p[0] = p[1]
     
@@ -454,7 +497,7 @@ class UCParser():
         if len(p) == 2:
             p[0] = p[1]
         else:
-            p[0] = uc_ast.Assignment(p[2], p[1], p[3], p[1].coord)
+            p[0] = uc_ast.Assignment(p[2], p[1], p[3], p[1].pos)
     
     def p_assignment_operator(self,p):
         '''
@@ -483,7 +526,7 @@ class UCParser():
                            | parameter_list COMMA parameter_declaration
         '''
         if len(p) == 2: 
-            p[0] = uc_ast.ParamList([p[1]], p[1].coord)
+            p[0] = uc_ast.ParamList([p[1]], p[1].pos)
         else:
             p[1].params.append(p[3])
             p[0] = p[1]
@@ -544,12 +587,20 @@ class UCParser():
         else:
             p[0] = p[2]
     
+    def p_initializer_error(self, p):
+        ''' initializer : LBRACE error RBRACE
+                        | LBRACE initializer_list error RBRACE
+        '''
+        # Skips to the closing brace; the declaration is dropped
+        p.parser.errok()
+        p[0] = SKIPPED_INIT
+
     def p_initializer_list(self,p):
         ''' initializer_list : initializer 
                              | initializer_list COMMA initializer
         '''
         if len(p) == 2:
-            p[0] = uc_ast.InitList([p[1]], p[1].coord)
+            p[0] = uc_ast.InitList([p[1]], p[1].pos)
         else:
             p[1].exprs.append(p[3])
             p[0] = p[1]
@@ -559,6 +610,16 @@ class UCParser():
         compound_statement : LBRACE block_item_list_opt RBRACE
         '''
         p[0] = uc_ast.Compound(block_items=p[2],coord=self._token_coord(p, 1, set_column=True))
+
+    def p_compound_statement_error(self, p):
+        '''
+        compound_statement : LBRACE error RBRACE
+                           | LBRACE block_item_list error RBRACE
+        '''
+        # Skips to the closing brace, keeping the items before the error
+        p.parser.errok()
+        p[0] = uc_ast.Compound(block_items=p[2] if len(p) == 5 else [],
+                               coord=self._token_coord(p, 1, set_column=True))
     
     def p_block_item_list_opt(self,p):
         '''
@@ -579,6 +640,20 @@ class UCParser():
                    | statement
         '''
         p[0] = p[1] if isinstance(p[1], list) else [p[1]]
+
+    def p_block_item_error(self, p):
+        '''
+        block_item : error SEMI
+                   | error brace_group
+        '''
+        p.parser.errok()
+        p[0] = []
+
+    def p_block_item_resync(self, p):
+        '''
+        block_item : resync declaration
+        '''
+        p[0] = p[2] if isinstance(p[2], list) else [p[2]]
     
     def p_statement(self,p):
         ''' statement : expression_statement
@@ -595,7 +670,7 @@ class UCParser():
     def p_expression_statement(self, p):
         ''' expression_statement : expression_opt SEMI '''
         if p[1] is None:
-            p[0] = uc_ast.EmptyStatement(self.__token_coor(p, 2))
+            p[0] = uc_ast.EmptyStatement(self._token_coord(p, 2))
         else:            
             p[0] = p[1] 
         
@@ -661,8 +736,48 @@ class UCParser():
         
     def p_error(self, p):
         if p:
-            print("Error near the symbol %s" % p.value)
-        else:
-            print("Error at the end of input")
+            column = self.lexer.lines().column(p.lexpos)
+            coord = uc_ast.Coord(p.lineno, column)
+            msg = "Error near the symbol %s" % p.value
+            # A token that ends a skipped group and fits nowhere is
+            # met again once the error rule's errok runs: report it once
+            if self.errors and (str(self.errors[-1][0]), self.errors[-1][1]) == (str(coord), msg):
+                return
+            self._syntax_error(msg, coord)
+            self._drop_popped(p.lexpos)
+        elif not self.errors:
+            # After an error, an input ending early is taken to be
+            # its doing: the parse just stops
+            self._syntax_error("Error at the end of input", None)
+
+    def _drop_popped(self, lexpos):
+        """ Records the names declared by the declaration the recovery
+            from the error at lexpos drops (see ParserBase._drop). As
+            PLY will, the reductions on the error token are made, on a
+            copy of the stacks, then the symbols below the state that
+            shifts it are popped.
+        """
+        parser = self.parser
+        states = list(parser.statestack)
+        # The symbols, as their type and the offset they start at
+        symbols = [(_sym.type, getattr(_sym, 'lexpos', None)) for _sym in parser.symstack]
+        popped = []
+        while len(states) > 1:
+            t = parser.action[states[-1]].get('error')
+            if t is None:
+                states.pop()
+                popped.append(symbols.pop())
+            elif t > 0:
+                break
+            else:
+                prod = parser.productions[-t]
+                _start = symbols[-prod.len][1] if prod.len else None
+                del states[len(states) - prod.len:]
+                del symbols[len(symbols) - prod.len:]
+                states.append(parser.goto[states[-1]][prod.name])
+                symbols.append((prod.name, _start))
+        popped = [_sym for _sym in reversed(popped) if _sym[0] != 'resync']
+        if popped and popped[0][1] is not None:
+            self._drop(self.lexer.lexer.lexdata, popped[0][1], lexpos)
     
     
@@ -0,0 +1,617 @@
+# ============================================================
+# uc_rdparser.py -- Hand-written recursive descent parser for uC
+#
+# A second parser backend, building the same uc_ast trees as the
+# PLY based UCParser (including their coordinates), without any
+# parser tables. Statements and declarations are parsed by plain
+# recursive descent; binary expressions by precedence climbing
+# (Pratt), one loop for all the levels of the precedence table.
+#
+# The input is tokenized at once by UCFastLexer.tokenize_all, so
+# the parser walks a list of token type names by index.
+# ============================================================
+
+import gc
+import uc_ast
+from uc_ast import COLUMN_BITS, pack_coord, coord_at
+from uc_lexer import UCFastLexer
+from uc_parsebase import ParserBase, SKIPPED_INIT
+
+
+class ParseError(Exception):
+    """ Raised to unwind the parser on a syntax error; pos is the
+        index of the offending token.
+    """
+    def __init__(self, pos):
+        self.pos = pos
+        self.reported = False
+
+
+# Binding power of the binary operators, from UCParser.precedence.
+_binary_prec = {
+    'OR': 1,
+    'AND': 2,
+    'EQ': 3, 'NOTEQ': 3,
+    'GREATERTHAN': 4, 'GREATERTHANEQ': 4, 'LESSTHAN': 4, 'LESSTHANEQ': 4,
+    'PLUS': 5, 'MINUS': 5,
+    'TIMES': 6, 'DIVIDE': 6, 'MOD': 6,
+}
+
+_type_specifiers = frozenset(('VOID', 'CHAR', 'INT', 'FLOAT'))
+_prefix_operators = frozenset(('PLUSPLUS', 'MINUSMINUS', 'AND', 'TIMES', 'PLUS', 'MINUS', 'NOT', 'ADDRESS'))
+_assignment_operators = frozenset(('EQUALS', 'TIMESEQ', 'DIVEQ', 'MODEQ', 'PLUSEQ', 'MINUSEQ'))
+_constants = {'INT_CONST': 'int', 'CHAR_CONST': 'char', 'FLOAT_CONST': 'float', 'STRING': 'string'}
+
+
+class UCRDParser(ParserBase):
+
+    def __init__(self, fast_lexer=True):
+        """ Builds the parser. The input is always tokenized by
+            UCFastLexer; fast_lexer is accepted for symmetry with
+            UCParser.
+        """
+        self.lexer = UCFastLexer(self._lex_error)
+        self.lexer.build()
+        self.fast_lexer = fast_lexer
+        self.filename = ''
+        self.scanner = None
+        self.errors = []
+        self.dropped = set()
+
+    def parse(self, text, filename='', debug=False):
+        return self.parse_unit(text, debug=debug)
+
+    def parse_unit(self, text, lineno=1, column=1, debug=False):
+        """ Parses a whole source, or a single top-level unit taken out
+            of a larger one (see UCParser.parse_unit). Syntax errors are
+            collected in self.errors; the parser then skips to the end
+            of the declaration or statement and goes on. Returns None
+            if the input ends in the middle of a construct, or is nested
+            deeper than the Python stack allows (an error too).
+        """
+        self.errors = []
+        self.dropped = set()
+        toks = self.lexer.tokenize_all(' ' * (column - 1) + text, lineno)
+        text = self.text = toks.text
+        starts = self.starts = toks.starts
+        line_starts = toks.line_index.starts
+        type_names = toks.type_names
+        self.types = [type_names[_t] for _t in toks.types]
+        self.types.append('$end')
+        self.values = [text[_s:_s + _l] for (_s, _l) in zip(starts, toks.lengths)]
+        self.lines = toks.lines
+        self.columns = [_s - line_starts[_l - lineno] + 1 for (_s, _l) in zip(starts, toks.lines)]
+        # The coords of the nodes, packed as by uc_ast.pack_coord
+        self.coords = [(_l << COLUMN_BITS) | _c for (_l, _c) in zip(toks.lines, self.columns)]
+        self.pos = 0
+        # The tree holds no reference cycles, so the cyclic collector
+        # would only rescan the nodes already built, over and over.
+        _gc = gc.isenabled()
+        gc.disable()
+        try:
+            return self._program()
+        except ParseError as e:
+            if not e.reported:
+                self._report(e)
+            return None
+        except RecursionError:
+            # Nested too deeply to parse by recursion: reported at the
+            # token reached, where the parse stops
+            _pos = min(self.pos, len(self.values) - 1)
+            self._syntax_error("Nesting too deep near the symbol %s" % self.values[_pos],
+                               coord_at(self.coords[_pos]))
+            return None
+        finally:
+            if _gc:
+                gc.enable()
+
+    # Token access
+
+    def _coord(self, pos):
+        return self.coords[pos]
+
+    def _offset(self, pos):
+        return self.starts[pos] if pos < len(self.starts) else len(self.text)
+
+    def _report(self, e):
+        e.reported = True
+        if e.pos < len(self.values):
+            self._syntax_error("Error near the symbol %s" % self.values[e.pos], coord_at(self.coords[e.pos]))
+        elif not self.errors:
+            # After an error, an input ending early is taken to be
+            # its doing: the parse just stops (see UCParser.p_error)
+            self._syntax_error("Error at the end of input", None)
+
+    def _synchronize(self, e, block, start):
+        """ Panic mode recovery, as by the error productions of
+            UCParser: reports e, records the names the declaration or
+            statement begun at start would have declared, then skips
+            the tokens from the one where e was found to a ';', or past
+            a '{...}' group. The parse goes on from the next type
+            specifier, which starts a declaration, and inside a block
+            from the '}' closing it. Raises e at the end of input.
+        """
+        if not e.reported:
+            self._report(e)
+            self._drop(self.text, self._offset(start), self._offset(e.pos))
+        types = self.types
+        pos = e.pos
+        while True:
+            _type = types[pos]
+            if _type == '$end':
+                raise e
+            if _type in _type_specifiers or (_type == 'RBRACE' and block):
+                break
+            pos += 1
+            if _type == 'SEMI':
+                break
+            elif _type == 'LBRACE':
+                depth = 1
+                while depth > 0:
+                    _type = types[pos]
+                    if _type == '$end':
+                        raise e
+                    pos += 1
+                    if _type == 'LBRACE':
+                        depth += 1
+                    elif _type == 'RBRACE':
+                        depth -= 1
+                break
+        self.pos = pos
+
+    def _expect(self, _type):
+        pos = self.pos
+        if self.types[pos] != _type:
+            raise ParseError(pos)
+        self.pos = pos + 1
+        return pos
+
+    # Declarations
+
+    def _program(self):
+        if self.types[0] == '$end':
+            raise ParseError(0)
+        gdecls = []
+        while self.types[self.pos] != '$end':
+            _start = self.pos
+            try:
+                gdecls.append(self._global_declaration())
+            except ParseError as e:
+                self._synchronize(e, False, _start)
+        return uc_ast.Program(gdecls)
+
+    def _global_declaration(self):
+        if self.types[self.pos] not in _type_specifiers:
+            # Functions without a return type are not supported
+            raise ParseError(self.pos)
+        spec = self._type_specifier()
+        if self.types[self.pos] == 'SEMI':
+            self.pos += 1
+            return uc_ast.GlobalDecl(None)
+        decl = self._declarator()
+        _type = self.types[self.pos]
+        if _type == 'LBRACE' or _type in _type_specifiers:
+            param_decls = self._declaration_list() if _type != 'LBRACE' else None
+            body = self._compound_statement()
+            return self._build_function_definition(spec, decl, param_decls, body)
+        decls = self._init_declarator_list(decl)
+        self._expect('SEMI')
+        return uc_ast.GlobalDecl(self._build_declarations(spec, decls))
+
+    def _type_specifier(self):
+        pos = self.pos
+        if self.types[pos] not in _type_specifiers:
+            raise ParseError(pos)
+        self.pos = pos + 1
+        return uc_ast.Type([self.values[pos]], self._coord(pos))
+
+    def _declaration_list(self):
+        decls = self._declaration()
+        while self.types[self.pos] in _type_specifiers:
+            decls = decls + self._declaration()
+        return decls
+
+    def _declaration(self):
+        """ declaration : type_specifier init_declarator_list_opt SEMI
+            Returns a list of Decl nodes, or None.
+        """
+        spec = self._type_specifier()
+        decls = None
+        if self.types[self.pos] != 'SEMI':
+            decls = self._build_declarations(spec, self._init_declarator_list(self._declarator()))
+        self._expect('SEMI')
+        return decls
+
+    def _init_declarator_list(self, decl):
+        """ The rest of an init_declarator_list whose first declarator
+            was already parsed.
+        """
+        decls = [self._init_declarator(decl)]
+        while self.types[self.pos] == 'COMMA':
+            self.pos += 1
+            decls.append(self._init_declarator(self._declarator()))
+        return decls
+
+    def _init_declarator(self, decl):
+        init = None
+        if self.types[self.pos] == 'EQUALS':
+            self.pos += 1
+            init = self._initializer()
+        return dict(decl=decl, init=init)
+
+    def _initializer(self):
+        if self.types[self.pos] != 'LBRACE':
+            return self._assignment_expression()
+        self.pos += 1
+        try:
+            first = self._initializer()
+            inits = uc_ast.InitList([first], first.pos)
+            while self.types[self.pos] == 'COMMA':
+                self.pos += 1
+                if self.types[self.pos] == 'RBRACE':
+                    break
+                inits.exprs.append(self._initializer())
+            self._expect('RBRACE')
+        except ParseError as e:
+            # Skips to the closing brace, as UCParser.p_initializer_error
+            if not e.reported:
+                self._report(e)
+            pos = e.pos
+            while self.types[pos] != 'RBRACE':
+                if self.types[pos] == '$end':
+                    raise e
+                pos += 1
+            self.pos = pos + 1
+            return SKIPPED_INIT
+        return inits
+
+    def _declarator(self):
+        if self.types[self.pos] != 'TIMES':
+            return self._direct_declarator()
+        # pointer : TIMES | TIMES pointer -- the last star is the
+        # head of the chain, the first one its tail.
+        coords = []
+        while self.types[self.pos] == 'TIMES':
+            coords.append(self._coord(self.pos))
+            self.pos += 1
+        head = tail = uc_ast.PtrDecl([], None, coords.pop())
+        while coords:
+            tail.type = uc_ast.PtrDecl([], None, coords.pop())
+            tail = tail.type
+        return self._type_modify_decl(self._direct_declarator(), head)
+
+    def _direct_declarator(self):
+        types = self.types
+        _type = types[self.pos]
+        if _type == 'ID':
+            # The coordinate of a nonterminal in PLY is (0, 1)
+            decl = uc_ast.VarDecl(self._identifier(), None, pack_coord(0, 1))
+        elif _type == 'LPAREN':
+            self.pos += 1
+            decl = self._declarator()
+            self._expect('RPAREN')
+        else:
+            raise ParseError(self.pos)
+
+        while True:
+            _type = types[self.pos]
+            if _type == 'LBRACKET':
+                self.pos += 1
+                dim = None
+                if types[self.pos] != 'RBRACKET':
+                    dim = self._binary_expression(1)[0]
+                self._expect('RBRACKET')
+                decl = self._type_modify_decl(decl, uc_ast.ArrayDecl(None, dim, decl.pos))
+            elif _type == 'LPAREN':
+                self.pos += 1
+                _type = types[self.pos]
+                if _type in _type_specifiers:
+                    params = self._parameter_list()
+                elif _type == 'ID':
+                    params = self._identifier_list()
+                else:
+                    params = None
+                self._expect('RPAREN')
+                decl = self._type_modify_decl(decl, uc_ast.FuncDecl(params, None, decl.pos))
+            else:
+                return decl
+
+    def _parameter_list(self):
+        first = self._parameter_declaration()
+        params = uc_ast.ParamList([first], first.pos)
+        while self.types[self.pos] == 'COMMA':
+            self.pos += 1
+            params.params.append(self._parameter_declaration())
+        return params
+
+    def _parameter_declaration(self):
+        spec = self._type_specifier()
+        return self._build_declarations(spec, [dict(decl=self._declarator())])[0]
+
+    def _identifier_list(self):
+        first = self._identifier()
+        params = uc_ast.ParamList([first], first.pos)
+        while self.types[self.pos] == 'COMMA':
+            self.pos += 1
+            params.params.append(self._identifier())
+        return params
+
+    def _identifier(self):
+        pos = self._expect('ID')
+        return uc_ast.ID(self.values[pos], self._coord(pos))
+
+    # Statements
+
+    def _compound_statement(self):
+        pos = self._expect('LBRACE')
+        types = self.types
+        items = None
+        while types[self.pos] != 'RBRACE':
+            _start = self.pos
+            try:
+                if types[self.pos] in _type_specifiers:
+                    item = self._declaration()
+                    if not isinstance(item, list):
+                        item = [item]
+                else:
+                    item = [self._statement()]
+            except ParseError as e:
+                self._synchronize(e, True, _start)
+                item = []
+            if items is None:
+                items = item
+            elif item != [None]:
+                items = items + item
+        self.pos += 1
+        return uc_ast.Compound(items, pack_coord(self.lines[pos], 1))
+
+    def _statement(self):
+        _type = self.types[self.pos]
+        if _type == 'LBRACE':
+            return self._compound_statement()
+        method = self._statements.get(_type)
+        if method is not None:
+            return method(self)
+        expr = self._expression_opt('SEMI')
+        pos = self._expect('SEMI')
+        if expr is None:
+            return uc_ast.EmptyStatement(self._coord(pos))
+        return expr
+
+    def _if_statement(self):
+        # An else if chain is parsed in a loop, linking each If to the
+        # iffalse of the previous one, so long chains don't nest calls
+        types = self.types
+        head = tail = None
+        while True:
+            pos = self.pos
+            self.pos += 1
+            self._expect('LPAREN')
+            cond = self._expression()
+            self._expect('RPAREN')
+            node = uc_ast.If(cond, self._statement(), None, self._coord(pos))
+            if tail is None:
+                head = node
+            else:
+                tail.iffalse = node
+            tail = node
+            if types[self.pos] != 'ELSE':
+                return head
+            self.pos += 1
+            if types[self.pos] != 'IF':
+                tail.iffalse = self._statement()
+                return head
+
+    def _while_statement(self):
+        pos = self.pos
+        self.pos += 1
+        self._expect('LPAREN')
+        cond = self._expression()
+        self._expect('RPAREN')
+        return uc_ast.While(cond, self._statement(), self._coord(pos))
+
+    def _for_statement(self):
+        pos = self.pos
+        self.pos += 1
+        self._expect('LPAREN')
+        coord = self._coord(pos)
+        if self.types[self.pos] in _type_specifiers:
+            init = uc_ast.DeclList(self._declaration(), coord)
+        else:
+            init = self._expression_opt('SEMI')
+            self._expect('SEMI')
+        cond = self._expression_opt('SEMI')
+        self._expect('SEMI')
+        _next = self._expression_opt('RPAREN')
+        self._expect('RPAREN')
+        return uc_ast.For(init, cond, _next, self._statement(), coord)
+
+    def _break_statement(self):
+        pos = self.pos
+        self.pos += 1
+        self._expect('SEMI')
+        return uc_ast.Break(self._coord(pos))
+
+    def _return_statement(self):
+        pos = self.pos
+        self.pos += 1
+        expr = self._expression_opt('SEMI')
+        self._expect('SEMI')
+        return uc_ast.Return(expr, self._coord(pos))
+
+    def _assert_statement(self):
+        pos = self.pos
+        self.pos += 1
+        expr = self._expression()
+        self._expect('SEMI')
+        return uc_ast.Assert(expr, self._coord(pos))
+
+    def _print_statement(self):
+        pos = self.pos
+        self.pos += 1
+        self._expect('LPAREN')
+        expr = self._expression_opt('RPAREN')
+        self._expect('RPAREN')
+        self._expect('SEMI')
+        return uc_ast.Print(expr, self._coord(pos))
+
+    def _read_statement(self):
+        pos = self.pos
+        self.pos += 1
+        self._expect('LPAREN')
+        args = self._argument_expression()
+        self._expect('RPAREN')
+        self._expect('SEMI')
+        return uc_ast.Read(args, self._coord(pos))
+
+    _statements = {
+        'IF': _if_statement,
+        'WHILE': _while_statement,
+        'FOR': _for_statement,
+        'BREAK': _break_statement,
+        'RETURN': _return_statement,
+        'ASSERT': _assert_statement,
+        'PRINT': _print_statement,
+        'READ': _read_statement,
+    }
+
+    # Expressions
+
+    def _expression_opt(self, end):
+        if self.types[self.pos] == end:
+            return None
+        return self._expression()
+
+    def _expression(self, left=None):
+        """ Parses an expression, or the rest of one whose leading
+            primary_expression was parsed already, if left is given.
+        """
+        expr = self._assignment_expression(left)
+        while self.types[self.pos] == 'COMMA':
+            self.pos += 1
+            if not isinstance(expr, uc_ast.ExprList):
+                expr = uc_ast.ExprList([expr], expr.pos)
+            expr.exprs.append(self._assignment_expression())
+        return expr
+
+    # argument_expression builds its ExprList exactly like expression
+    _argument_expression = _expression
+
+    def _assignment_expression(self, left=None):
+        expr, unary = self._binary_expression(1, left)
+        _type = self.types[self.pos]
+        if _type not in _assignment_operators:
+            return expr
+        if not unary:
+            # Only a unary_expression may be assigned to
+            raise ParseError(self.pos)
+        op = self.values[self.pos]
+        self.pos += 1
+        return uc_ast.Assignment(op, expr, self._assignment_expression(), expr.pos)
+
+    def _binary_expression(self, min_prec, left=None):
+        """ Parses a binary expression whose operators bind at least as
+            tightly as min_prec, starting from the primary_expression
+            left if given. Returns the node and whether it is a plain
+            unary_expression (no operator, no cast).
+        """
+        if left is None:
+            left, unary = self._cast_expression()
+        else:
+            left, unary = self._postfix_expression(left), True
+        types = self.types
+        while True:
+            prec = _binary_prec.get(types[self.pos])
+            if prec is None or prec < min_prec:
+                return left, unary
+            op = self.values[self.pos]
+            self.pos += 1
+            right = self._binary_expression(prec + 1)[0]
+            left = uc_ast.BinaryOp(op, left, right, left.pos)
+            unary = False
+
+    def _cast_expression(self):
+        pos = self.pos
+        _type = self.types[pos]
+        if _type in _prefix_operators:
+            return self._unary_expression(), True
+        if _type == 'LPAREN' and self.types[pos + 1] in _type_specifiers:
+            self.pos += 1
+            to_type = self._type_specifier()
+            self._expect('RPAREN')
+            return uc_ast.Cast(to_type, self._cast_expression()[0], self._coord(pos)), False
+        return self._postfix_expression(), True
+
+    def _unary_expression(self):
+        # A chain of prefix operators is read in a loop rather than
+        # by recursion, so that its length isn't bound by the stack
+        types = self.types
+        ops = []
+        _type = types[self.pos]
+        while _type in _prefix_operators:
+            ops.append(self.values[self.pos])
+            self.pos += 1
+            _last = _type
+            _type = types[self.pos]
+        if not ops:
+            return self._postfix_expression()
+        if _last == 'PLUSPLUS' or _last == 'MINUSMINUS':
+            expr = self._postfix_expression()
+        else:
+            expr = self._cast_expression()[0]
+        for op in reversed(ops):
+            expr = uc_ast.UnaryOp(op, expr, expr.pos)
+        return expr
+
+    def _postfix_expression(self, expr=None):
+        """ Parses a postfix_expression, or the postfix operators
+            applied to the primary_expression expr if given.
+        """
+        types = self.types
+        if expr is None:
+            # primary_expression
+            pos = self.pos
+            _type = types[pos]
+            if _type == 'ID':
+                self.pos = pos + 1
+                expr = uc_ast.ID(self.values[pos], self.coords[pos])
+            elif _type in _constants:
+                self.pos = pos + 1
+                expr = uc_ast.Constant(_constants[_type], self.values[pos], self.coords[pos])
+            elif _type == 'LPAREN':
+                # Nested parentheses are read in a loop, not by
+                # recursion: the innermost expression is parsed, then
+                # the rest of each enclosing one from it
+                _depth = 1
+                pos += 1
+                while types[pos] == 'LPAREN' and types[pos + 1] not in _type_specifiers:
+                    _depth += 1
+                    pos += 1
+                self.pos = pos
+                expr = self._expression()
+                self._expect('RPAREN')
+                for _ in range(_depth - 1):
+                    expr = self._expression(expr)
+                    self._expect('RPAREN')
+            else:
+                raise ParseError(pos)
+
+        while True:
+            _type = types[self.pos]
+            if _type == 'LBRACKET':
+                self.pos += 1
+                subscript = self._expression()
+                self._expect('RBRACKET')
+                expr = uc_ast.ArrayRef(expr, subscript, expr.pos)
+            elif _type == 'LPAREN':
+                self.pos += 1
+                args = None
+                if types[self.pos] != 'RPAREN':
+                    args = self._argument_expression()
+                self._expect('RPAREN')
+                expr = uc_ast.FuncCall(expr, args, expr.pos)
+            elif _type == 'PLUSPLUS' or _type == 'MINUSMINUS':
+                expr = uc_ast.UnaryOp('p' + self.values[self.pos], expr, expr.pos)
+                self.pos += 1
+            else:
+                return expr
@@ -1,3 +1,9 @@
+import copy
+import gc
+import io
+import pickle
+from bisect import bisect_left
+from multiprocessing import Pipe, Process
 from uc_ast import *
 
 class uCType(object):
@@ -20,6 +26,10 @@ class uCType(object):
     def __repr__(self):
         return "type({})".format(self.typename)
 
+    def __reduce__(self):
+        # Types are singletons, so keep them unique when unpickled
+        return (_lookup_type, (self.typename,))
+
          
 IntType = uCType("int",
                  unary_ops   = {"-", "+", "--", "++", "p--", "p++", "*", "&"},
@@ -68,15 +78,162 @@ VoidType = uCType("void",
                   binary_ops  = {}
                   )
 
+# The type of the expressions whose check failed. It supports no
+# operation, and the expressions using it are not checked again.
+ErrorType = uCType("error")
+
+_types = {_type.typename: _type for _type in (IntType, FloatType, CharType,
+          BoolType, ArrayType, StringType, PtrType, VoidType, ErrorType)}
+
+def _lookup_type(typename):
+    return _types[typename]
+
+class TypeSeq(tuple):
+    '''
+    The names of a type, e.g. (ArrayType, IntType) for an array of
+    int. TypeSeqs are interned by type_seq: two types are the same
+    exactly when their TypeSeqs are the same object, so they are
+    compared with 'is'. They are immutable, so they are shared freely.
+    '''
+    __slots__ = ()
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        # Keep them interned when unpickled
+        return (type_seq, (tuple(self),))
+
+_seqs = {}
+
+def type_seq(names):
+    ''' Returns the interned TypeSeq of a sequence of uCTypes. '''
+    names = tuple(names)
+    seq = _seqs.get(names)
+    if seq is None:
+        seq = _seqs[names] = TypeSeq(names)
+    return seq
+
+def array_of(seq):
+    return type_seq((ArrayType,) + seq)
+
+def ptr_to(seq):
+    return type_seq((PtrType,) + seq)
+
+def elem_of(seq):
+    ''' The type of an element of an array, or of a pointed value. '''
+    return type_seq(seq[1:])
+
+_type_nodes = {}
+
+def type_node(seq):
+    '''
+    Returns the Type node sema decorates expressions of type seq with.
+    There is one per type, shared by all those expressions.
+    '''
+    node = _type_nodes.get(seq)
+    if node is None:
+        node = _type_nodes[seq] = Type(seq)
+    return node
+
+class Diagnostic(object):
+    '''
+    A semantic error found at node, used as the message of the failed
+    assert. It is only built when a check fails, and formatted as
+    "line:col - message" only when it is reported.
+    '''
+    __slots__ = ('node', 'message')
+
+    def __init__(self, node, message):
+        self.node = node
+        self.message = message
+
+    def __str__(self):
+        coord = self.node.coord
+        return f"{coord.line}:{coord.column} - {self.message}"
+
+class TooManyErrors(Exception):
+    '''
+    Raised by the Visitor when it has found as many errors as it was
+    allowed to, to stop the semantic analysis.
+    '''
+    pass
+
+_error_type = type_node(type_seq((ErrorType,)))
+
+def _strides(dims):
+    '''
+    The strides of an array of shape dims, laid out by rows: the
+    product of the dims after each. A stride that depends on a dim
+    not known statically is None.
+    '''
+    strides = []
+    _stride = 1
+    for _dim in reversed(dims):
+        strides.append(_stride)
+        _stride = _stride * _dim if _stride is not None and _dim is not None else None
+    return tuple(reversed(strides))
+
+def _failed(init):
+    ''' Tells if the check of an initializer, or of one of its items, failed. '''
+    if isinstance(init, InitList):
+        return any(_failed(_expr) for _expr in init.exprs)
+    return init.type is _error_type
+
+# Saved in the undo log of a scope for a name that had no binding
+_unbound = object()
+
+class Symbol(object):
+    '''
+    What sema resolved about a declared name: its type names, its
+    storage ('global', 'func', 'proto' for a function only declared
+    so far, 'param' or 'local'), the dims of the arrays in its
+    declaration (its shape) with the stride of each, in elements,
+    and its frame slot, filled in by the code generator.
+    Symbols are kept in side tables, the one of the globals and one
+    per function, at the dense integer ID (sid) of their name, which
+    the IDs bound to it carry as well.
+    '''
+    __slots__ = ('name', 'type', 'storage', 'dims', 'strides', 'slot')
+
+    def __init__(self, name):
+        self.name = name
+        self.type = None
+        self.storage = None
+        self.dims = ()
+        self.strides = ()
+        self.slot = None
+
 class SymbolTable(dict):
     '''
     Class representing a symbol table.  It should provide functionality
     for adding and looking up nodes associated with identifiers.
+
+    While the table is a scope of an Environment, what is stored in it
+    is also bound in the flat name -> binding map of the environment,
+    and saved records what each of its names shadowed, so that popping
+    the scope restores it.
     '''
+    env = None
+
     def __init__(self, decl=None):
         super().__init__()
         self.decl = decl
-        
+        self.saved = {}
+
+    def __setitem__(self, name, value):
+        if self.env is not None:
+            self.env._bind(self, name, value)
+        super().__setitem__(name, value)
+
+    def __getstate__(self):
+        # The environment is not pickled with the table
+        return {'decl': self.decl, 'saved': {}}
+
+    def update(self, *args, **kwargs):
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
     def add(self, name, value):
         self[name] = value
         
@@ -89,12 +246,27 @@ class SymbolTable(dict):
         return None
         
 class Environment(object):
+    '''
+    The stack of scopes seen by sema. bindings maps every name to its
+    innermost binding, so lookup is a single dict access whatever the
+    depth of the scopes, and popping a scope undoes its own bindings.
+    '''
     def __init__(self):
         self.rtypes = []
         self.cur_rtype = []
         self.cur_loop = []
         self.stack = []
+        self.bindings = {}
+        # The side tables of the symbols of the globals, and of the
+        # function being checked
+        self.symbols = []
+        self.frame = None
+        # When a dict, the sid of every global name ever declared, so
+        # a name keeps its sid from one compile to the next (see the
+        # incremental Compiler)
+        self.sids = None
         self.root = SymbolTable()
+        self.root.env = self
         self.stack.append(self.root)
         self.funcdef = None
         self.root.update({
@@ -109,23 +281,57 @@ class Environment(object):
         })
                 
     def push(self, enclosure):
-        self.stack.append(SymbolTable(enclosure))
+        _table = SymbolTable(enclosure)
+        _table.env = self
+        self.stack.append(_table)
         self.rtypes.append(self.cur_rtype)
         if isinstance(enclosure, FuncDecl):
             self.cur_rtype = enclosure.type.type.names  
         else:
-            self.cur_rtype = [VoidType]
+            self.cur_rtype = type_seq((VoidType,))
             
     def pop(self):
-        self.stack.pop()
+        _table = self.stack.pop()
+        _table.env = None
+        bindings = self.bindings
+        for _name, _value in _table.saved.items():
+            if _value is _unbound:
+                del bindings[_name]
+            else:
+                bindings[_name] = _value
+        _table.saved = {}
         self.cur_rtype = self.rtypes.pop()
+
+    def _bind(self, table, name, value):
+        ''' Binds name to value in table, one of the scopes. '''
+        stack = self.stack
+        _level = len(stack) - 1
+        while stack[_level] is not table:
+            _level -= 1
+        for _inner in stack[_level + 1:]:
+            if name in _inner:
+                # Shadowed by an inner scope: the new binding shows up
+                # when that scope is popped
+                if name not in table:
+                    table.saved[name] = _inner.saved[name]
+                _inner.saved[name] = value
+                return
+        if name not in table:
+            table.saved[name] = self.bindings.get(name, _unbound)
+        self.bindings[name] = value
         
     def lookup(self, name):
-        for scope in reversed(self.stack):
-            hit = scope.lookup(name)
-            if hit is not None:
-                return hit
-        return None   
+        return self.bindings.get(name)
+
+    def mark(self):
+        return (len(self.stack), len(self.cur_loop))
+
+    def unwind(self, mark):
+        ''' Pops the scopes and loops opened since mark was taken. '''
+        _depth, _loops = mark
+        while len(self.stack) > _depth:
+            self.pop()
+        del self.cur_loop[_loops:]
 
     def scope_level(self):
         return len(self.stack)-1
@@ -134,6 +340,38 @@ class Environment(object):
         self.peek().add(name.name, name)
         name.kind = kind
         name.scope = self.scope_level()
+        _table = self.symbols if name.scope == 1 else self.frame
+        if name.scope == 1 and self.sids is not None:
+            name.sid = self.sids.setdefault(name.name, len(self.sids))
+            if name.sid < len(_table):
+                _table[name.sid] = Symbol(name.name)
+                return
+        else:
+            name.sid = len(_table)
+        _table.append(Symbol(name.name))
+
+    def redefine(self, name, proto):
+        '''
+        Binds name, the name of a function definition, in place of the
+        name of its prototype, sharing its sid.
+        '''
+        self.peek().add(name.name, name)
+        name.kind = proto.kind
+        name.scope = proto.scope
+        name.sid = proto.sid
+
+    def symbol(self, name):
+        ''' The Symbol of a declared name. '''
+        return (self.symbols if name.scope == 1 else self.frame)[name.sid]
+
+    def adopt(self, names, symbols):
+        '''
+        Adds to the globals copies of the symbols of names, declared
+        by an earlier compile, at the sids they keep (see sids).
+        '''
+        _table = self.symbols
+        for (_name, _symbol) in zip(names, symbols):
+            _table[_name.sid] = copy.copy(_symbol)
 
     def add_root(self, name, value):
         self.root.add(name, value)
@@ -156,8 +394,24 @@ class Visitor(NodeVisitor):
     Program visitor class. This class uses the visitor pattern. You need to define methods
     of the form visit_NodeName() for each kind of AST node that you want to process.
     Note: You will need to adjust the names of the AST nodes if you picked different names.
+
+    The errors found are collected in errors, and the checking goes on
+    after them: an expression whose check fails takes the ErrorType,
+    and a statement that fails is skipped. After max_errors errors
+    (if not 0), TooManyErrors is raised.
     '''
-    def __init__(self):
+    def __init__(self, max_errors=1):
+        self.errors = []
+        self.max_errors = max_errors
+        # When a list, the functions whose bodies are left to
+        # check_parallel are recorded in it
+        self.deferred = None
+        # Set when the tree was rebuilt after syntax errors, and may
+        # hold declarations the parser only partly built
+        self.recovered = False
+        # The names declared by the declarations the parser dropped
+        # after syntax errors: their uses are not reported
+        self.dropped = ()
         self.environment = Environment()
         self.typemap = {
             "int": IntType,
@@ -170,29 +424,88 @@ class Visitor(NodeVisitor):
             "array": ArrayType   
         }
     
+    def error(self, diagnostic):
+        ''' Records a semantic error. '''
+        self.errors.append(diagnostic)
+        if len(self.errors) == self.max_errors:
+            raise TooManyErrors(diagnostic)
+
+    def undefined(self, node, name):
+        ''' Records that name, used at node, is not defined. '''
+        if name not in self.dropped:
+            self.error(Diagnostic(node, f"'{name}' is not defined."))
+
+    def recover(self, e, mark):
+        '''
+        Records the error e of a statement, and closes the scopes and
+        loops the statement left open since mark.
+        '''
+        self.environment.unwind(mark)
+        self.error(e.args[0])
+
+    def check(self, node):
+        ''' Visits a top-level declaration, recording its errors. '''
+        _mark = self.environment.mark()
+        try:
+            self.visit(node)
+        except AssertionError as e:
+            self.recover(e, _mark)
+
     def visit_Program(self, node):
         self.environment.push(node)
         node.symtab = self.environment.peek_root()  
         for _decl in node.gdecls:
-            self.visit(_decl)
+            _mark = self.environment.mark()
+            _errors = len(self.errors)
+            try:
+                yield _decl
+            except AssertionError as e:
+                self.recover(e, _mark)
+            except TooManyErrors:
+                raise
+            except Exception:
+                # A declaration left partial by the syntax errors can't
+                # be checked: it's dropped, with the errors found in it
+                if not self.recovered:
+                    raise
+                self.environment.unwind(_mark)
+                self.environment.funcdef = None
+                del self.errors[_errors:]
         self.environment.pop()
 
     def visit_GlobalDecl(self, node):
-        for _decl in node.decls:
-            self.visit(_decl)
+        # 'int;' declares nothing
+        for _decl in node.decls or ():
+            yield _decl
         
     def visit_FuncDef(self, node):
         node.decls =[]
+        # The sids of the global names the function uses: the edges of
+        # the call graph
+        node.refs = set()
         self.environment.funcdef = node
-        self.visit(node.spec)
-        self.visit(node.decl)
+        yield node.spec
+        _depth = len(self.environment.stack)
+        yield node.decl
+        # Only error recovery builds a definition whose declarator
+        # isn't a function's, which opens no scope
+        assert len(self.environment.stack) > _depth, Diagnostic(node.decl.name, f"'{node.decl.name.name}' is not a function.")
+        node.symbols = self.environment.frame
         if node.param_decls is not None:
             for _par in node.param_decls:
-                self.visit(_par)
+                yield _par
         if node.body is not None:
             for _body in node.body:
-                self.visit(_body)
+                _mark = self.environment.mark()
+                try:
+                    yield _body
+                except AssertionError as e:
+                    self.recover(e, _mark)
+        elif self.deferred is not None:
+            _stack = self.environment.stack
+            self.deferred.append((node, _stack[-1], _stack[-2], len(_stack[-2]), len(self.errors)))
         self.environment.pop()
+        self.environment.funcdef = None
         _func = self.environment.lookup(node.decl.name.name)
         node.spec = _func.type  
 
@@ -201,26 +514,70 @@ class Visitor(NodeVisitor):
         _func = self.environment.lookup(node.type.declname.name)
         _func.kind = 'func'
         _func.bind = node.args
+        # A prototype checks its parameters in a scope of its own,
+        # popped right away, so they get no slot in any frame
+        _funcdef = self.environment.funcdef
+        _prototype = _funcdef is None or _funcdef.decl.type is not node
+        _frame = self.environment.frame
         self.environment.push(node)
+        self.environment.frame = []
         if node.args is not None:
             for _arg in node.args:
-                self.visit(_arg)
+                # Old style parameter names are declared by the
+                # declaration list of the function definition
+                if not isinstance(_arg, ID):
+                    self.visit(_arg)
+                    self.environment.symbol(_arg.name).storage = 'param'
+        if _prototype:
+            self.environment.pop()
+            self.environment.frame = _frame
                 
     def visit_Decl(self, node):
         _type = node.type
-        self.visit(_type)
+        yield _type
         node.name.bind = _type
         _var = node.name.name
-        _line = f"{node.name.coord.line}:{node.name.coord.column} - "
         if isinstance(_type, PtrDecl):
             while isinstance(_type, PtrDecl):
                 _type = _type.type
         if isinstance (_type, FuncDecl):
-            assert self.environment.lookup(_var), _line + f"'{_var}' is not defined."
+            assert self.environment.lookup(_var), Diagnostic(node.name, f"'{_var}' is not defined.")
         else:
-            assert self.environment.find(_var), _line + f"'{_var}' is not defined."
+            assert self.environment.find(_var), Diagnostic(node.name, f"'{_var}' is not defined.")
             if node.init is not None:
-                self.checkInit(_type, node.init, _var, _line)
+                yield node.init
+                if not _failed(node.init):
+                    self.checkInit(_type, node.init, _var, node.name)
+        self.resolve(node)
+
+    def resolve(self, node):
+        '''
+        Fills the Symbol of the name declared by node, once its
+        declaration is checked, so the code generator reads it
+        instead of walking the declaration again.
+        '''
+        _name = node.name
+        _symbol = self.environment.symbol(_name)
+        _type = node.type
+        if _type.__class__ is VarDecl:
+            _symbol.type = _type.type.names
+        else:
+            _dims = []
+            while not isinstance(_type, VarDecl):
+                if isinstance(_type, ArrayDecl):
+                    _dims.append(_type.dim.value if isinstance(_type.dim, Constant) else None)
+                _type = _type.type
+            _symbol.type = _type.type.names
+            _symbol.dims = tuple(_dims)
+            _symbol.strides = _strides(_dims)
+        if isinstance(node.type, FuncDecl):
+            # A prototype, until the function is defined
+            _funcdef = self.environment.funcdef
+            _symbol.storage = 'func' if _funcdef is not None and _funcdef.decl is node else 'proto'
+        elif _name.scope == 1:
+            _symbol.storage = 'global'
+        else:
+            _symbol.storage = 'local'
     
     def visit_ArrayDecl(self, node):
         self.visit(node.type)
@@ -228,69 +585,86 @@ class Visitor(NodeVisitor):
         while not isinstance(_type, VarDecl):
             _type = _type.type
         _id = _type.declname
-        _id.type.names.insert(0, self.typemap["array"])
+        _id.type.names = array_of(_id.type.names)
         if node.dim is not None:
             self.visit(node.dim) 
+        # The strides of the dimensions before depend on this one
+        if isinstance(node.type, ArrayDecl):
+            assert isinstance(node.type.dim, Constant), Diagnostic(_id, f"the dimensions of '{_id.name}' after the first must be constant.")
     
     def visit_ArrayRef(self, node):
         _subs = node.subscript
-        self.visit(_subs)
-        if isinstance(_subs, ID):
-            _line = f"{_subs.coord.line}:{_subs.coord.column} - "
-            assert _subs.scope is not None, _line + f"'{_subs.name}' is not defined."
-        _stype = _subs.type.names[-1]
-        _line = f"{node.coord.line}:{node.coord.column} - "
-        assert _stype == IntType, _line + f"'{_stype}' must be of type(int)."
-        self.visit(node.name)
-        _type = node.name.type.names[1:]
-        node.type = Type(_type, node.coord)
+        yield _subs
+        _ok = _subs.type is not _error_type
+        if _ok:
+            try:
+                if isinstance(_subs, ID):
+                    assert _subs.scope is not None, Diagnostic(_subs, f"'{_subs.name}' is not defined.")
+                _stype = _subs.type.names[-1]
+                assert _stype == IntType, Diagnostic(node, f"'{_stype}' must be of type(int).")
+            except AssertionError as e:
+                self.error(e.args[0])
+                _ok = False
+        yield node.name
+        if _ok and node.name.type is not _error_type:
+            node.type = type_node(elem_of(node.name.type.names))
+        else:
+            node.type = _error_type
  
     def visit_VarDecl(self, node):        
         self.visit(node.type)
         _loc = node.declname
-        self.visit(_loc)
         if isinstance(_loc, ID):
-            _line = f"{_loc.coord.line}:{_loc.coord.column} - "
-            assert not self.environment.find(_loc.name), _line + f"'name {_loc.name} already defined in this scope.'"
-            self.environment.add_local(_loc, 'var')
+            _proto = self.environment.peek().lookup(_loc.name)
+            _funcdef = self.environment.funcdef
+            if (_proto is not None and _funcdef is not None and _funcdef.decl.name is _loc
+                    and self.environment.symbol(_proto).storage == 'proto'):
+                self.environment.redefine(_loc, _proto)
+            else:
+                assert _proto is None, Diagnostic(_loc, f"'name {_loc.name} already defined in this scope.'")
+                self.environment.add_local(_loc, 'var')
             _loc.type = node.type
         
     def visit_ID(self, node):
         _id = self.environment.lookup(node.name)
-        if _id is not None:
-            node.type = _id.type
-            node.kind = _id.kind
-            node.scope = _id.scope
-            node.bind = _id.bind
+        if _id is None:
+            node.type = _error_type
+            self.undefined(node, node.name)
+            return
+        node.type = _id.type
+        node.kind = _id.kind
+        node.scope = _id.scope
+        node.bind = _id.bind
+        node.sid = _id.sid
+        if _id.scope == 1 and self.environment.funcdef is not None:
+            self.environment.funcdef.refs.add(_id.sid)
             
     def visit_Type(self, node):
-        for i, _name in enumerate(node.names or []):
-            if not isinstance(_name, uCType):
-                _type = self.typemap[_name]
-                node.names[i] = _type
+        if node.names.__class__ is not TypeSeq:
+            node.names = type_seq(_name if isinstance(_name, uCType) else self.typemap[_name]
+                                  for _name in node.names or [])
                 
-    def setDim(self, type, length, line, var):
+    def setDim(self, type, length, where, var):
         if type.dim is None:
             type.dim = Constant('int', length)
             self.visit_Constant(type.dim)
         else:
-            assert type.dim.value == length, line + f"incompatible size at '{var}' initialization."     
+            assert type.dim.value == length, Diagnostic(where, f"incompatible size at '{var}' initialization.")     
              
-    def checkInit(self, type, init, var, line):
-        self.visit(init)
+    def checkInit(self, type, init, var, where):
         if isinstance(init, Constant):
             if init.rawtype == 'string':
-                assert type.type.type.names == [self.typemap["array"], self.typemap["char"]], line + f"'{var}' initialization type incompatible."
-                self.setDim(type, len(init.value), line, var)
+                assert type.type.type.names is type_seq((ArrayType, CharType)), Diagnostic(where, f"'{var}' initialization type incompatible.")
+                self.setDim(type, len(init.value), where, var)
             else:
-                assert type.type.names[0] == init.type.names[0], line + f"'{var}' initialization type incompatible."
+                assert type.type.names[0] == init.type.names[0], Diagnostic(where, f"'{var}' initialization type incompatible.")
                 
         elif isinstance(init, InitList):
             _exprs = init.exprs
             _length = len(_exprs)       
             if isinstance(type, VarDecl):  
-                assert _length == 1, line + f"'{var}' initialization must be a single element."
-                assert type.type == _exprs[0].type, line + f"'{var}' initialization type incompatible."     
+                assert _length == 1, Diagnostic(where, f"'{var}' initialization must be a single element.")
+                assert type.type == _exprs[0].type, Diagnostic(where, f"'{var}' initialization type incompatible.")     
             elif isinstance(type, ArrayDecl):
                 _size = _length
                 _head = _exprs
@@ -299,13 +673,13 @@ class Visitor(NodeVisitor):
                     type = type.type
                     _length = len(_exprs[0].exprs)  
                     for i in range(len(_exprs)):
-                        assert len(_exprs[i].exprs) == _length, line + f"list have different sizes."
+                        assert len(_exprs[i].exprs) == _length, Diagnostic(where, f"list have different sizes.")
                     _exprs = _exprs[0].exprs       
                     if isinstance(type, ArrayDecl):
-                        self.setDim(type, _length, line, var) 
+                        self.setDim(type, _length, where, var) 
                         _size += _length 
                     else:
-                        assert _exprs[0].type == type.type.type.names[-1], line + f"'{var}' initialization type incompatible."
+                        assert _exprs[0].type == type.type.type.names[-1], Diagnostic(where, f"'{var}' initialization type incompatible.")
                 type = _decl
                 _exprs = _head
                 _length = _size
@@ -313,76 +687,89 @@ class Visitor(NodeVisitor):
                     type.dim = Constant('int', _size)
                     self.visit_Constant(type.dim) 
                 else:                  
-                 assert type.dim.value == _length, line + f"incompatible size at '{var}' initialization."    
+                 assert type.dim.value == _length, Diagnostic(where, f"incompatible size at '{var}' initialization.")    
                  
         elif isinstance(init, ArrayRef):
             _id = self.environment.lookup(init.name.name)
             if isinstance(init.subscript, Constant):
                 _rtype = _id.type.names[1]
-                assert type.type.names[0] == _rtype, line + f"'{var}' initialization type incompatible."   
+                assert type.type.names[0] == _rtype, Diagnostic(where, f"'{var}' initialization type incompatible.")   
                 
         elif isinstance(init, ID):
             if isinstance(type, ArrayDecl):
                 type2 = type.type
                 while not isinstance(type2, VarDecl):
                     type2 = type2.type 
-                assert type2.type.names == init.type.names, line + f"Initialization type missmatch." 
-                self.setDim(type, init.bind.dim.value, line, var)
+                assert type2.type.names is init.type.names, Diagnostic(where, f"Initialization type missmatch.") 
+                self.setDim(type, init.bind.dim.value, where, var)
             else:
-                assert type.type.names[-1] == init.type.names[-1], line + f"Initialization type missmatch." 
+                assert type.type.names[-1] == init.type.names[-1], Diagnostic(where, f"Initialization type missmatch.") 
                  
     def visit_Constant(self, node):
         if not isinstance(node.type, uCType):
             _type = self.typemap[node.rawtype]
-            node.type = Type([_type], node.coord)
+            node.type = type_node(type_seq((_type,)))
             if _type.typename == 'int':
                 node.value = int(node.value)
             elif _type.typename == 'float':
                 node.value = float(node.value)        
      
     def visit_Assignment(self, node): 
-        _line = f"{node.coord.line}:{node.coord.column} - "
-        self.visit(node.rvalue)
+        yield node.rvalue
         rtype = node.rvalue.type.names
         _var = node.lvalue
-        self.visit(_var)
+        yield _var
+        if _var.type is _error_type or rtype is _error_type.names:
+            return
         if isinstance(_var, ID):
-            assert _var.scope is not None, _line + f"'{_var.name}' is not defined."
+            assert _var.scope is not None, Diagnostic(node, f"'{_var.name}' is not defined.")
         ltype = node.lvalue.type.names
-        assert ltype == rtype, _line + f"cannot assign '{rtype[0]}' to '{ltype[0]}'."
-        assert node.op in ltype[-1].assign_ops, _line + f"operator {node.op} not supported by '{ltype[-1]}'."
+        assert ltype is rtype, Diagnostic(node, f"cannot assign '{rtype[0]}' to '{ltype[0]}'.")
+        assert node.op in ltype[-1].assign_ops, Diagnostic(node, f"operator {node.op} not supported by '{ltype[-1]}'.")
             
     def visit_BinaryOp(self, node):
-        self.visit(node.left)
+        yield node.left
         ltype = node.left.type.names[-1]
-        self.visit(node.right)
+        yield node.right
         rtype = node.right.type.names[-1]
-        _line = f"{node.coord.line}:{node.coord.column} - "
-        assert ltype == rtype, _line + f"binary operator does not have matching '{ltype}'/'{rtype}'."
-        if node.op in ltype.binary_ops:
-            node.type = Type([ltype], node.coord)
-        elif node.op in ltype.rel_ops:
-            node.type = Type([self.typemap["bool"]], node.coord)
-        else:
-            assert False, _line + f"Binary operator '{node.op}' not supported by '{ltype}'."
+        if ltype is ErrorType or rtype is ErrorType:
+            node.type = _error_type
+            return
+        try:
+            assert ltype == rtype, Diagnostic(node, f"binary operator does not have matching '{ltype}'/'{rtype}'.")
+            if node.op in ltype.binary_ops:
+                node.type = type_node(type_seq((ltype,)))
+            elif node.op in ltype.rel_ops:
+                node.type = type_node(type_seq((BoolType,)))
+            else:
+                assert False, Diagnostic(node, f"Binary operator '{node.op}' not supported by '{ltype}'.")
+        except AssertionError as e:
+            node.type = _error_type
+            self.error(e.args[0])
             
     def visit_Break(self, node):
-        _line = f"{npde.coord.line}:{node.coord.column} - "
-        assert self.environment.cur_loop != [], _line + "Break statement must be inside a loop block."
+        assert self.environment.cur_loop != [], Diagnostic(node, "Break statement must be inside a loop block.")
         node.bind = self. environment.cur_loop[-1]
      
     def visit_Cast(self, node):
-        self.visit(node.expr)
-        self.visit(node.to_type)
-        node.type = Type(node.to_type.names, node.coord)
+        yield node.expr
+        yield node.to_type
+        if node.expr.type is _error_type:
+            node.type = _error_type
+        else:
+            node.type = type_node(node.to_type.names)
        
     def visit_Compound(self, node):
         for item in node.block_items:
-            self.visit(item)
+            _mark = self.environment.mark()
+            try:
+                yield item
+            except AssertionError as e:
+                self.recover(e, _mark)
     
     def visit_DeclList(self, node):
         for decl in  node.decls:
-            self.visit(decl)
+            yield decl
             self.environment.funcdef.decls.append(decl)
             
     def visit_EmptyStatement(self, node):
@@ -392,44 +779,58 @@ class Visitor(NodeVisitor):
         if isinstance(node.init, DeclList):
             self.environment.push(node)
         self.environment.cur_loop.append(node)
-        self.visit(node.init)
-        self.visit(node.cond)
-        self.visit(node.next)
-        self.visit(node.stmt)
+        yield node.init
+        yield node.cond
+        yield node.next
+        yield node.stmt
         self.environment.cur_loop.pop()
         if isinstance(node.init, DeclList):
             self.environment.pop()
         
     def visit_FuncCall(self, node):
-        _line = f"{node.coord.line}:{node.coord.column} - "
         _label = self.environment.lookup(node.name.name)
-        assert _label.kind == "func", _line + f"'{_label.name}' is not a function."
-        node.type = _label.type
-        node.name.type = _label.type
-        node.name.bind = _label.bind
-        node.name.kind = _label.kind
-        node.name.scope = _label.scope
-        if node.args is not None:
-            _sig = _label.bind
-            if isinstance(node.args, ExprList):
-                assert len(_sig.args.params) == len(node.args.exprs), _line + f"no. arguments to call '{_label.name}' function incompatible."
-                for (_arg, _fpar) in zip(node.args.exprs, _sig.args.params):
-                    self.visit(_arg)     
-                    _line = f"{node.coord.line}:{node.coord.column} - "
-                    if isinstance(_arg, ID):
-                        assert self.environment.find(_arg.name), _line + f"'{_arg.name}' is not defined."
-                    assert _arg.type.names == _fpar.type.type.names, _line+ f"type mismatch with param '{_fpar.type.declname.name}'." 
-            else:
-                self.visit(node.args)
-                assert len(_sig.args.params) == 1, _line + f"no. arguments to call '{_label.name}' function mismatch."
-                _type = _sig.args.params[0].type
-                while not isinstance(_type, VarDecl):
-                    _type = _type.type
-                assert node.args.type.names == _type.type.names, _line + f"type mismath with param '{_sig.args.params[0].name.name}'."
+        if _label is None:
+            node.type = node.name.type = _error_type
+            self.undefined(node.name, node.name.name)
+            if node.args is not None:
+                yield node.args
+            return
+        try:
+            assert _label.kind == "func", Diagnostic(node, f"'{_label.name}' is not a function.")
+            node.type = _label.type
+            node.name.type = _label.type
+            node.name.bind = _label.bind
+            node.name.kind = _label.kind
+            node.name.scope = _label.scope
+            node.name.sid = _label.sid
+            if _label.scope == 1 and self.environment.funcdef is not None:
+                self.environment.funcdef.refs.add(_label.sid)
+            if node.args is not None:
+                _sig = _label.bind
+                if isinstance(node.args, ExprList):
+                    assert len(_sig.args.params) == len(node.args.exprs), Diagnostic(node, f"no. arguments to call '{_label.name}' function incompatible.")
+                    for (_arg, _fpar) in zip(node.args.exprs, _sig.args.params):
+                        yield _arg
+                        if _arg.type is _error_type:
+                            continue
+                        if isinstance(_arg, ID):
+                            assert self.environment.find(_arg.name), Diagnostic(node, f"'{_arg.name}' is not defined.")
+                        assert _arg.type.names is _fpar.type.type.names, Diagnostic(node, f"type mismatch with param '{_fpar.type.declname.name}'.") 
+                else:
+                    yield node.args
+                    assert len(_sig.args.params) == 1, Diagnostic(node, f"no. arguments to call '{_label.name}' function mismatch.")
+                    _type = _sig.args.params[0].type
+                    while not isinstance(_type, VarDecl):
+                        _type = _type.type
+                    if node.args.type is not _error_type:
+                        assert node.args.type.names is _type.type.names, Diagnostic(node, f"type mismath with param '{_sig.args.params[0].name.name}'.")
+        except AssertionError as e:
+            node.type = _error_type
+            self.error(e.args[0])
          
     def visit_InitList(self, node):
         for expr in node.exprs:
-            self.visit(expr)
+            yield expr
       
     def visit_ParamList(self, node):
         for _par in node.params:
@@ -440,25 +841,26 @@ class Visitor(NodeVisitor):
         _type = node.type
         while not isinstance(_type, VarDecl):
             _type = _type.type
-        _type.type.names.insert(0, self.typemap["ptr"])
+        _type.type.names = ptr_to(_type.type.names)
        
     def visit_Return(self, node):   
         if node.expr is not None:
-            self.visit(node.expr)
+            yield node.expr
+            if node.expr.type is _error_type:
+                return
             _type = node.expr.type.names
         else:
-            _type = [self.typemap['void']]
+            _type = type_seq((VoidType,))
         _rtype = self.environment.cur_rtype
-        _line = f"{node.coord.line}:{node.coord.column} - "
-        assert _type == _rtype, _line + f"return '{_type[0]}' is incompatible with '{_rtype[0]}' function definition."      
+        assert _type is _rtype, Diagnostic(node, f"return '{_type[0]}' is incompatible with '{_rtype[0]}' function definition.")      
             
     def visit_Print(self, node):
         if node.expr is not None:
-            self.visit(node.expr)
+            yield node.expr
              
     def visit_Read(self, node):
         for _loc in node.names:
-            self.visit(_loc)
+            yield _loc
             if isinstance(_loc, ID) or isinstance(_loc, ArrayRef):
                 self._checkLocation(_loc)
             elif isinstance(_loc, ExprList):
@@ -466,67 +868,295 @@ class Visitor(NodeVisitor):
                     if isinstance(_var, ID) or isinstance(_var, ArrayRef):
                         self._checkLocation(_var)  
                     else:
-                        _line = f"{_var.coord.line}:{_var.coord.column} - "
-                        assert False, _line + f"'{_var}' is not variable."
+                        assert False, Diagnostic(_var, f"'{_var}' is not variable.")
             else:
-                 _line = f"{_loc.coord.line}:{_loc.coord.column} - "
-                 assert False, _line + f"'{_loc}' is not variable."
+                 assert False, Diagnostic(_loc, f"'{_loc}' is not variable.")
     
     def _checkLocation(self, var):
-        _line = f"{var.coord.line}:{var.coord.column} - "
+        if var.type is _error_type:
+            return
         _test = (isinstance(var, ArrayRef) and len(var.type.names) == 1)
         _test = _test or isinstance(var, ID)
         _name = var.name
         if isinstance(_name, ArrayRef):
             _name = _name.name.name + "[" + _name.subscript.name + "][" + var.subscript.name +"]"
-        elif hasattr(var, 'subscript'):
+        elif isinstance(var, ArrayRef):
             _name = _name.name + "[" + var.subscript.name + "]"            
-       # assert _test, _line + f"{_name} is not simple variable."
+       # assert _test, Diagnostic(var, f"{_name} is not simple variable.")
         if isinstance(var, ID):
-            assert var.scope is not None, _line + f"type of '{_name}' is not defined."           
-        #assert len(var.type.names) == 1, _line + f"type of {_name} is not primitive type."
+            assert var.scope is not None, Diagnostic(var, f"type of '{_name}' is not defined.")           
+        #assert len(var.type.names) == 1, Diagnostic(var, f"type of {_name} is not primitive type.")
                   
     def visit_ExprList(self, node):
         for _expr in node.exprs:
-            self.visit(_expr)
-            if isinstance(_expr, ID):
-               _line = f"{_expr.coord.line}:{_expr.coord.column} - "
-               assert _expr.scope is not None, _line + "f{_expr.name} is not defined."
+            yield _expr
+            if _expr.type is _error_type:
+                node.type = _error_type
+            elif isinstance(_expr, ID):
+               assert _expr.scope is not None, Diagnostic(_expr, f"'{_expr.name}' is not defined.")
                
     def visit_UnaryOp(self, node):
-        self.visit(node.expr)
+        yield node.expr
         unaryType = node.expr.type.names[-1]
-        _line = f"{node.coord.line}:{node.coord.column} - "
-        assert node.op in unaryType.unary_ops, _line + f"unary operator {node.op} not supported."
-        node.type = Type(list(node.expr.type.names), node.coord)
+        if node.op not in unaryType.unary_ops:
+            node.type = _error_type
+            if unaryType is not ErrorType:
+                self.error(Diagnostic(node, f"unary operator {node.op} not supported."))
+            return
+        _names = node.expr.type.names
         if node.op == "*":
-            node.type.names.pop(0)
+            _names = elem_of(_names)
         elif node.op == "&":
-            node.type.names.insert(0, self.typemap["ptr"])
+            _names = ptr_to(_names)
+        node.type = type_node(_names)
        
     def visit_While(self, node):
-        self.visit(node.cond)
+        yield node.cond
         _ctype = node.cond.type.names[0]
-        _line = f"{node.coord.line}:{node.coord.column} - "
-        assert _ctype == BoolType, _line + f"conditional expression has '{_ctype}', not boolean type."
+        if _ctype != BoolType and _ctype is not ErrorType:
+            self.error(Diagnostic(node, f"conditional expression has '{_ctype}', not boolean type."))
+        self.environment.cur_loop.append(node)
         if node.stmt is not None:
-            self.visit(node.stmt)
+            yield node.stmt
+        self.environment.cur_loop.pop()
         
     def visit_Assert(self, node):
         _expr = node.expr
-        self.visit(_expr)
-        if hasattr(_expr, "type"):
-            assert _expr.type.names[0] == self.typemap["bool"], f"{_expr.coord.line}:{_expr.coord.column} - expression must be boolean type."
+        yield _expr
+        if _expr.type is _error_type:
+            return
+        if _expr.type is not None:
+            assert _expr.type.names[0] == self.typemap["bool"], Diagnostic(_expr, "expression must be boolean type.")
         else:
-            assert False, f"{_expr.coord.line}:{_expr.coord.column} - expression must be boolean."
+            assert False, Diagnostic(_expr, "expression must be boolean.")
     
     def visit_If(self, node):
-        self.visit(node.cond)
-        _line = f"{node.cond.coord.line}:{node.cond.coord.column} - "   
-        if hasattr(node.cond, 'type'):
-            assert node.cond.type.names[0] == self.typemap["bool"], _line + "The condition expression must be of the boolean type."        
-        else:
-            assert False, _line + "The condition expression must be of the boolean type."      
-        self.visit(node.iftrue)
+        yield node.cond
+        _ctype = node.cond.type
+        if _ctype is None or (_ctype is not _error_type and _ctype.names[0] != self.typemap["bool"]):
+            self.error(Diagnostic(node.cond, "The condition expression must be of the boolean type."))
+        yield node.iftrue
         if node.iffalse is not None:
-            self.visit(node.iffalse)
+            yield node.iffalse
+
+# Parallel checking
+#
+# check_parallel parses a source in worker processes, and has the
+# workers check the function bodies as well, so that the bodies
+# cross the process boundary only once.
+# It works in two phases: the workers send back what they parsed
+# with the function bodies left out, the global declarations and
+# the function signatures are checked here, and every worker gets
+# a snapshot of the global symbols its units refer to, to check the
+# bodies it kept. The checked bodies come back with their references
+# to the snapshot (the types and bindings of the global symbols and
+# of the parameters) pickled as persistent ids, and so point to the
+# objects here.
+
+def _outside(symbols, functions):
+    '''
+    The objects checked bodies may refer to out of themselves: the
+    types and bindings of the global symbols and of the parameters
+    of the functions, as listed in a snapshot.
+    '''
+    objs = []
+    for (_name, _sym) in symbols:
+        objs += (_sym.type, _sym.bind)
+    for _func in functions:
+        if _func is not None:
+            for _sym in _func[1].values():
+                objs += (_sym.type, _sym.bind)
+    return objs
+
+class _BodyPickler(pickle.Pickler):
+    ''' Pickles the objects of outside by their index. '''
+    def __init__(self, buf, outside):
+        super().__init__(buf, pickle.HIGHEST_PROTOCOL)
+        self.index = {id(_obj): _i for _i, _obj in enumerate(outside) if _obj is not None}
+
+    def persistent_id(self, obj):
+        return self.index.get(id(obj))
+
+class _BodyUnpickler(pickle.Unpickler):
+    ''' Loads what _BodyPickler pickled, against our own outside. '''
+    def __init__(self, buf, outside):
+        super().__init__(buf)
+        self.outside = outside
+
+    def persistent_load(self, pid):
+        return self.outside[pid]
+
+def _check_bodies(snapshot, bodies):
+    ''' Checks the bodies of the functions of a worker. '''
+    max_errors, symbols, functions = snapshot
+    sema = Visitor(max_errors)
+    env = sema.environment
+    env.push(None)
+    _globals = env.peek()
+    _seen = 0
+    results = []
+    try:
+        for (_func, _body) in zip(functions, bodies):
+            if _func is None:
+                # Its signature didn't check
+                results.append(None)
+                continue
+            node, scope, visible = _func
+            _globals.update(symbols[_seen:visible])
+            _seen = visible
+            _start = len(sema.errors)
+            env.push(scope.decl)
+            env.peek().update(scope)
+            env.funcdef = node
+            env.frame = node.symbols
+            try:
+                for _item in _body:
+                    sema.check(_item)
+            finally:
+                env.pop()
+                results.append((_body, node.decls, node.symbols, node.refs, sema.errors[_start:]))
+    except TooManyErrors:
+        pass
+    buf = io.BytesIO()
+    _BodyPickler(buf, _outside(symbols, functions)).dump(results)
+    return buf.getvalue()
+
+def _check_worker(conn, parser_class, fast_lexer, chunks):
+    '''
+    Parses chunks, sends back their declarations without the function
+    bodies, and then checks the bodies against the snapshot it gets.
+    '''
+    try:
+        parser = parser_class(fast_lexer)
+        parsed = []
+        bodies = []
+        for (text, lineno, column, _names) in chunks:
+            ast = parser.parse_unit(text, lineno, column)
+            _gdecls = ast.gdecls if ast is not None else None
+            for _decl in _gdecls or ():
+                if isinstance(_decl, FuncDef):
+                    bodies.append(_decl.body)
+                    _decl.body = None
+            parsed.append((_gdecls, parser.errors))
+        conn.send(parsed)
+        snapshot = conn.recv()
+        if snapshot is not None:
+            conn.send(_check_bodies(snapshot, bodies))
+    except BaseException as e:
+        conn.send(e)
+    finally:
+        conn.close()
+
+def _receive(conn):
+    msg = conn.recv()
+    if isinstance(msg, BaseException):
+        raise msg
+    return msg
+
+def check_parallel(parser, text, jobs, max_errors=1):
+    '''
+    Parses text in up to jobs worker processes, which also check the
+    bodies of the functions. Returns the Program (None if the parse
+    failed) and the Visitor holding the semantic errors. Sources
+    split_chunks doesn't split are only parsed, and the
+    Visitor returned is None. So are sources with syntax errors, which
+    are parsed again sequentially: the tree is then checked as it is
+    when parsed with one job, and the errors are the same.
+    '''
+    chunks = parser.split_chunks(text, jobs)
+    if chunks is None:
+        return parser.parse(text), None
+
+    # Chunk i goes to worker i % jobs, which keeps its function
+    # bodies for the second phase.
+    groups = [chunks[_w::jobs] for _w in range(min(jobs, len(chunks)))]
+    workers = []
+    _gc = gc.isenabled()
+    gc.disable()
+    try:
+        for _group in groups:
+            _conn, _child = Pipe()
+            _proc = Process(target=_check_worker,
+                            args=(_child, type(parser), parser.fast_lexer, _group))
+            _proc.start()
+            _child.close()
+            workers.append((_proc, _conn))
+        parsed = [_receive(_conn) for (_proc, _conn) in workers]
+
+        parser.errors = []
+        gdecls = []
+        funcs = [[] for _ in workers]
+        failed = False
+        for _i in range(len(chunks)):
+            _gdecls, _errors = parsed[_i % len(workers)][_i // len(workers)]
+            parser.errors.extend(_errors)
+            if _gdecls is None:
+                failed = True
+                continue
+            gdecls.extend(_gdecls)
+            funcs[_i % len(workers)].extend(_decl for _decl in _gdecls if isinstance(_decl, FuncDef))
+        if failed or parser.errors:
+            for (_proc, _conn) in workers:
+                _conn.send(None)
+            return parser.parse(text), None
+
+        # The global declarations and the signatures, with no cap on
+        # the errors: it's applied once the errors are merged.
+        ast = Program(gdecls)
+        sema = Visitor(0)
+        sema.deferred = []
+        sema.visit(ast)
+        _deferred = {id(_d[0]): _d for _d in sema.deferred}
+
+        # Every worker only gets the global symbols named in its
+        # chunks, each function seeing the ones declared before it.
+        _items = list(sema.deferred[0][2].items()) if sema.deferred else []
+        outsides = []
+        for (_proc, _conn), _funcs, _group in zip(workers, funcs, groups):
+            _records = [_deferred.get(id(_func)) for _func in _funcs]
+            if any(_r is not None for _r in _records):
+                _names = set().union(*(_chunk[3] for _chunk in _group))
+                _kept = [_i for _i, (_name, _sym) in enumerate(_items) if _name in _names]
+                symbols = [_items[_i] for _i in _kept]
+                functions = [(_r[0], _r[1], bisect_left(_kept, _r[3])) if _r is not None else None
+                             for _r in _records]
+                _conn.send((max_errors, symbols, functions))
+                outside = _outside(symbols, functions)
+            else:
+                outside = None
+                _conn.send(None)
+            outsides.append(outside)
+
+        _body_errors = {}
+        for (_proc, _conn), _funcs, outside in zip(workers, funcs, outsides):
+            if outside is None:
+                continue
+            results = _BodyUnpickler(io.BytesIO(_receive(_conn)), outside).load()
+            for (_func, _result) in zip(_funcs, results):
+                if _result is not None:
+                    _func.body, _func.decls, _func.symbols, _func.refs, _body_errors[id(_func)] = _result
+        for (_proc, _conn) in workers:
+            _proc.join()
+    finally:
+        for (_proc, _conn) in workers:
+            if _proc.is_alive():
+                _proc.terminate()
+                _proc.join()
+            _conn.close()
+        if _gc:
+            gc.enable()
+
+    # The errors of every body go after the ones found up to the
+    # signature of its function, as when checking sequentially
+    errors = []
+    _next = 0
+    for (_func, _scope, _globals, _visible, _at) in sema.deferred:
+        errors.extend(sema.errors[_next:_at])
+        errors.extend(_body_errors.get(id(_func), ()))
+        _next = _at
+    errors.extend(sema.errors[_next:])
+    if max_errors:
+        del errors[max_errors:]
+    sema.errors = errors
+    sema.deferred = None
+    return ast, sema